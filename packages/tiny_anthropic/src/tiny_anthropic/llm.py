@@ -26,6 +26,7 @@ from tinygent.core.telemetry.otel import set_tiny_attribute
 from tinygent.core.telemetry.utils import set_llm_telemetry_attributes
 from tinygent.core.types.io.llm_io_chunks import TinyLLMResultChunk
 from tinygent.core.types.io.llm_io_input import TinyLLMInput
+from tinygent.core.types.io.llm_io_result import report_token_usage
 from tinygent.llms.utils import StringIO
 from tinygent.llms.utils import accumulate_llm_chunks
 from tinygent.llms.utils import group_chunks_for_telemetry
@@ -215,6 +216,9 @@ class ClaudeLLM(AbstractLLM[ClaudeLLMConfig]):
                 async for text in stream.text_stream:
                     yield anthropic_chunk_to_tiny_chunk(text)
 
+                final_message = await stream.get_final_message()
+                report_token_usage(final_message.usage.model_dump())
+
         accumulated_chunks: list[TinyLLMResultChunk] = []
         try:
             async for acc_chunk in accumulate_llm_chunks(tiny_chunks()):
@@ -237,6 +241,7 @@ class ClaudeLLM(AbstractLLM[ClaudeLLMConfig]):
         res = self.__get_sync_client().beta.messages.parse(**kwargs)
         if not (p := res.parsed_output):
             raise ValueError('Parsed response is None.')
+        report_token_usage(res.usage.model_dump())
 
         set_llm_telemetry_attributes(
             self.config,
@@ -257,6 +262,7 @@ class ClaudeLLM(AbstractLLM[ClaudeLLMConfig]):
         res = await self.__get_async_client().beta.messages.parse(**kwargs)
         if not (p := res.parsed_output):
             raise ValueError('Parsed response is None.')
+        report_token_usage(res.usage.model_dump())
 
         set_llm_telemetry_attributes(
             self.config,
@@ -317,6 +323,7 @@ class ClaudeLLM(AbstractLLM[ClaudeLLMConfig]):
                     )  # here is yielding only TextBlock chunks (strings)
 
                 final_message = await stream.get_final_message()
+                report_token_usage(final_message.usage.model_dump())
                 tiny_final_message = anthropic_result_to_tiny_result(final_message)
 
                 for generation in tiny_final_message.tiny_iter():
@@ -29,6 +29,7 @@ from tinygent.core.telemetry.decorators import tiny_trace
 from tinygent.core.telemetry.otel import set_tiny_attribute
 from tinygent.core.telemetry.utils import set_llm_telemetry_attributes
 from tinygent.core.types.io.llm_io_chunks import TinyLLMResultChunk
+from tinygent.core.types.io.llm_io_result import report_token_usage
 from tinygent.llms.utils import accumulate_llm_chunks
 from tinygent.llms.utils import group_chunks_for_telemetry
 
@@ -210,6 +211,9 @@ class GeminiLLM(AbstractLLM[GeminiLLMConfig]):
 
         async def raw_chunks() -> AsyncIterator[TinyLLMResultChunk]:
             async for chunk in res:
+                # every chunk carries the usage so far, the last one of the whole call
+                if chunk.usage_metadata is not None:
+                    report_token_usage(chunk.usage_metadata.model_dump())
                 for tiny_chunk in gemini_chunk_to_tiny_chunks(chunk):
                     yield tiny_chunk
 
@@ -241,6 +245,9 @@ class GeminiLLM(AbstractLLM[GeminiLLMConfig]):
             history=params['history'],
         )
         res = chat.send_message(params['message'])  # type: ignore
+        report_token_usage(
+            res.usage_metadata.model_dump() if res.usage_metadata else None
+        )
         tiny_result = gemini_response_to_tiny_result(res)
         for message in tiny_result.tiny_iter():
             if content := getattr(message, 'content', None):
@@ -275,6 +282,9 @@ class GeminiLLM(AbstractLLM[GeminiLLMConfig]):
             history=params['history'],
         )
         res = await chat.send_message(params['message'])  # type: ignore
+        report_token_usage(
+            res.usage_metadata.model_dump() if res.usage_metadata else None
+        )
         tiny_result = gemini_response_to_tiny_result(res)
         for message in tiny_result.tiny_iter():
             if content := getattr(message, 'content', None):
@@ -367,6 +377,9 @@ class GeminiLLM(AbstractLLM[GeminiLLMConfig]):
 
         async def raw_chunks() -> AsyncIterator[TinyLLMResultChunk]:
             async for chunk in res:
+                # every chunk carries the usage so far, the last one of the whole call
+                if chunk.usage_metadata is not None:
+                    report_token_usage(chunk.usage_metadata.model_dump())
                 for tiny_chunk in gemini_chunk_to_tiny_chunks(chunk):
                     yield tiny_chunk
 
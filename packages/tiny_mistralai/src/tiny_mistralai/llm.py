@@ -30,6 +30,7 @@ from tinygent.core.telemetry.decorators import tiny_trace
 from tinygent.core.telemetry.otel import set_tiny_attribute
 from tinygent.core.telemetry.utils import set_llm_telemetry_attributes
 from tinygent.core.types.io.llm_io_chunks import TinyLLMResultChunk
+from tinygent.core.types.io.llm_io_result import report_token_usage
 from tinygent.llms.utils import accumulate_llm_chunks
 from tinygent.llms.utils import group_chunks_for_telemetry
 
@@ -229,6 +230,9 @@ class MistralAILLM(AbstractLLM[MistralAILLMConfig]):
 
         async def raw_chunks() -> AsyncIterator[TinyLLMResultChunk]:
             async for chunk in res:
+                # the last chunk carries the usage of the whole call
+                if chunk.data.usage is not None:
+                    report_token_usage(chunk.data.usage.model_dump())
                 for tiny_chunk in mistralai_chunk_to_tiny_chunks(chunk.data):
                     yield tiny_chunk
 
@@ -262,6 +266,7 @@ class MistralAILLM(AbstractLLM[MistralAILLMConfig]):
             raise ValueError('No message in MistralAI response.')
 
         parsed = output_schema.model_validate(json.loads(str(message.content) or '{}'))
+        report_token_usage(res.usage.model_dump() if res.usage else None)
         set_llm_telemetry_attributes(
             self.config,
             llm_input.messages,
@@ -289,6 +294,7 @@ class MistralAILLM(AbstractLLM[MistralAILLMConfig]):
             raise ValueError('No message in MistralAI response.')
 
         parsed = output_schema.model_validate(json.loads(str(message.content) or '{}'))
+        report_token_usage(res.usage.model_dump() if res.usage else None)
         set_llm_telemetry_attributes(
             self.config,
             llm_input.messages,
@@ -363,6 +369,9 @@ class MistralAILLM(AbstractLLM[MistralAILLMConfig]):
 
         async def raw_chunks() -> AsyncIterator[TinyLLMResultChunk]:
             async for chunk in res:
+                # the last chunk carries the usage of the whole call
+                if chunk.data.usage is not None:
+                    report_token_usage(chunk.data.usage.model_dump())
                 for tiny_chunk in mistralai_chunk_to_tiny_chunks(chunk.data):
                     yield tiny_chunk
 
@@ -27,6 +27,7 @@ from tinygent.core.telemetry.decorators import tiny_trace
 from tinygent.core.telemetry.otel import set_tiny_attribute
 from tinygent.core.telemetry.utils import set_llm_telemetry_attributes
 from tinygent.core.types.io.llm_io_chunks import TinyLLMResultChunk
+from tinygent.core.types.io.llm_io_result import report_token_usage
 from tinygent.llms.utils import accumulate_llm_chunks
 from tinygent.llms.utils import group_chunks_for_telemetry
 
@@ -230,13 +231,18 @@ class OpenAILLM(AbstractLLM[OpenAILLMConfig]):
 
         async with self.__get_async_client().chat.completions.stream(
             messages=messages,
+            stream_options={'include_usage': True},
             **self._request_args(),
         ) as stream:
 
             async def tiny_chunks() -> AsyncIterator[TinyLLMResultChunk]:
                 async for event in stream:
                     if isinstance(event, ChunkEvent):
-                        yield openai_chunk_to_tiny_chunk(event.chunk)
+                        # the last chunk only carries the usage, without choices
+                        if event.chunk.usage is not None:
+                            report_token_usage(event.chunk.usage.model_dump())
+                        if event.chunk.choices:
+                            yield openai_chunk_to_tiny_chunk(event.chunk)
 
             accumulated_chunks: list[TinyLLMResultChunk] = []
             try:
@@ -265,6 +271,7 @@ class OpenAILLM(AbstractLLM[OpenAILLMConfig]):
             raise ValueError('No message returned from OpenAI.')
 
         assert message.parsed is not None, 'Parsed response is None.'
+        report_token_usage(res.usage.model_dump() if res.usage else None)
 
         set_llm_telemetry_attributes(
             self.config,
@@ -288,6 +295,7 @@ class OpenAILLM(AbstractLLM[OpenAILLMConfig]):
             raise ValueError('No message returned from OpenAI.')
 
         assert message.parsed is not None, 'Parsed response is None.'
+        report_token_usage(res.usage.model_dump() if res.usage else None)
 
         set_llm_telemetry_attributes(
             self.config,
@@ -349,13 +357,18 @@ class OpenAILLM(AbstractLLM[OpenAILLMConfig]):
             messages=messages,
             tools=functions,
             tool_choice='auto',
+            stream_options={'include_usage': True},
             **self._request_args(),
         ) as stream:
 
             async def tiny_chunks() -> AsyncIterator[TinyLLMResultChunk]:
                 async for event in stream:
                     if isinstance(event, ChunkEvent):
-                        yield openai_chunk_to_tiny_chunk(event.chunk)
+                        # the last chunk only carries the usage, without choices
+                        if event.chunk.usage is not None:
+                            report_token_usage(event.chunk.usage.model_dump())
+                        if event.chunk.choices:
+                            yield openai_chunk_to_tiny_chunk(event.chunk)
 
             accumulated_chunks: list[TinyLLMResultChunk] = []
             try:
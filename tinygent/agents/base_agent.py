@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import asyncio
 from collections.abc import AsyncGenerator
 from collections.abc import AsyncIterator
+from contextvars import ContextVar
 from io import StringIO
+import json
 import logging
 import textwrap
+import time
 import typing
 from typing import Any
 from typing import Awaitable
@@ -12,6 +16,7 @@ from typing import Callable
 from typing import Generic
 from typing import Sequence
 from typing import TypeVar
+import weakref
 
 from pydantic import Field
 
@@ -24,26 +29,50 @@ from tinygent.core.datamodels.llm import AbstractLLM
 from tinygent.core.datamodels.llm import AbstractLLMConfig
 from tinygent.core.datamodels.memory import AbstractMemory
 from tinygent.core.datamodels.memory import AbstractMemoryConfig
+from tinygent.core.datamodels.messages import TinyHumanMessage
 from tinygent.core.datamodels.messages import TinyToolCall
 from tinygent.core.datamodels.messages import TinyToolResult
 from tinygent.core.datamodels.middleware import AbstractMiddleware
 from tinygent.core.datamodels.middleware import AbstractMiddlewareConfig
 from tinygent.core.datamodels.tool import AbstractTool
 from tinygent.core.datamodels.tool import AbstractToolConfig
+from tinygent.core.runtime.blob_store import TinyBlobHandle
+from tinygent.core.runtime.blob_store import TinyBlobStore
+from tinygent.core.runtime.blob_store import get_global_blob_store
+from tinygent.core.runtime.executors import run_sync_in_executor
+from tinygent.core.runtime.tool_execution import ToolTimeoutError
+from tinygent.core.runtime.tool_execution import call_tool
+from tinygent.core.runtime.tool_execution import call_tool_with_timeout
 from tinygent.core.telemetry.decorators import tiny_trace
 from tinygent.core.telemetry.otel import set_tiny_attribute
 from tinygent.core.telemetry.otel import set_tiny_attributes
 from tinygent.core.types.io.llm_io_chunks import TinyLLMResultChunk
 from tinygent.core.types.io.llm_io_input import TinyLLMInput
+from tinygent.core.types.io.llm_io_result import TinyLLMResult
+from tinygent.core.types.io.llm_io_result import take_reported_token_usage
+from tinygent.core.types.io.tool_io_chunks import TinyToolResultChunk
 from tinygent.memory.buffer_chat_memory import BufferChatMemoryConfig
+from tinygent.tools.blob_tools import BLOB_TOOL_NAMES
+from tinygent.tools.blob_tools import blob_tools
 
 if typing.TYPE_CHECKING:
     from tinygent.agents.checkpointer.default_checkpointer import TinyDefaultCheckpointer
+    from tinygent.agents.checkpointer.write_behind import TinyCheckpointWriteBehind
 
 T = TypeVar('T', bound='AbstractAgent')
 
 logger = logging.getLogger(__name__)
 
+# agent and queue of the `with_tool_chunks` consumer of the current run; the
+# run's task copies the context, so concurrent streamed runs do not mix chunks
+_TOOL_CHUNK_QUEUE: ContextVar[
+    tuple[TinyBaseAgent, asyncio.Queue[tuple[str, Any]]] | None
+] = ContextVar('tiny_tool_chunk_queue', default=None)
+
+# checkpointer keys binding the iteration state to its task and conversation
+_TASK_KEY = 'task'
+_MEMORY_KEY = 'memory'
+
 
 def _create_default_checkpointer() -> 'TinyDefaultCheckpointer':
     from tinygent.agents.checkpointer.default_checkpointer import TinyDefaultCheckpointer
@@ -51,6 +80,13 @@ def _create_default_checkpointer() -> 'TinyDefaultCheckpointer':
     return TinyDefaultCheckpointer({})
 
 
+def _release_blob_runs(stores: list[TinyBlobStore], runs: set[str]) -> None:
+    for store in stores:
+        for run_id in runs:
+            store.release_run(run_id)
+    runs.clear()
+
+
 class TinyBaseAgentConfig(AbstractAgentConfig[T], Generic[T]):
     """Configuration for BaseAgent."""
 
@@ -155,23 +191,66 @@ class TinyBaseAgent(AbstractAgent, AbstractMiddleware):
         tools: Sequence[AbstractTool] = [],
         middleware: Sequence[AbstractMiddleware] = [],
         checkpointer: AbstractCheckpointer | None = None,
+        auto_checkpoint: bool = False,
+        tool_timeout: float | None = None,
+        blob_threshold: int | None = None,
+        blob_store: TinyBlobStore | None = None,
     ) -> None:
         self.llm = llm
         self.middleware = middleware
+        self.auto_checkpoint = auto_checkpoint
+        self.tool_timeout = tool_timeout
+        self.blob_threshold = blob_threshold
+        self.blob_store = blob_store or get_global_blob_store()
 
         self._memory = memory
         self._tools = tools
+
+        # tools the attached middleware and blob offloading rely on
+        extra_tools: list[AbstractTool] = [
+            tool for m in middleware for tool in getattr(m, 'provided_tools', list)()
+        ]
+        if blob_threshold is not None:
+            extra_tools.extend(blob_tools(self.blob_store))
+        if extra_tools:
+            names = {tool.info.name for tool in tools}
+            self._tools = [*tools]
+            for tool in extra_tools:
+                if tool.info.name not in names:
+                    names.add(tool.info.name)
+                    self._tools.append(tool)
+
+        # stores which may hold blobs of this agent's runs: its own when it
+        # offloads results, and those of middleware (e.g. context compaction)
+        self._blob_stores: list[TinyBlobStore] = (
+            [self.blob_store] if blob_threshold is not None else []
+        )
+        for m in middleware:
+            store = getattr(m, 'blob_store', None)
+            if isinstance(store, TinyBlobStore) and all(
+                store is not s for s in self._blob_stores
+            ):
+                self._blob_stores.append(store)
+        self._blob_runs: set[str] = set()
+        # blobs are only referenced by this agent's memory and checkpoints
+        weakref.finalize(self, _release_blob_runs, self._blob_stores, self._blob_runs)
         self._checkpointer = (
             _create_default_checkpointer() if checkpointer is None else checkpointer
         )
         self._final_answer: str | None = None
 
+        self._checkpoint_id: str | None = None
+        self._checkpoint_writer: TinyCheckpointWriteBehind | None = None
+
     def reset(self) -> None:
         logger.debug('[BASE AGENT RESET]')
 
         self.memory.clear()
         self.checkpointer.clear()
 
+        # the cleared memory held the last handles of the stored blobs
+        _release_blob_runs(self._blob_stores, self._blob_runs)
+
         self._final_answer = None
 
     @property
@@ -186,6 +265,63 @@ class TinyBaseAgent(AbstractAgent, AbstractMiddleware):
     def checkpointer(self) -> AbstractCheckpointer:
         return self._checkpointer
 
+    def _track_blob_run(self, run_id: str) -> None:
+        """Remember the run, so blobs stored for it are released on reset."""
+        if self._blob_stores:
+            self._blob_runs.add(run_id)
+
+    def _resume_task(self, input_text: str) -> bool:
+        """Restore the memory of a run resumed from a checkpoint of `input_text`.
+
+        Returns False when there is nothing to resume: no checkpoint id was
+        given, or the checkpoint belongs to a different task. The agent then
+        starts its state over and calls `_start_task`.
+        """
+        if not self._checkpoint_id or (
+            self.checkpointer.setdefault(_TASK_KEY, None) != input_text
+        ):
+            return False
+
+        messages = self.checkpointer.setdefault(_MEMORY_KEY, None)
+        if messages is not None:
+            self.memory.clear()
+            self.memory.save_multiple_context(messages)
+        else:
+            self.memory.save_context(TinyHumanMessage(content=input_text))
+        return True
+
+    def _start_task(self, input_text: str) -> None:
+        """Bind the checkpointer state to a new task and save its human message."""
+        self.checkpointer[_TASK_KEY] = input_text
+        self.memory.save_context(TinyHumanMessage(content=input_text))
+
+    def _start_auto_checkpoint(self, run_id: str) -> None:
+        """Start background checkpointing for this run if `auto_checkpoint` is on.
+
+        Snapshots are saved under the checkpoint id the run was resumed from,
+        or under the run id when no checkpoint id was given.
+        """
+        if not self.auto_checkpoint:
+            return
+
+        from tinygent.agents.checkpointer.write_behind import TinyCheckpointWriteBehind
+
+        self._checkpoint_writer = TinyCheckpointWriteBehind(
+            self.checkpointer, self._checkpoint_id or run_id
+        )
+
+    def _auto_checkpoint(self) -> None:
+        """Snapshot the checkpointer state after a finished unit of work."""
+        if self._checkpoint_writer is not None:
+            # a resumed run continues the conversation, not only the iterations
+            self.checkpointer[_MEMORY_KEY] = self.memory.copy_chat_messages()
+            self._checkpoint_writer.submit()
+
+    async def _finish_auto_checkpoint(self) -> None:
+        if self._checkpoint_writer is not None:
+            writer, self._checkpoint_writer = self._checkpoint_writer, None
+            await writer.flush()
+
     def get_tool(self, name: str) -> AbstractTool | None:
         logger.debug('Looking for tool: %s', name)
         tool = next((tool for tool in self.tools if tool.info.name == name), None)
@@ -208,16 +344,43 @@ class TinyBaseAgent(AbstractAgent, AbstractMiddleware):
             logger.warning('Tool %s not found.', name)
         return tool
 
+    @staticmethod
+    def _resolve_llm_fn(fn: Callable, kwargs: dict[str, Any]) -> Callable:
+        """Redirect the call to another LLM when middleware set `kwargs['llm']`."""
+        llm = kwargs.pop('llm', None)
+        if llm is None:
+            return fn
+        return getattr(llm, fn.__name__)
+
+    @staticmethod
+    def _llm_model(fn: Callable) -> str | None:
+        """Model name of the LLM the resolved LLM method is bound to, if known."""
+        model = getattr(getattr(fn, '__self__', None), 'model', None)
+        return model if isinstance(model, str) else None
+
+    @staticmethod
+    def _token_usage(result: Any) -> tuple[int, int] | None:
+        """Token counts the provider reported for the LLM call, if any."""
+        reported = take_reported_token_usage()
+        if isinstance(result, TinyLLMResult):
+            return result.token_usage() or reported
+        return reported
+
     @tiny_trace()
     async def run_llm(
         self, run_id: str, fn: Callable, llm_input: TinyLLMInput, **kwargs
     ) -> Any:
+        self._track_blob_run(run_id)
         kwargs_dict = dict(kwargs)
         await self.before_llm_call(
             run_id=run_id, llm_input=llm_input, kwargs=kwargs_dict
         )
+        fn = self._resolve_llm_fn(fn, kwargs_dict)
+        take_reported_token_usage()
         try:
             result = fn(llm_input=llm_input, **kwargs_dict)
+            kwargs_dict['llm_model'] = self._llm_model(fn)
+            kwargs_dict['token_usage'] = self._token_usage(result)
             await self.after_llm_call(
                 run_id=run_id, llm_input=llm_input, result=result, kwargs=kwargs_dict
             )
@@ -239,22 +402,31 @@ class TinyBaseAgent(AbstractAgent, AbstractMiddleware):
         llm_input: TinyLLMInput,
         **kwargs: Any,
     ) -> AsyncGenerator[TinyLLMResultChunk, None]:
+        self._track_blob_run(run_id)
         kwargs_dict = dict(kwargs)
         await self.before_llm_call(
             run_id=run_id, llm_input=llm_input, kwargs=kwargs_dict
         )
+        fn = self._resolve_llm_fn(fn, kwargs_dict)
+        take_reported_token_usage()
         try:
+            started = time.monotonic()
             result = fn(llm_input=llm_input, **kwargs_dict)
 
             # if coroutine, await it to get async generator
             if isinstance(result, Awaitable):
                 result = await result
 
-            all_chunks = []
+            all_chunks: list[TinyLLMResultChunk] = []
             async for chunk in result:
+                if not all_chunks:
+                    kwargs_dict['stream_ttft'] = time.monotonic() - started
                 all_chunks.append(chunk)
                 yield chunk
 
+            kwargs_dict['stream_chunks'] = all_chunks
+            kwargs_dict['llm_model'] = self._llm_model(fn)
+            kwargs_dict['token_usage'] = self._token_usage(None)
             await self.after_llm_call(
                 run_id=run_id, llm_input=llm_input, result=None, kwargs=kwargs_dict
             )
@@ -263,6 +435,107 @@ class TinyBaseAgent(AbstractAgent, AbstractMiddleware):
             await self.on_error(run_id=run_id, e=e, kwargs=kwargs_dict)
             raise
 
+    def _tool_chunk_handler(
+        self,
+        run_id: str,
+        tool: AbstractTool,
+        call: TinyToolCall,
+        kwargs: dict[str, Any],
+    ) -> Callable[[Any], Awaitable[None]] | None:
+        """Forward tool chunks to middleware and stream consumers, if any listen."""
+        dispatch_chunks = self.handles('on_tool_chunk')
+        consumer = _TOOL_CHUNK_QUEUE.get()
+        queue = consumer[1] if consumer is not None and consumer[0] is self else None
+        if not dispatch_chunks and queue is None:
+            return None
+
+        idx = 0
+
+        async def on_chunk(chunk: Any) -> None:
+            nonlocal idx
+            if dispatch_chunks:
+                await self.on_tool_chunk(
+                    run_id=run_id, tool=tool, chunk=chunk, idx=str(idx), kwargs=kwargs
+                )
+            if queue is not None:
+                queue.put_nowait(
+                    (
+                        'tool_chunk',
+                        TinyToolResultChunk(
+                            tool_name=tool.info.name,
+                            call_id=call.call_id,
+                            idx=idx,
+                            content=chunk,
+                        ),
+                    )
+                )
+            idx += 1
+
+        return on_chunk
+
+    async def _execute_tool(
+        self,
+        run_id: str,
+        tool: AbstractTool,
+        call: TinyToolCall,
+        kwargs: dict[str, Any],
+    ) -> Any:
+        on_chunk = self._tool_chunk_handler(run_id, tool, call, kwargs)
+
+        timeout = tool.info.timeout
+        if timeout is None:
+            timeout = self.tool_timeout
+        if timeout is not None:
+            return await call_tool_with_timeout(tool, call.arguments, timeout, on_chunk)
+
+        return await call_tool(tool, call.arguments, on_chunk)
+
+    async def with_tool_chunks(
+        self, stream: AsyncIterator[str]
+    ) -> AsyncGenerator[str | TinyToolResultChunk, None]:
+        """Interleave the chunks of streaming tools into the agent's output stream.
+
+        Wraps a `run_stream` generator of this agent. Answer chunks are yielded
+        as strings, and every chunk a tool produces while the run is in progress
+        is yielded as a `TinyToolResultChunk` as soon as it arrives. Each call
+        gets its own queue, so concurrent streamed runs only see their own
+        tool chunks. `run_stream` itself keeps yielding only answer strings:
+
+            async for item in agent.with_tool_chunks(agent.run_stream(task)):
+                if isinstance(item, TinyToolResultChunk):
+                    print(f'[{item.tool_name}] {item.content}')
+                else:
+                    print(item, end='')
+        """
+        queue: asyncio.Queue[tuple[str, Any]] = asyncio.Queue()
+
+        async def drive() -> None:
+            async for chunk in stream:
+                queue.put_nowait(('answer', chunk))
+
+        # the task copies the context, so only this run's tools see the queue
+        token = _TOOL_CHUNK_QUEUE.set((self, queue))
+        try:
+            task = asyncio.create_task(drive())
+        finally:
+            _TOOL_CHUNK_QUEUE.reset(token)
+        task.add_done_callback(lambda _: queue.put_nowait(('end', None)))
+        try:
+            while True:
+                kind, item = await queue.get()
+                if kind == 'end':
+                    # re-raises the error of the run, if it failed
+                    task.result()
+                    break
+                yield item
+        finally:
+            if not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+
     @tiny_trace()
     async def run_tool(
         self, run_id: str, tool: AbstractTool, call: TinyToolCall, **kwargs: Any
@@ -275,14 +548,21 @@ class TinyBaseAgent(AbstractAgent, AbstractMiddleware):
         )
         logger.debug('Running tool %s(%s)', tool.info.name, call.arguments)
 
+        self._track_blob_run(run_id)
         kwargs_dict = dict(kwargs)
+        kwargs_dict['tool_call_id'] = call.call_id
         try:
             await self.before_tool_call(
                 run_id=run_id, tool=tool, args=call.arguments, kwargs=kwargs_dict
             )
 
-            result = tool(**call.arguments)
-            call.metadata['executed'] = True
+            if 'tool_result' in kwargs_dict:
+                # result provided by middleware (e.g. a cache), skip the execution
+                result = kwargs_dict['tool_result']
+                call.metadata['executed'] = False
+            else:
+                result = await self._execute_tool(run_id, tool, call, kwargs_dict)
+                call.metadata['executed'] = True
             call.result = result
             await self.after_tool_call(
                 run_id=run_id,
@@ -292,10 +572,34 @@ class TinyBaseAgent(AbstractAgent, AbstractMiddleware):
                 kwargs=kwargs_dict,
             )
 
+            # middleware may replace the content put into the conversation, and
+            # report that the content is already stored as a blob
+            content = str(kwargs_dict.get('tool_result_content', result))
+            handle: TinyBlobHandle | None = kwargs_dict.get('tool_result_blob')
+            if (
+                handle is None
+                and self.blob_threshold is not None
+                and len(content) > self.blob_threshold
+                and tool.info.name not in BLOB_TOOL_NAMES
+            ):
+                # the conversation, memory and checkpoints only keep the handle;
+                # a full store leaves the content in place
+                if self.blob_store.blocking:
+                    handle = await run_sync_in_executor(
+                        self.blob_store.put, run_id, content
+                    )
+                else:
+                    handle = self.blob_store.put(run_id, content)
+                if handle is not None:
+                    content = handle.to_string()
+
             tool_result = TinyToolResult(
                 call_id=call.call_id or 'unknown',
-                content=str(result),
+                content=content,
             )
+            if handle is not None:
+                call.result = handle
+                tool_result.metadata['blob_id'] = handle.blob_id
 
             set_tiny_attribute('tool.result', str(result))
             logger.debug(
@@ -324,6 +628,31 @@ class TinyBaseAgent(AbstractAgent, AbstractMiddleware):
 
             set_tiny_attribute('tool.blocked', str(e))
             return error_result
+        except ToolTimeoutError as e:
+            await self.on_error(run_id=run_id, e=e, kwargs=kwargs_dict)
+
+            # structured result the LLM can recover from (retry or continue)
+            error_result = TinyToolResult(
+                call_id=call.call_id or 'unknown',
+                content=json.dumps(
+                    {
+                        'error': 'timeout',
+                        'tool': tool.info.name,
+                        'timeout_seconds': e.timeout,
+                        'message': (
+                            f'The tool did not finish within {e.timeout:g} seconds '
+                            'and was cancelled. Retry with a simpler request or '
+                            'continue without this result.'
+                        ),
+                    }
+                ),
+            )
+            call.metadata['executed'] = True
+            call.metadata['timeout'] = True
+            call.metadata['error'] = e
+
+            set_tiny_attribute('tool.timeout', e.timeout)
+            return error_result
         except Exception as e:
             logger.warning(
                 'Error during tool call %s(%s)', tool.info.name, call.arguments
@@ -1,3 +1,4 @@
+from copy import deepcopy
 import logging
 from typing import Any
 from typing import Generic
@@ -39,6 +40,9 @@ class TinyBaseCheckpointer(AbstractCheckpointer):
     def clear(self) -> None:
         self.data = {}
 
+    def snapshot(self) -> Any:
+        return deepcopy(self.data)
+
     def __getitem__(self, key: str, default: Any = None) -> Any:
         val = self.data.get(key, default)
         if val is None:
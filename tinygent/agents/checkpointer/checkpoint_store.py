@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+import logging
+import threading
+import time
+from typing import Any
+
+from tinygent.core.types.base import TinyModel
+
+logger = logging.getLogger(__name__)
+
+# default of `set_limits` arguments, keeping the current limit
+_KEEP: Any = object()
+
+
+class TinyCheckpointStoreStats(TinyModel):
+    """Point-in-time counters of a `TinyCheckpointStore`."""
+
+    entries: int
+    bytes: int
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+
+
+class _Shard:
+    __slots__ = (
+        'bytes',
+        'entries',
+        'evictions',
+        'expirations',
+        'hits',
+        'lock',
+        'misses',
+        'saved',
+    )
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        # checkpoint_id -> (serialized data, expires_at, last used); ordered
+        # from LRU to MRU
+        self.entries: OrderedDict[str, tuple[bytes, float | None, float]] = OrderedDict()
+        # checkpoint_id -> expires_at; ordered from the oldest save, so with a
+        # single TTL also from the earliest expiration
+        self.saved: OrderedDict[str, float | None] = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def remove(self, checkpoint_id: str) -> bool:
+        entry = self.entries.pop(checkpoint_id, None)
+        if entry is None:
+            return False
+        self.saved.pop(checkpoint_id, None)
+        self.bytes -= len(entry[0])
+        return True
+
+
+class TinyCheckpointStore:
+    """Bounded, thread-safe in-memory store of serialized checkpoints.
+
+    Checkpoints are kept as immutable `bytes`, so storing and returning them
+    never needs a deep copy. Ids are spread over `num_shards` independent
+    shards, each guarded by its own lock, so concurrent runs only contend when
+    their ids hash to the same shard.
+
+    `max_entries` and `max_bytes` limit the whole store. Once a save exceeds
+    them, the least recently used checkpoints of all shards are evicted, so a
+    large checkpoint is not dropped only because another id hashed to its
+    shard. Checkpoints older than `ttl_seconds` (measured from the last save)
+    are treated as missing and dropped lazily.
+
+    Args:
+        num_shards: Number of independently locked shards
+        max_entries: Maximum number of stored checkpoints (None = unbounded)
+        max_bytes: Maximum total size of stored checkpoints (None = unbounded)
+        ttl_seconds: Time after the last save when a checkpoint expires (None = never)
+    """
+
+    def __init__(
+        self,
+        num_shards: int = 16,
+        max_entries: int | None = 1024,
+        max_bytes: int | None = 256 * 1024 * 1024,
+        ttl_seconds: float | None = None,
+    ) -> None:
+        if num_shards <= 0:
+            raise ValueError('num_shards must be a positive integer.')
+
+        self.ttl_seconds = ttl_seconds
+        self._shards = [_Shard() for _ in range(num_shards)]
+        self._max_entries: int | None = None
+        self._max_bytes: int | None = None
+        # serializes evictions, so concurrent saves do not evict for each other
+        self._evict_lock = threading.Lock()
+
+        self.set_limits(max_entries=max_entries, max_bytes=max_bytes)
+
+    def set_limits(
+        self,
+        max_entries: int | None = _KEEP,
+        max_bytes: int | None = _KEEP,
+        ttl_seconds: float | None = _KEEP,
+    ) -> None:
+        """Change the limits, evicting checkpoints which no longer fit.
+
+        Omitted limits keep their current value; pass None to remove a limit.
+        A new TTL applies to checkpoints saved afterwards.
+        """
+        if max_entries is not _KEEP:
+            self._max_entries = max_entries
+        if max_bytes is not _KEEP:
+            self._max_bytes = max_bytes
+        if ttl_seconds is not _KEEP:
+            self.ttl_seconds = ttl_seconds
+
+        self._evict()
+
+    def _shard(self, checkpoint_id: str) -> _Shard:
+        return self._shards[hash(checkpoint_id) % len(self._shards)]
+
+    def _over_limits(self) -> bool:
+        # shard counters are read without their locks, a slightly stale total
+        # only delays an eviction to the next save
+        return (
+            self._max_entries is not None
+            and sum(len(shard.entries) for shard in self._shards) > self._max_entries
+        ) or (
+            self._max_bytes is not None
+            and sum(shard.bytes for shard in self._shards) > self._max_bytes
+        )
+
+    def _evict(self, keep: str | None = None) -> None:
+        with self._evict_lock:
+            while self._over_limits():
+                # the least recently used checkpoint of the store is the oldest
+                # of the shards' LRU heads
+                victim: tuple[float, _Shard, str] | None = None
+                for shard in self._shards:
+                    with shard.lock:
+                        for checkpoint_id, (_, _, used) in shard.entries.items():
+                            if checkpoint_id == keep:
+                                continue
+                            if victim is None or used < victim[0]:
+                                victim = (used, shard, checkpoint_id)
+                            break
+
+                if victim is None:
+                    # a single checkpoint larger than the whole store is still
+                    # kept until something else is saved
+                    break
+
+                used, shard, checkpoint_id = victim
+                with shard.lock:
+                    # the shard was unlocked since the victim was picked: deletes
+                    # may have made room, or a get may have used the victim
+                    if not self._over_limits():
+                        break
+                    entry = shard.entries.get(checkpoint_id)
+                    if entry is None or entry[2] != used:
+                        continue
+                    shard.remove(checkpoint_id)
+                    shard.evictions += 1
+                    logger.debug(
+                        'Evicted checkpoint %s from in-memory store', checkpoint_id
+                    )
+
+    def _expire(self, shard: _Shard, now: float) -> None:
+        while shard.saved:
+            checkpoint_id, expires_at = next(iter(shard.saved.items()))
+            if expires_at is None or expires_at > now:
+                break
+            shard.remove(checkpoint_id)
+            shard.expirations += 1
+
+    def put(self, checkpoint_id: str, data: bytes) -> None:
+        """Store the serialized checkpoint, replacing any previous version."""
+        now = time.monotonic()
+        expires_at = None if self.ttl_seconds is None else now + self.ttl_seconds
+
+        shard = self._shard(checkpoint_id)
+        with shard.lock:
+            shard.remove(checkpoint_id)
+            shard.entries[checkpoint_id] = (data, expires_at, now)
+            shard.saved[checkpoint_id] = expires_at
+            shard.bytes += len(data)
+
+            self._expire(shard, now)
+
+        self._evict(keep=checkpoint_id)
+
+    def get(self, checkpoint_id: str) -> bytes | None:
+        """Return the serialized checkpoint, or None if it is missing or expired."""
+        now = time.monotonic()
+        shard = self._shard(checkpoint_id)
+        with shard.lock:
+            entry = shard.entries.get(checkpoint_id)
+            if entry is not None and entry[1] is not None and entry[1] <= now:
+                shard.remove(checkpoint_id)
+                shard.expirations += 1
+                entry = None
+
+            if entry is None:
+                shard.misses += 1
+                return None
+
+            shard.entries[checkpoint_id] = (entry[0], entry[1], now)
+            shard.entries.move_to_end(checkpoint_id)
+            shard.hits += 1
+            return entry[0]
+
+    def delete(self, checkpoint_id: str) -> bool:
+        """Remove the checkpoint; return whether it was stored."""
+        shard = self._shard(checkpoint_id)
+        with shard.lock:
+            return shard.remove(checkpoint_id)
+
+    def purge_expired(self) -> int:
+        """Drop all expired checkpoints; return how many were removed."""
+        if self.ttl_seconds is None:
+            return 0
+
+        now = time.monotonic()
+        removed = 0
+        for shard in self._shards:
+            with shard.lock:
+                before = len(shard.entries)
+                self._expire(shard, now)
+                removed += before - len(shard.entries)
+        return removed
+
+    def clear(self) -> None:
+        """Remove all checkpoints, keeping the statistics."""
+        for shard in self._shards:
+            with shard.lock:
+                shard.entries.clear()
+                shard.saved.clear()
+                shard.bytes = 0
+
+    def stats(self) -> TinyCheckpointStoreStats:
+        """Return the current size and hit/miss/eviction counters."""
+        totals = dict.fromkeys(TinyCheckpointStoreStats.model_fields, 0)
+        for shard in self._shards:
+            with shard.lock:
+                totals['entries'] += len(shard.entries)
+                totals['bytes'] += shard.bytes
+                totals['hits'] += shard.hits
+                totals['misses'] += shard.misses
+                totals['evictions'] += shard.evictions
+                totals['expirations'] += shard.expirations
+        return TinyCheckpointStoreStats(**totals)
+
+    def __contains__(self, checkpoint_id: str) -> bool:
+        shard = self._shard(checkpoint_id)
+        with shard.lock:
+            return checkpoint_id in shard.entries
+
+    def __len__(self) -> int:
+        return sum(len(shard.entries) for shard in self._shards)
@@ -17,6 +17,13 @@ class TinyDefaultCheckpointer(TinyBaseCheckpointer):
             'Checkpoint (%s) will not be saved in default checkpointer', checkpoint_id
         )
 
+    def snapshot(self) -> Any:
+        # nothing is ever persisted, so there is no point in copying the data
+        return {}
+
+    def save_snapshot(self, checkpoint_id: str, snapshot: Any) -> None:
+        self.save(checkpoint_id)
+
     def load(self, checkpoint_id: str) -> None:
         logger.debug('Nothing to be loaded for default checkpointer (%s)', checkpoint_id)
 
@@ -1,52 +1,84 @@
 from __future__ import annotations
 
-from copy import deepcopy
 import logging
-from threading import Lock
+import pickle
 from typing import Any
+from typing import Literal
 from typing import TypeVar
 
 from pydantic import Field
 
 from tinygent.agents.checkpointer.base_checkpointer import TinyBaseCheckpointer
 from tinygent.agents.checkpointer.base_checkpointer import TinyBaseCheckpointerConfig
+from tinygent.agents.checkpointer.checkpoint_store import TinyCheckpointStore
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T', bound='TinyLocalCheckpointer')
 
-_GLOBAL_CHECKPOINTS: dict[str, Any] = {}
-_GLOBAL_CHECKPOINTS_LOCK = Lock()
+_GLOBAL_CHECKPOINTS = TinyCheckpointStore()
+
+
+def get_global_checkpoint_store() -> TinyCheckpointStore:
+    """Return the process-wide store shared by all local checkpointers."""
+    return _GLOBAL_CHECKPOINTS
 
 
 class TinyLocalCheckpointerConfig(TinyBaseCheckpointerConfig['TinyLocalCheckpointer']):
-    type: Any = Field(default='local', frozen=True)
+    type: Literal['local'] = Field(default='local', frozen=True)
+
+    ttl_seconds: float | None = Field(default=None)
 
     def build(self) -> TinyLocalCheckpointer:
+        if self.ttl_seconds is not None:
+            _GLOBAL_CHECKPOINTS.set_limits(ttl_seconds=self.ttl_seconds)
         return TinyLocalCheckpointer(self.data)
 
 
 class TinyLocalCheckpointer(TinyBaseCheckpointer):
-    def __init__(self, data: dict[str, Any]) -> None:
+    """In-process checkpointer backed by a bounded `TinyCheckpointStore`.
+
+    Checkpoints are stored pickled, so saving and loading never deep-copies
+    the live data and stored checkpoints cannot be mutated by a running agent.
+    By default all instances share the process-wide store returned by
+    `get_global_checkpoint_store`, which evicts least recently used
+    checkpoints once its limits are reached. Its TTL can be set with
+    `ttl_seconds` in `TinyLocalCheckpointerConfig` (or `set_limits`).
+
+    Args:
+        data: Initial checkpoint data
+        store: Store to keep checkpoints in (default: the process-wide store)
+    """
+
+    def __init__(
+        self, data: dict[str, Any], store: TinyCheckpointStore | None = None
+    ) -> None:
         super().__init__(data)
 
+        self.store = store or _GLOBAL_CHECKPOINTS
+
+    def snapshot(self) -> bytes:
+        return pickle.dumps(self.data, protocol=pickle.HIGHEST_PROTOCOL)
+
     def save(self, checkpoint_id: str) -> None:
-        logger.debug('Saving checkpoint %s', checkpoint_id)
-        with _GLOBAL_CHECKPOINTS_LOCK:
-            _GLOBAL_CHECKPOINTS[checkpoint_id] = deepcopy(self.data)
-            logger.debug('Data %s saved: %s', checkpoint_id, str(self.data))
+        self.save_snapshot(checkpoint_id, self.snapshot())
+
+    def save_snapshot(self, checkpoint_id: str, snapshot: bytes) -> None:
+        logger.debug('Saving checkpoint %s (%d bytes)', checkpoint_id, len(snapshot))
+        self.store.put(checkpoint_id, snapshot)
 
     def load(self, checkpoint_id: str) -> None:
         logger.debug('Loading checkpoint %s', checkpoint_id)
-        with _GLOBAL_CHECKPOINTS_LOCK:
-            tmp = _GLOBAL_CHECKPOINTS.get(checkpoint_id)
-            if tmp is None:
-                logger.warning("Couldn't find data for checkpoint id: %s", checkpoint_id)
-                return
-            self.data = deepcopy(tmp)
-            logger.debug('Data %s loaded: %s', checkpoint_id, str(self.data))
+        blob = self.store.get(checkpoint_id)
+        if blob is None:
+            logger.warning("Couldn't find data for checkpoint id: %s", checkpoint_id)
+            return
+        self.data = pickle.loads(blob)
+        logger.debug('Data %s loaded: %s', checkpoint_id, str(self.data))
 
     def delete(self, checkpoint_id: str) -> None:
         logger.debug('Deleting checkpoint %s', checkpoint_id)
-        with _GLOBAL_CHECKPOINTS_LOCK:
-            _GLOBAL_CHECKPOINTS.pop(checkpoint_id)
+        if not self.store.delete(checkpoint_id):
+            logger.debug(
+                'Checkpoint %s was not stored or already evicted', checkpoint_id
+            )
@@ -1,5 +1,7 @@
 from tinygent.agents.checkpointer.local_checkpointer import TinyLocalCheckpointer
 from tinygent.agents.checkpointer.local_checkpointer import TinyLocalCheckpointerConfig
+from tinygent.agents.checkpointer.sqlite_checkpointer import TinySQLiteCheckpointer
+from tinygent.agents.checkpointer.sqlite_checkpointer import TinySQLiteCheckpointerConfig
 from tinygent.core.runtime.global_registry import GlobalRegistry
 
 
@@ -9,6 +11,9 @@ def _register_checkpointers() -> None:
     registry.register_checkpointer(
         'local', TinyLocalCheckpointerConfig, TinyLocalCheckpointer
     )
+    registry.register_checkpointer(
+        'sqlite', TinySQLiteCheckpointerConfig, TinySQLiteCheckpointer
+    )
 
 
 _register_checkpointers()
@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+from pathlib import Path
+import pickle
+import sqlite3
+import threading
+import time
+from typing import Any
+from typing import Literal
+
+from pydantic import Field
+
+from tinygent.agents.checkpointer.base_checkpointer import TinyBaseCheckpointer
+from tinygent.agents.checkpointer.base_checkpointer import TinyBaseCheckpointerConfig
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoint_values (
+    checkpoint_id TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value BLOB NOT NULL,
+    PRIMARY KEY (checkpoint_id, key)
+);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    checkpoint_id TEXT PRIMARY KEY,
+    updated_at REAL NOT NULL,
+    revision INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS ix_checkpoints_updated_at ON checkpoints (updated_at);
+"""
+
+
+class TinySQLiteCheckpointerConfig(TinyBaseCheckpointerConfig['TinySQLiteCheckpointer']):
+    type: Literal['sqlite'] = Field(default='sqlite', frozen=True)
+
+    path: str = Field(default='tinygent_checkpoints.db')
+
+    ttl_seconds: float | None = Field(default=None)
+
+    cleanup_interval_seconds: float = Field(default=60.0)
+
+    def build(self) -> TinySQLiteCheckpointer:
+        return TinySQLiteCheckpointer(
+            self.data,
+            path=self.path,
+            ttl_seconds=self.ttl_seconds,
+            cleanup_interval_seconds=self.cleanup_interval_seconds,
+        )
+
+
+class TinySQLiteCheckpointer(TinyBaseCheckpointer):
+    """Durable checkpointer persisting checkpoint data into a SQLite database.
+
+    Every key of the checkpoint data is stored as a separate row holding its
+    pickled value. On save, only keys whose serialized value changed since the
+    last save or load of the same checkpoint are written, and keys removed from
+    the data are deleted. Changed values are written whole: a growing list such
+    as the agent's iterations is re-pickled and rewritten on every save, while
+    unchanged keys are not.
+
+    Every save increments the checkpoint's revision. When another process
+    saved the same checkpoint since this instance last synced it, the
+    remembered digests are stale, so all keys are rewritten.
+
+    The database runs in WAL mode, so multiple processes can read checkpoints
+    while another one writes. Checkpoints not updated for `ttl_seconds` are
+    treated as missing and periodically deleted.
+
+    Note: values are serialized with `pickle`; only load databases you trust.
+
+    Args:
+        data: Initial checkpoint data
+        path: Path to the SQLite database file
+        ttl_seconds: Time after the last save when a checkpoint expires (None = never)
+        cleanup_interval_seconds: Minimum time between two expired-checkpoint sweeps
+    """
+
+    def __init__(
+        self,
+        data: dict[str, Any],
+        path: str | Path = 'tinygent_checkpoints.db',
+        ttl_seconds: float | None = None,
+        cleanup_interval_seconds: float = 60.0,
+    ) -> None:
+        super().__init__(data)
+
+        self.path = str(path)
+        self.ttl_seconds = ttl_seconds
+        self.cleanup_interval_seconds = cleanup_interval_seconds
+
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._last_cleanup = 0.0
+
+        # digests of the values last written to / read from `_synced_id`
+        self._synced_id: str | None = None
+        self._synced_revision = 0
+        self._synced_digests: dict[str, bytes] = {}
+
+        with self._connection() as conn:
+            conn.executescript(_SCHEMA)
+            columns = {row[1] for row in conn.execute('PRAGMA table_info(checkpoints)')}
+            if 'revision' not in columns:
+                # databases created before revisions were tracked
+                conn.execute(
+                    'ALTER TABLE checkpoints '
+                    'ADD COLUMN revision INTEGER NOT NULL DEFAULT 0'
+                )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn: sqlite3.Connection | None = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30.0)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _digest(blob: bytes) -> bytes:
+        return hashlib.blake2b(blob, digest_size=16).digest()
+
+    def _is_expired(self, updated_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and updated_at < now - self.ttl_seconds
+
+    def snapshot(self) -> dict[str, bytes]:
+        return {
+            key: pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            for key, value in self.data.items()
+        }
+
+    def save(self, checkpoint_id: str) -> None:
+        self.save_snapshot(checkpoint_id, self.snapshot())
+
+    def save_snapshot(self, checkpoint_id: str, snapshot: dict[str, bytes]) -> None:
+        logger.debug('Saving checkpoint %s', checkpoint_id)
+
+        with self._write_lock:
+            digests = {key: self._digest(blob) for key, blob in snapshot.items()}
+
+            now = time.time()
+            with self._connection() as conn:
+                # lock the database first, so the revision cannot change meanwhile
+                conn.execute('BEGIN IMMEDIATE')
+                row = conn.execute(
+                    'SELECT revision FROM checkpoints WHERE checkpoint_id = ?',
+                    (checkpoint_id,),
+                ).fetchone()
+                revision = row[0] if row is not None else 0
+
+                known = (
+                    self._synced_digests
+                    if self._synced_id == checkpoint_id
+                    and row is not None
+                    and revision == self._synced_revision
+                    else None
+                )
+                changed = [
+                    (checkpoint_id, key, blob)
+                    for key, blob in snapshot.items()
+                    if known is None or known.get(key) != digests[key]
+                ]
+
+                if known is None:
+                    conn.execute(
+                        'DELETE FROM checkpoint_values WHERE checkpoint_id = ?',
+                        (checkpoint_id,),
+                    )
+                else:
+                    conn.executemany(
+                        'DELETE FROM checkpoint_values '
+                        'WHERE checkpoint_id = ? AND key = ?',
+                        [(checkpoint_id, key) for key in known.keys() - digests.keys()],
+                    )
+                conn.executemany(
+                    'INSERT OR REPLACE INTO checkpoint_values '
+                    '(checkpoint_id, key, value) VALUES (?, ?, ?)',
+                    changed,
+                )
+                conn.execute(
+                    'INSERT OR REPLACE INTO checkpoints '
+                    '(checkpoint_id, updated_at, revision) VALUES (?, ?, ?)',
+                    (checkpoint_id, now, revision + 1),
+                )
+
+            self._synced_id = checkpoint_id
+            self._synced_revision = revision + 1
+            self._synced_digests = digests
+
+        logger.debug(
+            'Checkpoint %s saved, %d of %d keys written',
+            checkpoint_id,
+            len(changed),
+            len(digests),
+        )
+
+        if now - self._last_cleanup >= self.cleanup_interval_seconds:
+            self.cleanup_expired()
+
+    def load(self, checkpoint_id: str) -> None:
+        logger.debug('Loading checkpoint %s', checkpoint_id)
+
+        conn = self._connection()
+        with conn:
+            # one read transaction, so the values match the revision
+            conn.execute('BEGIN')
+            row = conn.execute(
+                'SELECT updated_at, revision FROM checkpoints WHERE checkpoint_id = ?',
+                (checkpoint_id,),
+            ).fetchone()
+            if row is None or self._is_expired(row[0], time.time()):
+                logger.warning("Couldn't find data for checkpoint id: %s", checkpoint_id)
+                return
+
+            rows = conn.execute(
+                'SELECT key, value FROM checkpoint_values WHERE checkpoint_id = ?',
+                (checkpoint_id,),
+            ).fetchall()
+
+        self.data = {key: pickle.loads(blob) for key, blob in rows}
+        self._synced_id = checkpoint_id
+        self._synced_revision = row[1]
+        self._synced_digests = {key: self._digest(blob) for key, blob in rows}
+        logger.debug('Checkpoint %s loaded with %d keys', checkpoint_id, len(rows))
+
+    def delete(self, checkpoint_id: str) -> None:
+        logger.debug('Deleting checkpoint %s', checkpoint_id)
+
+        with self._connection() as conn:
+            conn.execute(
+                'DELETE FROM checkpoint_values WHERE checkpoint_id = ?', (checkpoint_id,)
+            )
+            conn.execute(
+                'DELETE FROM checkpoints WHERE checkpoint_id = ?', (checkpoint_id,)
+            )
+
+        if self._synced_id == checkpoint_id:
+            self._synced_id = None
+            self._synced_digests = {}
+
+    def list_checkpoints(self) -> list[str]:
+        """Return ids of all stored, non-expired checkpoints."""
+        now = time.time()
+        rows = (
+            self._connection()
+            .execute('SELECT checkpoint_id, updated_at FROM checkpoints')
+            .fetchall()
+        )
+        return [cid for cid, updated_at in rows if not self._is_expired(updated_at, now)]
+
+    def cleanup_expired(self) -> int:
+        """Delete all checkpoints older than `ttl_seconds`; return how many."""
+        self._last_cleanup = now = time.time()
+        if self.ttl_seconds is None:
+            return 0
+
+        cutoff = now - self.ttl_seconds
+        with self._connection() as conn:
+            conn.execute(
+                'DELETE FROM checkpoint_values WHERE checkpoint_id IN '
+                '(SELECT checkpoint_id FROM checkpoints WHERE updated_at < ?)',
+                (cutoff,),
+            )
+            removed = conn.execute(
+                'DELETE FROM checkpoints WHERE updated_at < ?', (cutoff,)
+            ).rowcount
+
+        if removed:
+            logger.debug('Removed %d expired checkpoints', removed)
+        return removed
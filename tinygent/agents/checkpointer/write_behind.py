@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+from tinygent.core.datamodels.checkpointer import AbstractCheckpointer
+from tinygent.core.runtime.executors import run_sync_in_executor
+
+logger = logging.getLogger(__name__)
+
+
+class TinyCheckpointWriteBehind:
+    """Persists checkpointer snapshots in the background of a running agent.
+
+    `submit` takes a snapshot of the current checkpointer state synchronously
+    (so later mutations by the agent are not captured) and hands it to a
+    background task that writes it in an executor thread. Only the newest
+    pending snapshot is kept: if the agent submits faster than the storage can
+    write, intermediate snapshots are skipped instead of queued.
+
+    Write failures are logged and never propagate into the agent loop. Call
+    `flush` at the end of a run to wait until the last snapshot is persisted.
+
+    Args:
+        checkpointer: Checkpointer used to snapshot and persist the state
+        checkpoint_id: Identifier the snapshots are saved under
+    """
+
+    def __init__(self, checkpointer: AbstractCheckpointer, checkpoint_id: str) -> None:
+        self.checkpointer = checkpointer
+        self.checkpoint_id = checkpoint_id
+
+        self._pending: Any | None = None
+        self._task: asyncio.Task | None = None
+
+        self.saved: int = 0
+        self.skipped: int = 0
+        self.failed: int = 0
+
+    def submit(self) -> None:
+        """Snapshot the current state and schedule it to be persisted."""
+        if self._pending is not None:
+            self.skipped += 1
+        self._pending = self.checkpointer.snapshot()
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._drain())
+
+    async def flush(self) -> None:
+        """Wait until all submitted snapshots are persisted."""
+        while self._task is not None and not self._task.done():
+            await asyncio.shield(self._task)
+
+    async def _drain(self) -> None:
+        while self._pending is not None:
+            snapshot, self._pending = self._pending, None
+            try:
+                await run_sync_in_executor(
+                    self.checkpointer.save_snapshot, self.checkpoint_id, snapshot
+                )
+                self.saved += 1
+            except Exception:
+                self.failed += 1
+                logger.warning(
+                    'Failed to persist checkpoint %s in background',
+                    self.checkpoint_id,
+                    exc_info=True,
+                )
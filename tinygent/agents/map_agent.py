@@ -17,7 +17,6 @@ from tinygent.core.datamodels.llm import AbstractLLM
 from tinygent.core.datamodels.memory import AbstractMemory
 from tinygent.core.datamodels.messages import AllTinyMessages
 from tinygent.core.datamodels.messages import TinyChatMessage
-from tinygent.core.datamodels.messages import TinyHumanMessage
 from tinygent.core.datamodels.messages import TinySystemMessage
 from tinygent.core.datamodels.messages import TinyUserMessage
 from tinygent.core.datamodels.middleware import AbstractMiddleware
@@ -137,6 +136,10 @@ class TinyMAPAgentConfig(TinyBaseAgentConfig['TinyMAPAgent']):
 
     max_recurrsion: int = Field(default=5)
 
+    auto_checkpoint: bool = Field(default=False)
+
+    tool_timeout: float | None = Field(default=None)
+
     def build(self) -> TinyMAPAgent:
         return TinyMAPAgent(
             prompt_template=self.prompt_template,
@@ -144,10 +147,13 @@ class TinyMAPAgentConfig(TinyBaseAgentConfig['TinyMAPAgent']):
             llm=self.build_llm_instance(),
             tools=self.build_tools_list(),
             memory=self.build_memory_instance(),
+            checkpointer=self.build_checkpointer_instance(),
             max_plan_length=self.max_plan_length,
             max_branches_per_layer=self.max_branches_per_layer,
             max_layer_depth=self.max_layer_depth,
             max_recurrsion=self.max_recurrsion,
+            auto_checkpoint=self.auto_checkpoint,
+            tool_timeout=self.tool_timeout,
         )
 
 
@@ -189,6 +195,12 @@ class TinyMAPAgent(TinyBaseAgent):
         max_recurrsion: Maximum attempts to generate valid action proposals (default: 5)
         tools: List of tools available to the agent
         middleware: List of middleware to apply during execution
+        checkpointer: Checkpointer holding the agent state between runs
+        auto_checkpoint: Persist the checkpointer state in the background after
+            task decomposition and every finished subgoal, so a crashed run can be
+            resumed via `checkpoint_id` without repeating finished subgoals
+        tool_timeout: Seconds to wait for a tool call before cancelling it, for
+            tools without their own `timeout` (default: None = no limit)
     """
 
     def __init__(
@@ -203,6 +215,8 @@ class TinyMAPAgent(TinyBaseAgent):
         tools: list[AbstractTool] = [],
         middleware: Sequence[AbstractMiddleware] = [],
         checkpointer: AbstractCheckpointer | None = None,
+        auto_checkpoint: bool = False,
+        tool_timeout: float | None = None,
     ) -> None:
         super().__init__(
             llm=llm,
@@ -210,6 +224,8 @@ class TinyMAPAgent(TinyBaseAgent):
             memory=memory,
             middleware=middleware,
             checkpointer=checkpointer,
+            auto_checkpoint=auto_checkpoint,
+            tool_timeout=tool_timeout,
         )
 
         self.max_plan_length = max_plan_length
@@ -701,9 +717,10 @@ class TinyMAPAgent(TinyBaseAgent):
                 )
             )  # INFO: Last and final subgoal is original user question
             self.checkpointer['decomposed_task'] = decomposed_task
+            self._auto_checkpoint()
 
         for subgoal in filter(
-            lambda x: x.finished, self.checkpointer['decomposed_task'].subgoals
+            lambda x: not x.finished, self.checkpointer['decomposed_task'].subgoals
         ):
             logger.debug('[MAP] current subgoal: %s', subgoal)
             current_state = TinyMAPState(
@@ -732,6 +749,7 @@ class TinyMAPAgent(TinyBaseAgent):
                 await self.on_plan(run_id=run_id, plan=search_res.action.sum, kwargs={})
 
             subgoal.marked_finished()
+            self._auto_checkpoint()
 
         set_tiny_attributes(
             {
@@ -758,7 +776,11 @@ class TinyMAPAgent(TinyBaseAgent):
         )
         logger.debug('Running agent with task: %s', input_text)
 
-        self.memory.save_context(TinyHumanMessage(content=input_text))
+        if not self._resume_task(input_text):
+            self.checkpointer.clear()
+            self._start_task(input_text)
+        self._init_state()
+        self._start_auto_checkpoint(run_id)
 
         try:
             final_plan = await self._map(run_id, input_text)
@@ -768,6 +790,8 @@ class TinyMAPAgent(TinyBaseAgent):
             logger.warning('Error during MAP: %s', e)
             await self.on_error(run_id=run_id, e=e, kwargs={})
             raise e
+        finally:
+            await self._finish_auto_checkpoint()
 
     def reset(self) -> None:
         super().reset()
@@ -788,6 +812,7 @@ class TinyMAPAgent(TinyBaseAgent):
         if history:
             self.memory.save_multiple_context(history)
 
+        self._checkpoint_id = checkpoint_id
         if checkpoint_id:
             self.checkpointer.load(checkpoint_id)
 
@@ -806,10 +831,13 @@ class TinyMAPAgent(TinyBaseAgent):
         self.setup(reset=reset, history=history, checkpoint_id=checkpoint_id)
 
         async def _run() -> str:
-            plan = await self._run_agent(run_id=run_id, input_text=input_text)
+            try:
+                plan = await self._run_agent(run_id=run_id, input_text=input_text)
 
-            await self.on_answer(run_id=run_id, answer=plan, kwargs={})
-            return plan
+                await self.on_answer(run_id=run_id, answer=plan, kwargs={})
+                return plan
+            finally:
+                await self.on_run_end(run_id=run_id, kwargs={})
 
         return run_async_in_executor(_run)
 
@@ -828,10 +856,13 @@ class TinyMAPAgent(TinyBaseAgent):
         self.setup(reset=reset, history=history, checkpoint_id=checkpoint_id)
 
         async def _generator():
-            plan = await self._run_agent(run_id=run_id, input_text=input_text)
+            try:
+                plan = await self._run_agent(run_id=run_id, input_text=input_text)
 
-            await self.on_answer_chunk(run_id=run_id, chunk=plan, idx='0', kwargs={})
-            yield plan
+                await self.on_answer_chunk(run_id=run_id, chunk=plan, idx='0', kwargs={})
+                yield plan
+            finally:
+                await self.on_run_end(run_id=run_id, kwargs={})
 
         return _generator()
 
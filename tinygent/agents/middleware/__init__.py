@@ -1,21 +1,53 @@
 from .base import TinyBaseMiddleware
 from .base import register_middleware
+from .base_tool_selector import TinyToolGroup
+from .bm25_tool_selector import TinyBM25ToolSelectorMiddleware
+from .bm25_tool_selector import TinyBM25ToolSelectorMiddlewareConfig
+from .budget import BudgetExceededException
+from .budget import TinyBudgetMiddleware
+from .budget import TinyBudgetMiddlewareConfig
+from .context_compaction import TinyContextCompactionMiddleware
+from .context_compaction import TinyContextCompactionMiddlewareConfig
+from .duplicate_tool_call import TinyDuplicateToolCallMiddleware
+from .duplicate_tool_call import TinyDuplicateToolCallMiddlewareConfig
 from .llm_tool_selector import TinyLLMToolSelectorMiddleware
 from .llm_tool_selector import TinyLLMToolSelectorMiddlewareConfig
+from .profiler import TinyProfilerMiddleware
+from .profiler import TinyProfilerMiddlewareConfig
+from .tool_cache import TinyToolCacheMiddleware
+from .tool_cache import TinyToolCacheMiddlewareConfig
 from .tool_limiter import TinyToolCallLimiterMiddleware
 from .tool_limiter import TinyToolCallLimiterMiddlewareConfig
 from .tool_limiter import ToolCallBlockedException
+from .tool_rate_limiter import TinyToolRateLimiterMiddleware
+from .tool_rate_limiter import TinyToolRateLimiterMiddlewareConfig
 from .vector_tool_selector import TinyVectorToolSelectorMiddleware
 from .vector_tool_selector import TinyVectorToolSelectorMiddlewareConfig
 
 __all__ = [
     'TinyBaseMiddleware',
     'register_middleware',
+    'TinyToolGroup',
     'ToolCallBlockedException',
+    'BudgetExceededException',
+    'TinyBM25ToolSelectorMiddleware',
+    'TinyBM25ToolSelectorMiddlewareConfig',
+    'TinyBudgetMiddleware',
+    'TinyBudgetMiddlewareConfig',
+    'TinyContextCompactionMiddleware',
+    'TinyContextCompactionMiddlewareConfig',
+    'TinyDuplicateToolCallMiddleware',
+    'TinyDuplicateToolCallMiddlewareConfig',
     'TinyLLMToolSelectorMiddleware',
     'TinyLLMToolSelectorMiddlewareConfig',
+    'TinyProfilerMiddleware',
+    'TinyProfilerMiddlewareConfig',
+    'TinyToolCacheMiddleware',
+    'TinyToolCacheMiddlewareConfig',
     'TinyToolCallLimiterMiddleware',
     'TinyToolCallLimiterMiddlewareConfig',
+    'TinyToolRateLimiterMiddleware',
+    'TinyToolRateLimiterMiddlewareConfig',
     'TinyVectorToolSelectorMiddleware',
     'TinyVectorToolSelectorMiddlewareConfig',
 ]
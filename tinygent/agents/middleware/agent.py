@@ -1,20 +1,105 @@
+from collections.abc import Callable
 from collections.abc import Sequence
 import inspect
 import logging
+import time
 from typing import Any
 
 from tinygent.agents.middleware.base import TinyBaseMiddleware
+from tinygent.agents.middleware.observer_queue import TinyObserverQueue
 from tinygent.core.datamodels.middleware import AbstractMiddleware
 from tinygent.core.datamodels.tool import AbstractTool
+from tinygent.core.telemetry.phases import get_phase_clock
 from tinygent.core.types.io.llm_io_input import TinyLLMInput
 
 logger = logging.getLogger(__name__)
 
 
+_HOOK_NAMES: tuple[str, ...] = (
+    'before_llm_call',
+    'after_llm_call',
+    'before_tool_call',
+    'after_tool_call',
+    'on_tool_chunk',
+    'on_plan',
+    'on_reasoning',
+    'on_tool_reasoning',
+    'on_answer',
+    'on_answer_chunk',
+    'on_error',
+    'on_run_end',
+)
+
+
+# (mutating handlers, observational handlers) of a single hook
+_HookHandlers = tuple[tuple[Callable[..., Any], ...], tuple[Callable[..., Any], ...]]
+
+
 class TinyMiddlewareAgent(TinyBaseMiddleware):
+    """Dispatches agent hooks to the attached middleware.
+
+    Assigning `middleware` compiles a dispatch table holding, per hook name,
+    the bound methods of the middleware that actually override that hook,
+    split into mutating and observational handlers. Hook invocations await
+    the mutating handlers in order, then hand the observational ones to a
+    background `TinyObserverQueue`, and return immediately when no middleware
+    handles the hook. The queue is flushed when a run ends.
+
+    The table is rebuilt only when `middleware` is reassigned; mutating the
+    assigned sequence in place is not picked up.
+    """
+
+    _middleware: Sequence[AbstractMiddleware] = ()
+    _dispatch_table: dict[str, _HookHandlers]
+    _observer_queue: TinyObserverQueue | None = None
+
     def __init__(self, middleware: Sequence[AbstractMiddleware]) -> None:
         self.middleware = middleware
 
+    @property
+    def middleware(self) -> Sequence[AbstractMiddleware]:
+        return self._middleware
+
+    @middleware.setter
+    def middleware(self, middleware: Sequence[AbstractMiddleware]) -> None:
+        self._middleware = middleware
+        self._dispatch_table = self._compile_dispatch_table(middleware)
+
+    @property
+    def observer_queue(self) -> TinyObserverQueue:
+        """Queue running the observational hooks of the attached middleware."""
+        if self._observer_queue is None:
+            self._observer_queue = TinyObserverQueue()
+        return self._observer_queue
+
+    @classmethod
+    def _compile_dispatch_table(
+        cls, middleware: Sequence[AbstractMiddleware]
+    ) -> dict[str, _HookHandlers]:
+        for m in middleware:
+            unknown = set(getattr(m, 'observational_hooks', ())) - set(_HOOK_NAMES)
+            if unknown:
+                raise ValueError(
+                    f'{m.__class__.__name__} declares unknown observational hooks: '
+                    f'{sorted(unknown)}'
+                )
+
+        table: dict[str, _HookHandlers] = {}
+        for name in _HOOK_NAMES:
+            mutating: list[Callable[..., Any]] = []
+            observational: list[Callable[..., Any]] = []
+            for m in middleware:
+                if not cls._overrides(m, name):
+                    continue
+                if name in getattr(m, 'observational_hooks', ()):
+                    observational.append(getattr(m, name))
+                else:
+                    mutating.append(getattr(m, name))
+
+            if mutating or observational:
+                table[name] = (tuple(mutating), tuple(observational))
+        return table
+
     @staticmethod
     def _overrides(m: AbstractMiddleware, name: str) -> bool:
         base_attr = getattr(TinyBaseMiddleware, name, None)
@@ -22,17 +107,36 @@ class TinyMiddlewareAgent(TinyBaseMiddleware):
             raise AttributeError(f'{name!r} is not a method of TinyBaseMiddleware')
         return getattr(m.__class__, name) is not base_attr
 
+    def handles(self, name: str) -> bool:
+        """Return whether any attached middleware handles the given hook."""
+        return name in self._dispatch_table
+
     async def _dispatch(self, name: str, **kwargs: Any) -> None:
         """Dispatch hook to all middleware. Middleware can mutate the kwargs dict in-place."""
-        for m in self.middleware:
-            if not self._overrides(m, name):
-                continue
+        handlers = self._dispatch_table.get(name)
+        if handlers is None:
+            return
 
-            fn = getattr(m, name)
+        mutating, observational = handlers
+        for fn in mutating:
+            started = time.perf_counter()
             result = fn(**kwargs)
 
             if inspect.isawaitable(result):
                 await result
+            # looked up per handler, a profiler may start the clock in its hook
+            if (clock := get_phase_clock()) is not None:
+                clock.add('middleware', time.perf_counter() - started)
+
+        if observational:
+            queue = self.observer_queue
+            for fn in observational:
+                queue.submit(fn, kwargs)
+
+    async def flush_observers(self) -> None:
+        """Wait until all pending observational hooks have finished."""
+        if self._observer_queue is not None:
+            await self._observer_queue.flush()
 
     async def before_llm_call(
         self, *, run_id: str, llm_input: TinyLLMInput, kwargs: dict[str, Any]
@@ -94,6 +198,24 @@ class TinyMiddlewareAgent(TinyBaseMiddleware):
             kwargs=kwargs,
         )
 
+    async def on_tool_chunk(
+        self,
+        *,
+        run_id: str,
+        tool: AbstractTool,
+        chunk: Any,
+        idx: str,
+        kwargs: dict[str, Any],
+    ) -> None:
+        await self._dispatch(
+            'on_tool_chunk',
+            run_id=run_id,
+            tool=tool,
+            chunk=chunk,
+            idx=idx,
+            kwargs=kwargs,
+        )
+
     async def on_plan(self, *, run_id: str, plan: str, kwargs: dict[str, Any]) -> None:
         await self._dispatch(
             'on_plan',
@@ -152,3 +274,12 @@ class TinyMiddlewareAgent(TinyBaseMiddleware):
             e=e,
             kwargs=kwargs,
         )
+
+    async def on_run_end(self, *, run_id: str, kwargs: dict[str, Any]) -> None:
+        await self._dispatch(
+            'on_run_end',
+            run_id=run_id,
+            kwargs=kwargs,
+        )
+        # `run` closes its event loop afterwards, pending observers would be lost
+        await self.flush_observers()
@@ -1,4 +1,5 @@
 from typing import Any
+from typing import ClassVar
 from typing import Generic
 from typing import TypeVar
 
@@ -26,9 +27,36 @@ class TinyBaseMiddleware(AbstractMiddleware):
     """Base class for agent middleware.
 
     Middleware can mutate the kwargs dict in-place to override/add parameters
-    that will be visible to subsequent middleware and the agent.
+    that will be visible to subsequent middleware and the agent. Tool hooks
+    get the id of the tool call in `kwargs['tool_call_id']`. Setting
+    `kwargs['tool_result']` in `before_tool_call` provides the tool result and
+    skips the tool execution; setting `kwargs['tool_result_content']` in
+    `after_tool_call` replaces the content added to the conversation, and
+    `kwargs['tool_result_blob']` (a `TinyBlobHandle`) tells the agent the full
+    result is already kept in a blob store, so it is not stored a second time.
+    Setting `kwargs['llm']` in `before_llm_call` sends the call to another LLM.
+    After a streamed LLM call, `kwargs['stream_chunks']` holds the received
+    chunks and `kwargs['stream_ttft']` the seconds until the first chunk
+    arrived. After every LLM call, `kwargs['llm_model']` holds the model name
+    of the called LLM, when it has one, and `kwargs['token_usage']` the
+    (input, output) token counts reported by the provider, or None.
+
+    Hooks listed in `observational_hooks` only observe the event (logging,
+    metrics, exporters). They are not awaited by the agent; they run on a
+    bounded background queue after all mutating hooks of the event finished,
+    and their failures are logged instead of propagated.
+
+    Tools returned by `provided_tools` (e.g. for reading content the middleware
+    moved out of the conversation) are added to the agent the middleware is
+    attached to, unless the agent already has a tool of the same name.
     """
 
+    observational_hooks: ClassVar[frozenset[str]] = frozenset()
+
+    def provided_tools(self) -> list[AbstractTool]:
+        """Return the tools the agent needs for this middleware to work."""
+        return []
+
     async def before_llm_call(
         self, *, run_id: str, llm_input: TinyLLMInput, kwargs: dict[str, Any]
     ) -> None:
@@ -65,6 +93,17 @@ class TinyBaseMiddleware(AbstractMiddleware):
     ) -> None:
         pass
 
+    async def on_tool_chunk(
+        self,
+        *,
+        run_id: str,
+        tool: AbstractTool,
+        chunk: Any,
+        idx: str,
+        kwargs: dict[str, Any],
+    ) -> None:
+        pass
+
     async def on_plan(self, *, run_id: str, plan: str, kwargs: dict[str, Any]) -> None:
         pass
 
@@ -93,6 +132,9 @@ class TinyBaseMiddleware(AbstractMiddleware):
     ) -> None:
         pass
 
+    async def on_run_end(self, *, run_id: str, kwargs: dict[str, Any]) -> None:
+        pass
+
 
 def register_middleware(name: str):
     def decorator(cls: type[T]) -> type[T]:
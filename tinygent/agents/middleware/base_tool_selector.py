@@ -9,14 +9,37 @@ from pydantic import Field
 
 from tinygent.agents.middleware.base import TinyBaseMiddleware
 from tinygent.agents.middleware.base import TinyBaseMiddlewareConfig
+from tinygent.core.datamodels.messages import TinyHumanMessage
 from tinygent.core.datamodels.tool import AbstractTool
 from tinygent.core.datamodels.tool import AbstractToolConfig
+from tinygent.core.telemetry.otel import set_tiny_attributes
+from tinygent.core.types.base import TinyModel
+from tinygent.core.types.io.llm_io_input import TinyLLMInput
+from tinygent.utils.bm25 import BM25Index
+from tinygent.utils.bm25 import tokenize
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T', bound='TinyBaseToolSelectorMiddleware')
 
 
+class TinyToolGroup(TinyModel):
+    """Named group of tools with a short summary used for group-level selection."""
+
+    name: str
+
+    summary: str = Field(default='')
+
+    tools: list[str] = Field(default_factory=list)
+
+
+@dataclass
+class _GroupIndex:
+    groups: list[TinyToolGroup]
+    index: BM25Index
+    grouped_tools: set[str]
+
+
 @dataclass
 class ToolSelectorCandidates:
     selected_tools: set[AbstractTool]
@@ -38,6 +61,12 @@ class TinyBaseToolSelectorMiddlewareConfig(
         default=None
     )
 
+    tool_groups: list[TinyToolGroup] | None = Field(default=None)
+
+    group_separator: str | None = Field(default=None)
+
+    max_groups: int = Field(default=3)
+
     def build_base_kwargs(self) -> dict:
         from tinygent.core.factory import build_tool
 
@@ -52,17 +81,40 @@ class TinyBaseToolSelectorMiddlewareConfig(
         return {
             'max_tools': self.max_tools,
             'always_include': always_include,
+            'tool_groups': self.tool_groups,
+            'group_separator': self.group_separator,
+            'max_groups': self.max_groups,
         }
 
 
 class TinyBaseToolSelectorMiddleware(TinyBaseMiddleware):
+    """Base class for middleware narrowing the tools passed to the LLM.
+
+    For very large catalogs tools can be organised into groups, either listed
+    explicitly in ``tool_groups`` or derived from tool name namespaces split on
+    ``group_separator`` (e.g. ``github.create_issue`` with separator ``.``).
+    Selection then runs in two stages: the ``max_groups`` groups most relevant
+    to the query are picked first with a cheap lexical search over group names
+    and summaries, and only tools of those groups (plus ungrouped tools) are
+    ranked by the selector. Subclasses can override ``_select_groups``.
+    """
+
     def __init__(
         self,
         max_tools: int | None = None,
         always_include: list[AbstractTool] | None = None,
+        tool_groups: list[TinyToolGroup] | None = None,
+        group_separator: str | None = None,
+        max_groups: int = 3,
     ) -> None:
         self.max_tools = max_tools
         self.always_include = always_include
+        self.tool_groups = tool_groups
+        self.group_separator = group_separator
+        self.max_groups = max_groups
+
+        self._group_index: _GroupIndex | None = None
+        self._group_index_key: tuple[str, ...] | None = None
 
         if always_include and max_tools and len(always_include) > max_tools:
             logger.warning(
@@ -116,3 +168,105 @@ class TinyBaseToolSelectorMiddleware(TinyBaseMiddleware):
             remaining_tools=[t for t in tools if t not in selected_tools],
             remaining_space=remaining_space,
         )
+
+    async def _aprepare_candidates(
+        self, llm_input: TinyLLMInput, kwargs: dict[str, Any]
+    ) -> ToolSelectorCandidates | None:
+        """Like `_prepare_candidates`, narrowing remaining tools to selected groups."""
+        candidates = self._prepare_candidates(kwargs)
+        if candidates is None or not (self.tool_groups or self.group_separator):
+            return candidates
+
+        group_index = self._get_group_index(candidates.remaining_tools)
+        if len(group_index.groups) <= self.max_groups:
+            return candidates
+
+        groups = await self._select_groups(llm_input, group_index)
+        if not groups:
+            return candidates
+
+        allowed = {name for g in groups for name in g.tools}
+        candidates.remaining_tools = [
+            t
+            for t in candidates.remaining_tools
+            if t.info.name in allowed or t.info.name not in group_index.grouped_tools
+        ]
+
+        set_tiny_attributes(
+            {
+                'tool_selector.selected_groups': [g.name for g in groups],
+                'tool_selector.group_candidates.total': len(candidates.remaining_tools),
+            }
+        )
+        return candidates
+
+    async def _select_groups(
+        self, llm_input: TinyLLMInput, group_index: _GroupIndex
+    ) -> list[TinyToolGroup]:
+        """Pick up to `max_groups` groups matching the last human message.
+
+        Returns an empty list when no group matches, so no narrowing is done.
+        """
+        query = next(
+            (
+                m.content
+                for m in reversed(llm_input.messages)
+                if isinstance(m, TinyHumanMessage)
+            ),
+            '',
+        )
+        scores = group_index.index.score(query)
+        top = scores.argsort()[::-1][: self.max_groups]
+        return [group_index.groups[i] for i in top if scores[i] > 0]
+
+    def _get_group_index(self, tools: list[AbstractTool]) -> _GroupIndex:
+        key = tuple(t.info.name for t in tools)
+        if self._group_index is not None and self._group_index_key == key:
+            return self._group_index
+
+        groups = self._resolve_groups(tools)
+        logger.debug('Building tool group index for %d groups', len(groups))
+        self._group_index = _GroupIndex(
+            groups=groups,
+            index=BM25Index(
+                [
+                    tokenize(g.name) * 2
+                    + tokenize(g.summary)
+                    + [token for name in g.tools for token in tokenize(name)]
+                    for g in groups
+                ]
+            ),
+            grouped_tools={name for g in groups for name in g.tools},
+        )
+        self._group_index_key = key
+        return self._group_index
+
+    def _resolve_groups(self, tools: list[AbstractTool]) -> list[TinyToolGroup]:
+        available = {t.info.name for t in tools}
+        groups = [
+            g.model_copy(update={'tools': [n for n in g.tools if n in available]})
+            for g in self.tool_groups or []
+        ]
+        assigned = {name for g in groups for name in g.tools}
+
+        if self.group_separator:
+            namespaces: dict[str, list[AbstractTool]] = {}
+            for t in tools:
+                if t.info.name in assigned or self.group_separator not in t.info.name:
+                    continue
+                namespace = t.info.name.split(self.group_separator, 1)[0]
+                namespaces.setdefault(namespace, []).append(t)
+
+            for namespace, members in namespaces.items():
+                groups.append(
+                    TinyToolGroup(
+                        name=namespace,
+                        # first sentence of every member describes the namespace
+                        summary=' '.join(
+                            (t.info.description or '').split('.', 1)[0] for t in members
+                        ),
+                        tools=[t.info.name for t in members],
+                    )
+                )
+
+        return [g for g in groups if g.tools]
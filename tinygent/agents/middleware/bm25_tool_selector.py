@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+import logging
+from typing import Any
+from typing import Literal
+
+import numpy as np
+from pydantic import Field
+
+from tinygent.agents.middleware.base_tool_selector import TinyBaseToolSelectorMiddleware
+from tinygent.agents.middleware.base_tool_selector import (
+    TinyBaseToolSelectorMiddlewareConfig,
+)
+from tinygent.agents.middleware.base_tool_selector import TinyToolGroup
+from tinygent.core.datamodels.messages import TinyHumanMessage
+from tinygent.core.datamodels.middleware import AbstractMiddleware
+from tinygent.core.datamodels.middleware import AbstractMiddlewareConfig
+from tinygent.core.datamodels.tool import AbstractTool
+from tinygent.core.telemetry.decorators import tiny_trace
+from tinygent.core.telemetry.otel import set_tiny_attributes
+from tinygent.core.types.io.llm_io_input import TinyLLMInput
+from tinygent.utils.bm25 import BM25Index
+from tinygent.utils.bm25 import tokenize
+
+logger = logging.getLogger(__name__)
+
+
+class TinyBM25ToolSelectorMiddlewareConfig(
+    TinyBaseToolSelectorMiddlewareConfig['TinyBM25ToolSelectorMiddleware']
+):
+    """Configuration for BM25ToolSelector Middleware."""
+
+    type: Literal['bm25_tool_selector'] = Field(
+        default='bm25_tool_selector', frozen=True
+    )
+
+    k1: float = Field(default=1.5)
+
+    b: float = Field(default=0.75)
+
+    min_score: float = Field(default=0.0)
+
+    query_transform_fn: Callable[[TinyLLMInput], str] | None = Field(default=None)
+
+    next_stage: AbstractMiddlewareConfig | AbstractMiddleware | None = Field(
+        default=None
+    )
+
+    def build(self) -> TinyBM25ToolSelectorMiddleware:
+        from tinygent.core.factory.middleware import build_middleware
+
+        return TinyBM25ToolSelectorMiddleware(
+            k1=self.k1,
+            b=self.b,
+            min_score=self.min_score,
+            query_transform_fn=self.query_transform_fn,
+            next_stage=build_middleware(self.next_stage) if self.next_stage else None,
+            **self.build_base_kwargs(),
+        )
+
+
+class TinyBM25ToolSelectorMiddleware(TinyBaseToolSelectorMiddleware):
+    """Middleware that selects relevant tools using BM25 lexical search.
+
+    An inverted index over tool names, descriptions and argument schemas is built
+    once per tool set. Before each LLM call the latest human message is scored
+    against it locally, without any embedding or LLM call, and only tools scoring
+    above ``min_score`` (up to ``max_tools``) are forwarded to the main agent. If no
+    tool matches the query at all, the tool list is left unchanged.
+
+    When ``next_stage`` is set, BM25 acts as a cheap first stage: its top
+    ``max_tools`` candidates are handed to the next selector (e.g. a vector or LLM
+    selector), which makes the final choice over this much smaller set.
+
+    Args:
+        max_tools: Maximum number of tools to select (None = no limit). With
+            ``next_stage`` this is the number of candidates passed on.
+        always_include: Tools to always include regardless of score.
+        tool_groups: Explicit tool groups for two-stage selection.
+        group_separator: Separator deriving groups from tool name namespaces.
+        max_groups: Maximum number of groups whose tools are ranked.
+        k1: BM25 term frequency saturation parameter.
+        b: BM25 document length normalization parameter.
+        min_score: Minimum BM25 score for a tool to be selected.
+        query_transform_fn: Callable that extracts a query string from the
+            incoming ``TinyLLMInput``. Defaults to the content of the last
+            human message.
+        next_stage: Selector middleware run on the BM25 candidates.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_tools: int | None = None,
+        always_include: list[AbstractTool] | None = None,
+        tool_groups: list[TinyToolGroup] | None = None,
+        group_separator: str | None = None,
+        max_groups: int = 3,
+        k1: float = 1.5,
+        b: float = 0.75,
+        min_score: float = 0.0,
+        query_transform_fn: Callable[[TinyLLMInput], str] | None = None,
+        next_stage: AbstractMiddleware | None = None,
+    ) -> None:
+        super().__init__(
+            max_tools, always_include, tool_groups, group_separator, max_groups
+        )
+
+        if not query_transform_fn:
+
+            def _default_query_transform_fn(llm_input: TinyLLMInput) -> str:
+                for m in reversed(llm_input.messages):
+                    if isinstance(m, TinyHumanMessage):
+                        return m.content
+                return ''
+
+            query_transform_fn = _default_query_transform_fn
+
+        self.k1 = k1
+        self.b = b
+        self.min_score = min_score
+        self.query_transform_fn = query_transform_fn
+        self.next_stage = next_stage
+
+        self._index: BM25Index | None = None
+        self._index_key: tuple[tuple[str, str], ...] | None = None
+
+    @staticmethod
+    def _tool_document(tool: AbstractTool) -> list[str]:
+        info = tool.info
+        # the name is the strongest signal, so count it twice
+        tokens = tokenize(info.name) * 2 + tokenize(info.description or '')
+
+        if info.input_schema is not None:
+            for name, field in info.input_schema.model_fields.items():
+                tokens += tokenize(name)
+                if field.description:
+                    tokens += tokenize(field.description)
+        return tokens
+
+    def _get_index(self, tools: list[AbstractTool]) -> BM25Index:
+        key = tuple((t.info.name, t.info.description) for t in tools)
+        if self._index is None or self._index_key != key:
+            logger.debug('Building BM25 tool index for %d tools', len(tools))
+            self._index = BM25Index(
+                [self._tool_document(t) for t in tools], self.k1, self.b
+            )
+            self._index_key = key
+        return self._index
+
+    @tiny_trace('bm25_tool_selector.before_llm_call')
+    async def before_llm_call(
+        self, *, run_id: str, llm_input: TinyLLMInput, kwargs: dict[str, Any]
+    ) -> None:
+        candidates = await self._aprepare_candidates(llm_input, kwargs)
+
+        if candidates is None:
+            return
+
+        tools = candidates.tools
+        remaining_tools = candidates.remaining_tools
+        selected_tools = candidates.selected_tools
+
+        query = self.query_transform_fn(llm_input)
+        scores = self._get_index(remaining_tools).score(query)
+
+        n = len(remaining_tools)
+        k = (
+            n
+            if candidates.remaining_space is None
+            else min(candidates.remaining_space, n)
+        )
+        top = np.argpartition(-scores, k - 1)[:k] if 0 < k < n else np.arange(k)
+        top = top[np.argsort(-scores[top], kind='stable')]
+        matched = [remaining_tools[i] for i in top if scores[i] > self.min_score]
+
+        set_tiny_attributes(
+            {
+                'bm25_tool_selector.available_tools.total': len(tools),
+                'bm25_tool_selector.query': query,
+                'bm25_tool_selector.matched_tools': [t.info.name for t in matched],
+            }
+        )
+
+        if matched:
+            selected_tools.update(matched)
+            kwargs['tools'] = list(selected_tools)
+        else:
+            logger.debug('No tool matched query lexically, keeping all tools')
+
+        if self.next_stage is not None:
+            await self.next_stage.before_llm_call(
+                run_id=run_id, llm_input=llm_input, kwargs=kwargs
+            )
@@ -0,0 +1,355 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from dataclasses import field
+import logging
+import threading
+import time
+from typing import Any
+from typing import Literal
+
+from pydantic import BaseModel
+from pydantic import Field
+
+from tinygent.agents.middleware.base import TinyBaseMiddleware
+from tinygent.agents.middleware.base import TinyBaseMiddlewareConfig
+from tinygent.core.datamodels.llm import AbstractLLM
+from tinygent.core.datamodels.llm import AbstractLLMConfig
+from tinygent.core.datamodels.messages import TinySystemMessage
+from tinygent.core.factory.llm import build_llm
+from tinygent.core.telemetry.decorators import tiny_trace
+from tinygent.core.telemetry.otel import set_tiny_attributes
+from tinygent.core.types.io.llm_io_chunks import TinyLLMResultChunk
+from tinygent.core.types.io.llm_io_input import TinyLLMInput
+from tinygent.core.types.io.llm_io_result import TinyLLMResult
+from tinygent.utils.tokens import approx_token_count
+
+logger = logging.getLogger(__name__)
+
+
+class BudgetExceededException(Exception):
+    """Raised when a run or tenant has used up its token or cost budget."""
+
+
+@dataclass
+class TinyBudgetUsage:
+    """Cumulative LLM usage of a run or tenant."""
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost: float = 0.0
+    llm_calls: int = 0
+    estimated_calls: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def total_tokens(self) -> int:
+        return self.input_tokens + self.output_tokens
+
+    def add(
+        self, input_tokens: int, output_tokens: int, cost: float, estimated: bool
+    ) -> None:
+        self.input_tokens += input_tokens
+        self.output_tokens += output_tokens
+        self.cost += cost
+        self.llm_calls += 1
+        if estimated:
+            self.estimated_calls += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'input_tokens': self.input_tokens,
+            'output_tokens': self.output_tokens,
+            'total_tokens': self.total_tokens,
+            'cost': self.cost,
+            'llm_calls': self.llm_calls,
+            'estimated_calls': self.estimated_calls,
+        }
+
+
+# process-wide tenant usage shared by all budget middleware instances
+_TENANT_USAGE: dict[str, TinyBudgetUsage] = {}
+_TENANT_USAGE_LOCK = threading.Lock()
+
+
+def get_tenant_usage(tenant_id: str) -> dict[str, Any] | None:
+    """Return the usage recorded for the tenant in the current window."""
+    with _TENANT_USAGE_LOCK:
+        usage = _TENANT_USAGE.get(tenant_id)
+        return usage.to_dict() if usage else None
+
+
+def reset_tenant_usage(tenant_id: str | None = None) -> None:
+    """Forget the recorded usage of a tenant, or of all tenants."""
+    with _TENANT_USAGE_LOCK:
+        if tenant_id is None:
+            _TENANT_USAGE.clear()
+        else:
+            _TENANT_USAGE.pop(tenant_id, None)
+
+
+class TinyBudgetMiddlewareConfig(TinyBaseMiddlewareConfig['TinyBudgetMiddleware']):
+    """Configuration for Budget Middleware."""
+
+    type: Literal['budget'] = Field(default='budget', frozen=True)
+
+    max_tokens: int | None = Field(default=None)
+
+    max_cost: float | None = Field(default=None)
+
+    tenant_id: str | None = Field(default=None)
+
+    tenant_max_tokens: int | None = Field(default=None)
+
+    tenant_max_cost: float | None = Field(default=None)
+
+    tenant_window: float | None = Field(default=None)
+
+    model_prices: dict[str, tuple[float, float]] = Field(default_factory=dict)
+
+    default_prices: tuple[float, float] = Field(default=(0.0, 0.0))
+
+    soft_limit: float = Field(default=0.8)
+
+    fallback_llm: AbstractLLMConfig | AbstractLLM | None = Field(default=None)
+
+    force_final_answer: bool = Field(default=True)
+
+    token_counter: Callable[[str], int] | None = Field(default=None)
+
+    def build(self) -> TinyBudgetMiddleware:
+        fallback_llm = self.fallback_llm
+        if fallback_llm is not None and not isinstance(fallback_llm, AbstractLLM):
+            fallback_llm = build_llm(fallback_llm)
+
+        return TinyBudgetMiddleware(
+            max_tokens=self.max_tokens,
+            max_cost=self.max_cost,
+            tenant_id=self.tenant_id,
+            tenant_max_tokens=self.tenant_max_tokens,
+            tenant_max_cost=self.tenant_max_cost,
+            tenant_window=self.tenant_window,
+            model_prices=self.model_prices,
+            default_prices=self.default_prices,
+            soft_limit=self.soft_limit,
+            fallback_llm=fallback_llm,
+            force_final_answer=self.force_final_answer,
+            token_counter=self.token_counter,
+        )
+
+
+class TinyBudgetMiddleware(TinyBaseMiddleware):
+    """Middleware enforcing token and cost budgets per run and per tenant.
+
+    After every LLM call the token usage reported by the provider
+    (`kwargs['token_usage']`) is added to the run and, with `tenant_id`, to a
+    process-wide tenant budget. Calls without reported usage are estimated
+    with `token_counter`. The cost is computed from
+    `model_prices`, mapping model names to USD per million input and output
+    tokens (the longest matching name prefix wins).
+
+    When a budget reaches `soft_limit` (a fraction of the cap) the agent
+    degrades gracefully:
+    - calls are sent to `fallback_llm` (e.g. a cheaper model), if given
+    - with `force_final_answer`, the LLM is told to answer with the information
+      gathered so far
+
+    Once a budget is used up, the next LLM call raises
+    `BudgetExceededException`, which stops the run.
+
+    Args:
+        max_tokens: Maximum input + output tokens per run (None = unlimited)
+        max_cost: Maximum cost per run in USD (None = unlimited)
+        tenant_id: Tenant whose shared budget the runs draw from
+        tenant_max_tokens: Maximum tokens per tenant and window
+        tenant_max_cost: Maximum cost per tenant and window in USD
+        tenant_window: Tenant budget window in seconds (None = process lifetime)
+        model_prices: Model names mapped to (input, output) USD per 1M tokens
+        default_prices: Prices of models missing in `model_prices`
+        soft_limit: Fraction of a budget after which the agent degrades
+        fallback_llm: LLM used once the soft limit is reached
+        force_final_answer: Ask for the final answer once the soft limit is reached
+        token_counter: Counts tokens of a text when usage is not reported
+    """
+
+    def __init__(
+        self,
+        *,
+        max_tokens: int | None = None,
+        max_cost: float | None = None,
+        tenant_id: str | None = None,
+        tenant_max_tokens: int | None = None,
+        tenant_max_cost: float | None = None,
+        tenant_window: float | None = None,
+        model_prices: dict[str, tuple[float, float]] | None = None,
+        default_prices: tuple[float, float] = (0.0, 0.0),
+        soft_limit: float = 0.8,
+        fallback_llm: AbstractLLM | None = None,
+        force_final_answer: bool = True,
+        token_counter: Callable[[str], int] | None = None,
+    ) -> None:
+        if not 0 < soft_limit <= 1:
+            raise ValueError('soft_limit must be in (0, 1].')
+
+        self.max_tokens = max_tokens
+        self.max_cost = max_cost
+        self.tenant_id = tenant_id
+        self.tenant_max_tokens = tenant_max_tokens
+        self.tenant_max_cost = tenant_max_cost
+        self.tenant_window = tenant_window
+        self.model_prices = model_prices or {}
+        self.default_prices = default_prices
+        self.soft_limit = soft_limit
+        self.fallback_llm = fallback_llm
+        self.force_final_answer = force_final_answer
+        self.token_counter = token_counter or approx_token_count
+
+        self.run_usage: dict[str, TinyBudgetUsage] = {}
+
+    def _tenant_usage(self) -> TinyBudgetUsage | None:
+        """Return the tenant usage, starting a new window when the old one ended."""
+        if self.tenant_id is None:
+            return None
+
+        with _TENANT_USAGE_LOCK:
+            usage = _TENANT_USAGE.get(self.tenant_id)
+            if usage is None or (
+                self.tenant_window is not None
+                and time.monotonic() - usage.started_at >= self.tenant_window
+            ):
+                usage = _TENANT_USAGE[self.tenant_id] = TinyBudgetUsage()
+            return usage
+
+    @staticmethod
+    def _ratio(usage: TinyBudgetUsage, tokens: int | None, cost: float | None) -> float:
+        ratios = [0.0]
+        if tokens is not None:
+            ratios.append(usage.total_tokens / tokens if tokens > 0 else 1.0)
+        if cost is not None:
+            ratios.append(usage.cost / cost if cost > 0 else 1.0)
+        return max(ratios)
+
+    def _budget_ratio(self, run_id: str) -> tuple[float, str]:
+        """Return the highest fraction of a budget used and the budget's name."""
+        ratio, name = 0.0, 'run'
+        if run_usage := self.run_usage.get(run_id):
+            ratio = self._ratio(run_usage, self.max_tokens, self.max_cost)
+
+        if tenant_usage := self._tenant_usage():
+            tenant_ratio = self._ratio(
+                tenant_usage, self.tenant_max_tokens, self.tenant_max_cost
+            )
+            if tenant_ratio > ratio:
+                ratio, name = tenant_ratio, f'tenant "{self.tenant_id}"'
+        return ratio, name
+
+    def _prices(self, model: str | None) -> tuple[float, float]:
+        if model:
+            matches = [name for name in self.model_prices if model.startswith(name)]
+            if matches:
+                return self.model_prices[max(matches, key=len)]
+        return self.default_prices
+
+    def _estimate_output(self, result: Any, kwargs: dict[str, Any]) -> int:
+        chunks: list[TinyLLMResultChunk] | None = kwargs.get('stream_chunks')
+        if chunks is not None:
+            text = ''
+            for chunk in chunks:
+                if chunk.message is not None:
+                    text += chunk.message.content
+                if chunk.full_tool_call is not None:
+                    text += chunk.full_tool_call.tiny_str
+            return self.token_counter(text)
+
+        if isinstance(result, BaseModel):
+            return self.token_counter(result.model_dump_json())
+        return self.token_counter('' if result is None else str(result))
+
+    @tiny_trace('budget.before_llm_call')
+    async def before_llm_call(
+        self, *, run_id: str, llm_input: TinyLLMInput, kwargs: dict[str, Any]
+    ) -> None:
+        ratio, name = self._budget_ratio(run_id)
+        set_tiny_attributes({'budget.used_ratio': ratio, 'budget.budget': name})
+
+        if ratio >= 1:
+            logger.warning('Budget of %s exhausted, stopping run %s', name, run_id)
+            raise BudgetExceededException(
+                f'Token/cost budget of {name} exhausted for run {run_id}.'
+            )
+
+        if ratio < self.soft_limit:
+            return
+
+        logger.debug('Budget of %s at %.0f%%, degrading', name, ratio * 100)
+        if self.fallback_llm is not None:
+            kwargs['llm'] = self.fallback_llm
+
+        if self.force_final_answer:
+            llm_input.add_at_end(
+                TinySystemMessage(
+                    content=(
+                        f'IMPORTANT: {ratio:.0%} of the token budget has been used. '
+                        'Do not use any more tools unless strictly necessary and '
+                        'provide your final answer based on the information you '
+                        'have already gathered.'
+                    )
+                )
+            )
+
+    @tiny_trace('budget.after_llm_call')
+    async def after_llm_call(
+        self,
+        *,
+        run_id: str,
+        llm_input: TinyLLMInput,
+        result: Any,
+        kwargs: dict[str, Any],
+    ) -> None:
+        usage: tuple[int, int] | None = kwargs.get('token_usage')
+        estimated = usage is None
+        if usage is None:
+            input_tokens = self.token_counter(
+                '\n'.join(m.tiny_str for m in llm_input.messages)
+            )
+            usage = (input_tokens, self._estimate_output(result, kwargs))
+
+        model = kwargs.get('llm_model')
+        if isinstance(result, TinyLLMResult) and result.llm_output:
+            model = result.llm_output.get('model') or model
+        input_price, output_price = self._prices(model)
+        input_tokens, output_tokens = usage
+        cost = (input_tokens * input_price + output_tokens * output_price) / 1_000_000
+
+        self.run_usage.setdefault(run_id, TinyBudgetUsage()).add(
+            input_tokens, output_tokens, cost, estimated
+        )
+        if tenant_usage := self._tenant_usage():
+            with _TENANT_USAGE_LOCK:
+                tenant_usage.add(input_tokens, output_tokens, cost, estimated)
+
+        set_tiny_attributes(
+            {
+                'budget.input_tokens': input_tokens,
+                'budget.output_tokens': output_tokens,
+                'budget.cost': cost,
+                'budget.estimated': estimated,
+            }
+        )
+
+    @tiny_trace('budget.on_run_end')
+    async def on_run_end(self, *, run_id: str, kwargs: dict[str, Any]) -> None:
+        if usage := self.run_usage.pop(run_id, None):
+            logger.debug('Run %s used %s', run_id, usage.to_dict())
+
+    def get_stats(self, run_id: str | None = None) -> dict[str, Any]:
+        """Get the usage of a run (or all active runs) and of the tenant."""
+        return {
+            'runs': {
+                rid: usage.to_dict()
+                for rid, usage in self.run_usage.items()
+                if run_id is None or rid == run_id
+            },
+            'tenant': get_tenant_usage(self.tenant_id) if self.tenant_id else None,
+        }
@@ -0,0 +1,337 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+import logging
+import re
+from typing import Any
+from typing import Literal
+
+from pydantic import Field
+
+from tinygent.agents.middleware.base import TinyBaseMiddleware
+from tinygent.agents.middleware.base import TinyBaseMiddlewareConfig
+from tinygent.core.datamodels.messages import TinyToolCall
+from tinygent.core.datamodels.messages import TinyToolResult
+from tinygent.core.datamodels.tool import AbstractTool
+from tinygent.core.runtime.blob_store import TinyBlobHandle
+from tinygent.core.runtime.blob_store import TinyBlobStore
+from tinygent.core.runtime.blob_store import get_global_blob_store
+from tinygent.core.runtime.executors import run_sync_in_executor
+from tinygent.core.telemetry.decorators import tiny_trace
+from tinygent.core.telemetry.otel import set_tiny_attributes
+from tinygent.core.types.io.llm_io_input import TinyLLMInput
+from tinygent.tools.blob_tools import BLOB_TOOL_NAMES
+from tinygent.tools.blob_tools import blob_tools
+from tinygent.utils.tokens import approx_token_count
+
+logger = logging.getLogger(__name__)
+
+_COMPACTED_RE = re.compile(r'^\[Tool result compacted .*? blob "(blob_[0-9a-f]+)"')
+
+
+class TinyContextCompactionMiddlewareConfig(
+    TinyBaseMiddlewareConfig['TinyContextCompactionMiddleware']
+):
+    """Configuration for ContextCompaction Middleware."""
+
+    type: Literal['context_compaction'] = Field(
+        default='context_compaction', frozen=True
+    )
+
+    max_tokens: int = Field(default=2000)
+
+    head_chars: int = Field(default=2000)
+
+    tail_chars: int = Field(default=1000)
+
+    compact_after: int | None = Field(default=None)
+
+    aged_max_tokens: int = Field(default=500)
+
+    aged_head_chars: int = Field(default=600)
+
+    aged_tail_chars: int = Field(default=200)
+
+    exclude_tools: list[str] = Field(default_factory=list)
+
+    token_counter: Callable[[str], int] | None = Field(default=None)
+
+    summary_fn: Callable[[str], str] | None = Field(default=None)
+
+    def build(self) -> TinyContextCompactionMiddleware:
+        return TinyContextCompactionMiddleware(
+            max_tokens=self.max_tokens,
+            head_chars=self.head_chars,
+            tail_chars=self.tail_chars,
+            compact_after=self.compact_after,
+            aged_max_tokens=self.aged_max_tokens,
+            aged_head_chars=self.aged_head_chars,
+            aged_tail_chars=self.aged_tail_chars,
+            exclude_tools=self.exclude_tools,
+            token_counter=self.token_counter,
+            summary_fn=self.summary_fn,
+        )
+
+
+class TinyContextCompactionMiddleware(TinyBaseMiddleware):
+    """Middleware keeping oversized tool results out of the conversation.
+
+    Tool results above `max_tokens` are stored as blobs in a `TinyBlobStore`
+    and the conversation only receives a compact excerpt (the head and tail of
+    the result, or the output of `summary_fn`) together with the blob id. The
+    agent reads the full content on demand with the `read_blob` and
+    `grep_blob` tools, which are added to the tools of the agent the
+    middleware is attached to. Agents storing large results as blobs
+    themselves (`blob_threshold`) do not store compacted results again; give
+    both the same `blob_store`.
+
+    With `compact_after` set, older tool results are compacted as well: once
+    `compact_after` newer tool results follow them, results above
+    `aged_max_tokens` are shortened to a smaller excerpt in the LLM input.
+    The stored messages in memory are never modified.
+
+    Blobs are keyed by a hash of their content, so compacting the same result
+    again reuses its blob. They belong to the run which stored them and are
+    released when the agent is reset. When the store is full, results are
+    left uncompacted rather than losing their content. Aged results are
+    compacted once per run and reused on later LLM calls; results the agent
+    already replaced by a blob preview are left as they are.
+
+    Args:
+        max_tokens: Tool results above this many tokens are compacted
+        head_chars: Characters kept from the start of a compacted result
+        tail_chars: Characters kept from the end of a compacted result
+        compact_after: Compact results followed by this many newer tool results
+            (None = never compact older results)
+        aged_max_tokens: Older results above this many tokens are compacted
+        aged_head_chars: Characters kept from the start of an aged result
+        aged_tail_chars: Characters kept from the end of an aged result
+        exclude_tools: Names of tools whose results are never compacted
+        token_counter: Counts tokens of a text (default: ~4 characters per token)
+        summary_fn: Builds the excerpt of a result instead of head and tail
+        blob_store: Store of the full results (default: the process-wide store)
+    """
+
+    def __init__(
+        self,
+        *,
+        max_tokens: int = 2000,
+        head_chars: int = 2000,
+        tail_chars: int = 1000,
+        compact_after: int | None = None,
+        aged_max_tokens: int = 500,
+        aged_head_chars: int = 600,
+        aged_tail_chars: int = 200,
+        exclude_tools: list[str] | None = None,
+        token_counter: Callable[[str], int] | None = None,
+        summary_fn: Callable[[str], str] | None = None,
+        blob_store: TinyBlobStore | None = None,
+    ) -> None:
+        if compact_after is not None and compact_after < 1:
+            raise ValueError('compact_after must be at least 1.')
+
+        self.max_tokens = max_tokens
+        self.head_chars = head_chars
+        self.tail_chars = tail_chars
+        self.compact_after = compact_after
+        self.aged_max_tokens = aged_max_tokens
+        self.aged_head_chars = aged_head_chars
+        self.aged_tail_chars = aged_tail_chars
+        self.exclude_tools = {*BLOB_TOOL_NAMES, *(exclude_tools or [])}
+        self.token_counter = token_counter or approx_token_count
+        self.summary_fn = summary_fn
+        self.blob_store = blob_store or get_global_blob_store()
+
+        self.compacted: int = 0
+        self.aged_compacted: int = 0
+        self.tokens_saved: int = 0
+
+        # aged excerpts per run and tool call, with the content they replace
+        self._aged: dict[str, dict[str, tuple[str, str]]] = {}
+
+    def provided_tools(self) -> list[AbstractTool]:
+        return list(blob_tools(self.blob_store))
+
+    def compact(
+        self, run_id: str, content: str, head_chars: int, tail_chars: int
+    ) -> tuple[TinyBlobHandle, str] | None:
+        """Store the content as a blob; return its handle and excerpt.
+
+        Returns None when the blob store is full.
+        """
+        handle = self.blob_store.put(run_id, content)
+        if handle is None:
+            return None
+        return handle, self._render(content, handle, head_chars, tail_chars)
+
+    def _render(
+        self, content: str, handle: TinyBlobHandle, head_chars: int, tail_chars: int
+    ) -> str:
+        if self.summary_fn is not None:
+            excerpt = self.summary_fn(content)
+        elif len(content) <= head_chars + tail_chars:
+            excerpt = content
+        else:
+            omitted = len(content) - head_chars - tail_chars
+            excerpt = (
+                f'{content[:head_chars]}\n'
+                f'[... {omitted} characters omitted ...]\n'
+                f'{content[len(content) - tail_chars :] if tail_chars else ""}'
+            )
+
+        return (
+            f'[Tool result compacted from {len(content)} characters, stored as blob '
+            f'"{handle.blob_id}". Call read_blob(blob_id="{handle.blob_id}", page=N) '
+            f'with N from 1 to {handle.pages}, or grep_blob(blob_id="{handle.blob_id}", '
+            'pattern="...") to read the full content.]\n'
+            f'{excerpt}'
+        )
+
+    @tiny_trace('context_compaction.after_tool_call')
+    async def after_tool_call(
+        self,
+        *,
+        run_id: str,
+        tool: AbstractTool,
+        args: dict[str, Any],
+        result: Any,
+        kwargs: dict[str, Any],
+    ) -> None:
+        if tool.info.name in self.exclude_tools or 'tool_result_blob' in kwargs:
+            return
+
+        content = str(kwargs.get('tool_result_content', result))
+        tokens = self.token_counter(content)
+        if tokens <= self.max_tokens:
+            return
+
+        if self.blob_store.blocking:
+            stored = await run_sync_in_executor(
+                self.compact, run_id, content, self.head_chars, self.tail_chars
+            )
+        else:
+            stored = self.compact(run_id, content, self.head_chars, self.tail_chars)
+        if stored is None:
+            return
+
+        handle, compacted = stored
+        kwargs['tool_result_content'] = compacted
+        kwargs['tool_result_blob'] = handle
+
+        self.compacted += 1
+        self.tokens_saved += tokens - self.token_counter(compacted)
+        set_tiny_attributes(
+            {
+                'context_compaction.tool_name': tool.info.name,
+                'context_compaction.tokens': tokens,
+            }
+        )
+        logger.debug('Compacted %d token result of tool %s', tokens, tool.info.name)
+
+    @tiny_trace('context_compaction.before_llm_call')
+    async def before_llm_call(
+        self, *, run_id: str, llm_input: TinyLLMInput, kwargs: dict[str, Any]
+    ) -> None:
+        if self.compact_after is None:
+            return
+
+        tool_results = [
+            (i, m)
+            for i, m in enumerate(llm_input.messages)
+            if isinstance(m, TinyToolResult)
+        ]
+        aged = tool_results[: max(len(tool_results) - self.compact_after, 0)]
+
+        excluded_calls = {
+            m.call_id
+            for m in llm_input.messages
+            if isinstance(m, TinyToolCall) and m.tool_name in self.exclude_tools
+        }
+
+        done = self._aged.setdefault(run_id, {})
+        for i, message in aged:
+            if message.call_id in excluded_calls:
+                continue
+
+            previous = done.get(message.call_id)
+            if previous is not None and previous[0] == message.content:
+                # compacted on an earlier LLM call of the run
+                llm_input.messages[i] = message.model_copy(
+                    update={'content': previous[1]}
+                )
+                continue
+
+            compacted = await self._compact_aged(run_id, message)
+            if compacted is None:
+                continue
+            done[message.call_id] = (message.content, compacted)
+
+            # messages in the LLM input are copies, memory keeps the original
+            llm_input.messages[i] = message.model_copy(update={'content': compacted})
+
+            self.aged_compacted += 1
+            saved = self.token_counter(message.content) - self.token_counter(compacted)
+            self.tokens_saved += saved
+
+    async def _compact_aged(self, run_id: str, message: TinyToolResult) -> str | None:
+        content = message.content
+        if self.token_counter(content) <= self.aged_max_tokens:
+            return None
+
+        match = _COMPACTED_RE.match(content)
+        if match is None and 'blob_id' in message.metadata:
+            # already a blob preview written by the agent
+            return None
+
+        blocking = self.blob_store.blocking
+        if match is None:
+            if blocking:
+                stored = await run_sync_in_executor(
+                    self.compact,
+                    run_id,
+                    content,
+                    self.aged_head_chars,
+                    self.aged_tail_chars,
+                )
+            else:
+                stored = self.compact(
+                    run_id, content, self.aged_head_chars, self.aged_tail_chars
+                )
+            if stored is None:
+                return None
+            compacted = stored[1]
+        else:
+            # shorten a result compacted after the tool call from its stored
+            # original, which is already in the store
+            blob_id = match.group(1)
+            if blocking:
+                original = await run_sync_in_executor(self.blob_store.get, blob_id)
+            else:
+                original = self.blob_store.get(blob_id)
+            if original is None:
+                return None
+            handle = TinyBlobHandle(
+                blob_id=blob_id,
+                size=len(original),
+                lines=original.count('\n') + 1,
+                pages=max(-(-len(original) // self.blob_store.page_chars), 1),
+                preview='',
+            )
+            compacted = self._render(
+                original, handle, self.aged_head_chars, self.aged_tail_chars
+            )
+
+        if len(compacted) >= len(content):
+            return None
+        return compacted
+
+    async def on_run_end(self, *, run_id: str, kwargs: dict[str, Any]) -> None:
+        self._aged.pop(run_id, None)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get the number of compacted results and estimated tokens saved."""
+        return {
+            'compacted': self.compacted,
+            'aged_compacted': self.aged_compacted,
+            'tokens_saved': self.tokens_saved,
+        }
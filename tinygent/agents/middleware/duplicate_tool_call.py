@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import json
+import logging
+from typing import Any
+from typing import Literal
+
+from pydantic import Field
+
+from tinygent.agents.middleware.base import TinyBaseMiddleware
+from tinygent.agents.middleware.base import TinyBaseMiddlewareConfig
+from tinygent.core.datamodels.tool import AbstractTool
+from tinygent.core.runtime.tool_cache import canonical_arguments
+from tinygent.core.telemetry.decorators import tiny_trace
+from tinygent.core.telemetry.otel import set_tiny_attributes
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize_value(value: Any) -> Any:
+    if isinstance(value, str):
+        return ' '.join(value.split()).casefold()
+    if isinstance(value, dict):
+        return {k: _normalize_value(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_normalize_value(v) for v in value]
+    return value
+
+
+@dataclass
+class _LedgerEntry:
+    index: int
+    call_id: str | None
+    result: Any
+
+
+class TinyDuplicateToolCallMiddlewareConfig(
+    TinyBaseMiddlewareConfig['TinyDuplicateToolCallMiddleware']
+):
+    """Configuration for DuplicateToolCall Middleware."""
+
+    type: Literal['duplicate_tool_call'] = Field(
+        default='duplicate_tool_call', frozen=True
+    )
+
+    mode: Literal['result', 'reference'] = Field(default='reference')
+
+    normalize: bool = Field(default=False)
+
+    exclude_tools: list[str] = Field(default_factory=list)
+
+    def build(self) -> TinyDuplicateToolCallMiddleware:
+        return TinyDuplicateToolCallMiddleware(
+            mode=self.mode,
+            normalize=self.normalize,
+            exclude_tools=self.exclude_tools,
+        )
+
+
+class TinyDuplicateToolCallMiddleware(TinyBaseMiddleware):
+    """Middleware short-circuiting repeated tool calls within a run.
+
+    Every executed tool call is recorded in a per-run ledger keyed by the tool
+    name and its arguments. When the model issues the same call again, the
+    tool is not re-executed:
+    - mode="reference": the conversation only gets a short note pointing to
+      the earlier result by its tool call id, so the same large result is not
+      added twice (the result is repeated when the earlier call has no id)
+    - mode="result": the earlier result is returned again
+
+    Ledgers are dropped when the run ends.
+
+    Arguments are compared exactly by default. With `normalize`, they are
+    validated through the tool's input schema (coercing types, filling in
+    defaults) and string values are compared case- and whitespace-insensitively.
+
+    Tools with side effects, whose repeated calls are intentional, should be
+    listed in `exclude_tools`.
+
+    Args:
+        mode: Whether duplicates get a reference note or the earlier result
+        normalize: Compare normalized instead of exact arguments
+        exclude_tools: Names of tools that are never short-circuited
+    """
+
+    def __init__(
+        self,
+        *,
+        mode: Literal['result', 'reference'] = 'reference',
+        normalize: bool = False,
+        exclude_tools: list[str] | None = None,
+    ) -> None:
+        self.mode = mode
+        self.normalize = normalize
+        self.exclude_tools = set(exclude_tools or [])
+
+        self.ledgers: dict[str, dict[str, _LedgerEntry]] = {}
+        self.call_counts: dict[str, int] = {}
+        self.duplicates: int = 0
+
+    def _call_key(self, tool: AbstractTool, args: dict[str, Any]) -> str:
+        if not self.normalize:
+            return json.dumps(
+                [tool.info.name, args],
+                sort_keys=True,
+                separators=(',', ':'),
+                default=repr,
+            )
+
+        arguments = _normalize_value(json.loads(canonical_arguments(tool, args)))
+        return json.dumps(
+            [tool.info.name, arguments], sort_keys=True, separators=(',', ':')
+        )
+
+    @tiny_trace('duplicate_tool_call.before_tool_call')
+    async def before_tool_call(
+        self,
+        *,
+        run_id: str,
+        tool: AbstractTool,
+        args: dict[str, Any],
+        kwargs: dict[str, Any],
+    ) -> None:
+        index = self.call_counts[run_id] = self.call_counts.get(run_id, 0) + 1
+        if tool.info.name in self.exclude_tools or 'tool_result' in kwargs:
+            return
+
+        key = self._call_key(tool, args)
+        entry = self.ledgers.get(run_id, {}).get(key)
+        if entry is None:
+            kwargs['duplicate_call_key'] = (key, index, kwargs.get('tool_call_id'))
+            return
+
+        self.duplicates += 1
+        set_tiny_attributes(
+            {
+                'duplicate_tool_call.tool_name': tool.info.name,
+                'duplicate_tool_call.original_index': entry.index,
+            }
+        )
+        logger.debug(
+            'Duplicate tool call %s(%s), same as call #%d',
+            tool.info.name,
+            args,
+            entry.index,
+        )
+
+        kwargs['tool_result'] = entry.result
+        if self.mode == 'reference' and entry.call_id is not None:
+            kwargs['tool_result_content'] = (
+                f'Tool "{tool.info.name}" was already called with the same arguments '
+                f'in this run (tool call id "{entry.call_id}"). The result is '
+                'unchanged, see the result of that call instead of calling the '
+                'tool again.'
+            )
+
+    @tiny_trace('duplicate_tool_call.after_tool_call')
+    async def after_tool_call(
+        self,
+        *,
+        run_id: str,
+        tool: AbstractTool,
+        args: dict[str, Any],
+        result: Any,
+        kwargs: dict[str, Any],
+    ) -> None:
+        pending = kwargs.pop('duplicate_call_key', None)
+        if pending is None:
+            return
+
+        key, index, call_id = pending
+        self.ledgers.setdefault(run_id, {})[key] = _LedgerEntry(index, call_id, result)
+
+    @tiny_trace('duplicate_tool_call.on_run_end')
+    async def on_run_end(self, *, run_id: str, kwargs: dict[str, Any]) -> None:
+        self.ledgers.pop(run_id, None)
+        self.call_counts.pop(run_id, None)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get the number of short-circuited calls and active ledger sizes."""
+        return {
+            'duplicates': self.duplicates,
+            'ledgers': {run_id: len(ledger) for run_id, ledger in self.ledgers.items()},
+        }
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+from dataclasses import dataclass
+import hashlib
 import logging
+import time
 from typing import Any
 from typing import Literal
 
@@ -10,6 +14,7 @@ from tinygent.agents.middleware.base_tool_selector import TinyBaseToolSelectorMi
 from tinygent.agents.middleware.base_tool_selector import (
     TinyBaseToolSelectorMiddlewareConfig,
 )
+from tinygent.agents.middleware.base_tool_selector import TinyToolGroup
 from tinygent.core.datamodels.llm import AbstractLLM
 from tinygent.core.datamodels.llm import AbstractLLMConfig
 from tinygent.core.datamodels.messages import TinyHumanMessage
@@ -26,6 +31,15 @@ from tinygent.utils.jinja_utils import render_template
 
 logger = logging.getLogger(__name__)
 
+ReusePolicy = Literal['every_call', 'per_run', 'every_n_calls', 'on_context_change']
+
+
+@dataclass
+class _CachedSelection:
+    tool_names: list[str]
+    reuses: int
+    context_size: int
+
 
 class TinyLLMToolSelectorMiddlewareConfig(
     TinyBaseToolSelectorMiddlewareConfig['TinyLLMToolSelectorMiddleware']
@@ -40,10 +54,25 @@ class TinyLLMToolSelectorMiddlewareConfig(
         default_factory=get_llm_tool_selector_prompt_template
     )
 
+    reuse_policy: ReusePolicy = Field(default='every_call')
+
+    reuse_calls: int = Field(default=5)
+
+    context_change_ratio: float = Field(default=0.5)
+
+    cross_run_ttl: float | None = Field(default=None)
+
+    max_cached_selections: int = Field(default=256)
+
     def build(self) -> TinyLLMToolSelectorMiddleware:
         return TinyLLMToolSelectorMiddleware(
             llm=self.llm if isinstance(self.llm, AbstractLLM) else build_llm(self.llm),
             prompt_template=self.prompt_template,
+            reuse_policy=self.reuse_policy,
+            reuse_calls=self.reuse_calls,
+            context_change_ratio=self.context_change_ratio,
+            cross_run_ttl=self.cross_run_ttl,
+            max_cached_selections=self.max_cached_selections,
             **self.build_base_kwargs(),
         )
 
@@ -59,11 +88,31 @@ class TinyLLMToolSelectorMiddleware(TinyBaseToolSelectorMiddleware):
     The middleware can limit the number of selected tools and always include critical
     tools regardless of the selection process.
 
+    Selections are cached per (run, query fingerprint, tool-set hash) and reused
+    according to ``reuse_policy``:
+    - ``every_call``: select again before every LLM call (no reuse)
+    - ``per_run``: select once per run for each query and tool set
+    - ``every_n_calls``: reuse a selection for ``reuse_calls`` subsequent calls
+    - ``on_context_change``: reuse until the conversation grew by more than
+      ``context_change_ratio`` since the selection was made
+
+    With ``cross_run_ttl`` set, selections are also shared across runs with the
+    same query and tool set for that many seconds.
+
     Args:
         llm: LLM to use for tool selection (typically a fast, cost-effective model)
         prompt_template: Template for tool selection prompt (default provided)
         max_tools: Maximum number of tools to select (None = no limit)
         always_include: List of tools to always include in selection (None = no always-include list)
+        tool_groups: Explicit tool groups for two-stage selection
+        group_separator: Separator deriving groups from tool name namespaces
+        max_groups: Maximum number of groups whose tools are ranked (default: 3)
+        reuse_policy: When a cached selection is reused (default: every_call)
+        reuse_calls: Number of reuses for the ``every_n_calls`` policy
+        context_change_ratio: Relative context growth triggering a new selection
+            for the ``on_context_change`` policy
+        cross_run_ttl: Seconds a selection is shared across runs (None = disabled)
+        max_cached_selections: Maximum number of cached selections kept
     """
 
     def __init__(
@@ -73,12 +122,35 @@ class TinyLLMToolSelectorMiddleware(TinyBaseToolSelectorMiddleware):
         prompt_template: LLMToolSelectorPromptTemplate | None = None,
         max_tools: int | None = None,
         always_include: list[AbstractTool] | None = None,
+        tool_groups: list[TinyToolGroup] | None = None,
+        group_separator: str | None = None,
+        max_groups: int = 3,
+        reuse_policy: ReusePolicy = 'every_call',
+        reuse_calls: int = 5,
+        context_change_ratio: float = 0.5,
+        cross_run_ttl: float | None = None,
+        max_cached_selections: int = 256,
     ) -> None:
-        super().__init__(max_tools, always_include)
+        super().__init__(
+            max_tools, always_include, tool_groups, group_separator, max_groups
+        )
 
         self.llm = llm
         self.prompt_template = prompt_template or get_llm_tool_selector_prompt_template()
 
+        self.reuse_policy = reuse_policy
+        self.reuse_calls = reuse_calls
+        self.context_change_ratio = context_change_ratio
+        self.cross_run_ttl = cross_run_ttl
+        self.max_cached_selections = max_cached_selections
+
+        self._selections: OrderedDict[tuple[str, str, str], _CachedSelection] = (
+            OrderedDict()
+        )
+        self._shared_selections: OrderedDict[
+            tuple[str, str], tuple[list[str], float]
+        ] = OrderedDict()
+
     @staticmethod
     def _create_selection_model(tools: list[AbstractTool]) -> type[TinyModel]:
         tool_names = tuple(t.info.name for t in tools)
@@ -92,11 +164,122 @@ class TinyLLMToolSelectorMiddleware(TinyBaseToolSelectorMiddleware):
 
         return LocalSelectionModel
 
+    @staticmethod
+    def _fingerprint(*parts: str) -> str:
+        h = hashlib.blake2b(digest_size=16)
+        for part in parts:
+            h.update(part.encode())
+            h.update(b'\0')
+        return h.hexdigest()
+
+    @staticmethod
+    def _tool_line(tool: AbstractTool) -> str:
+        return (
+            f'{tool.info.name} - {tool.info.description or "Description not provided"}'
+        )
+
+    @staticmethod
+    def _context_size(llm_input: TinyLLMInput) -> int:
+        return sum(len(m.tiny_str) for m in llm_input.messages)
+
+    def _query_fingerprint(self, llm_input: TinyLLMInput) -> str:
+        for m in reversed(llm_input.messages):
+            if isinstance(m, TinyHumanMessage):
+                return self._fingerprint(m.content)
+        return self._fingerprint()
+
+    def _is_reusable(self, cached: _CachedSelection, llm_input: TinyLLMInput) -> bool:
+        if self.reuse_policy == 'every_call':
+            return False
+        if self.reuse_policy == 'every_n_calls':
+            return cached.reuses < self.reuse_calls
+        if self.reuse_policy == 'on_context_change':
+            grown = self._context_size(llm_input) - cached.context_size
+            return grown <= self.context_change_ratio * max(cached.context_size, 1)
+        return True
+
+    def _remember(self, cache: OrderedDict, key: Any, value: Any) -> None:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > self.max_cached_selections:
+            cache.popitem(last=False)
+
+    async def _get_selection(
+        self, run_id: str, llm_input: TinyLLMInput, tools: list[AbstractTool]
+    ) -> list[str]:
+        """Return names of the selected tools, reusing cached selections if allowed."""
+        query_fp = self._query_fingerprint(llm_input)
+        tools_fp = self._fingerprint(*sorted(self._tool_line(t) for t in tools))
+        key = (run_id, query_fp, tools_fp)
+
+        cached = self._selections.get(key)
+        if cached is not None and self._is_reusable(cached, llm_input):
+            cached.reuses += 1
+            self._selections.move_to_end(key)
+            logger.debug('Reusing cached tool selection for run %s', run_id)
+            set_tiny_attributes({'llm_tool_selector.cache': 'run'})
+            return cached.tool_names
+
+        tool_names: list[str] | None = None
+        if cached is None and self.cross_run_ttl is not None:
+            shared = self._shared_selections.get((query_fp, tools_fp))
+            if shared is not None and shared[1] > time.monotonic():
+                logger.debug('Reusing cross-run tool selection for run %s', run_id)
+                set_tiny_attributes({'llm_tool_selector.cache': 'shared'})
+                tool_names = shared[0]
+
+        if tool_names is None:
+            set_tiny_attributes({'llm_tool_selector.cache': 'miss'})
+            tool_names = await self._select(llm_input, tools)
+            if self.cross_run_ttl is not None:
+                self._remember(
+                    self._shared_selections,
+                    (query_fp, tools_fp),
+                    (tool_names, time.monotonic() + self.cross_run_ttl),
+                )
+
+        self._remember(
+            self._selections,
+            key,
+            _CachedSelection(
+                tool_names=tool_names,
+                reuses=0,
+                context_size=self._context_size(llm_input),
+            ),
+        )
+        return tool_names
+
+    async def _select(
+        self, llm_input: TinyLLMInput, tools: list[AbstractTool]
+    ) -> list[str]:
+        # copy the message list too, so the selection prompt doesn't leak into the
+        # input of the main LLM call
+        local_llm_input = llm_input.model_copy(
+            update={'messages': list(llm_input.messages)}
+        )
+        local_llm_input.add_at_end(
+            TinySystemMessage(content=self.prompt_template.system)
+        )
+        local_llm_input.add_at_end(
+            TinyHumanMessage(
+                content=render_template(
+                    self.prompt_template.user,
+                    {'tools': '\n'.join(self._tool_line(t) for t in tools)},
+                )
+            )
+        )
+
+        result = await self.llm.agenerate_structured(
+            llm_input=local_llm_input,
+            output_schema=self._create_selection_model(tools),
+        )
+        return list(result.selected_tools)  # type: ignore
+
     @tiny_trace('llm_tool_selector.before_llm_call')
     async def before_llm_call(
         self, *, run_id: str, llm_input: TinyLLMInput, kwargs: dict[str, Any]
     ) -> None:
-        candidates = self._prepare_candidates(kwargs)
+        candidates = await self._aprepare_candidates(llm_input, kwargs)
 
         if candidates is None:
             return
@@ -117,32 +300,9 @@ class TinyLLMToolSelectorMiddleware(TinyBaseToolSelectorMiddleware):
         )
 
         if len(remaining_tools) > 0:
-            local_llm_input = llm_input.model_copy()
-            local_llm_input.add_at_end(
-                TinySystemMessage(content=self.prompt_template.system)
-            )
-            local_llm_input.add_at_end(
-                TinyHumanMessage(
-                    content=render_template(
-                        self.prompt_template.user,
-                        {
-                            'tools': '\n'.join(
-                                [
-                                    f'{t.info.name} - {t.info.description or "Description not provided"}'
-                                    for t in remaining_tools
-                                ]
-                            )
-                        },
-                    )
-                )
-            )
-
-            result = await self.llm.agenerate_structured(
-                llm_input=local_llm_input,
-                output_schema=self._create_selection_model(remaining_tools),
-            )
-
-            for selected_tool_name in result.selected_tools:  # type: ignore
+            for selected_tool_name in await self._get_selection(
+                run_id, llm_input, remaining_tools
+            ):
                 if self.max_tools and len(selected_tools) >= self.max_tools:
                     break
 
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable
+import inspect
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class TinyObserverQueue:
+    """Bounded background queue running observational middleware hooks.
+
+    Submitted hook calls are executed by up to `workers` background tasks on
+    the running event loop, so the agent never waits for them. When more than
+    `maxsize` calls are pending, new ones are dropped instead of delaying the
+    agent. Exceptions raised by hooks are logged and counted, never propagated.
+
+    Args:
+        maxsize: Maximum number of pending hook calls
+        workers: Maximum number of hook calls running concurrently
+    """
+
+    def __init__(self, maxsize: int = 1000, workers: int = 4) -> None:
+        if maxsize <= 0 or workers <= 0:
+            raise ValueError('maxsize and workers must be positive integers.')
+
+        self.maxsize = maxsize
+        self.workers = workers
+
+        self._pending: deque[tuple[Callable[..., Any], dict[str, Any]]] = deque()
+        self._tasks: set[asyncio.Task] = set()
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+        self.submitted: int = 0
+        self.dropped: int = 0
+        self.failed: int = 0
+
+    def submit(self, fn: Callable[..., Any], kwargs: dict[str, Any]) -> bool:
+        """Schedule `fn(**kwargs)`; return False if the call was dropped."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # calls pending on a previous (closed) loop can never run
+            self._pending.clear()
+            self._tasks.clear()
+            self._loop = loop
+
+        if len(self._pending) >= self.maxsize:
+            self.dropped += 1
+            logger.warning(
+                'Observer queue full, dropping %s call',
+                getattr(fn, '__qualname__', fn),
+            )
+            return False
+
+        self._pending.append((fn, kwargs))
+        self.submitted += 1
+
+        if len(self._tasks) < self.workers:
+            task = loop.create_task(self._work())
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        return True
+
+    async def flush(self) -> None:
+        """Wait until all submitted hook calls have finished."""
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _work(self) -> None:
+        while self._pending:
+            fn, kwargs = self._pending.popleft()
+            try:
+                result = fn(**kwargs)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                self.failed += 1
+                logger.warning(
+                    'Observational hook %s failed',
+                    getattr(fn, '__qualname__', fn),
+                    exc_info=True,
+                )
@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+from collections import deque
+import logging
+import threading
+import time
+from typing import Any
+from typing import Literal
+
+from pydantic import Field
+
+from tinygent.agents.middleware.base import TinyBaseMiddleware
+from tinygent.agents.middleware.base import TinyBaseMiddlewareConfig
+from tinygent.agents.middleware.tool_limiter import ToolCallBlockedException
+from tinygent.core.datamodels.tool import AbstractTool
+from tinygent.core.runtime.tool_execution import ToolTimeoutError
+from tinygent.core.telemetry.phases import TinyPhaseClock
+from tinygent.core.telemetry.phases import start_phase_clock
+from tinygent.core.types.io.llm_io_input import TinyLLMInput
+from tinygent.utils.histogram import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+
+class TinyProfilerMiddlewareConfig(TinyBaseMiddlewareConfig['TinyProfilerMiddleware']):
+    """Configuration for Profiler Middleware."""
+
+    type: Literal['profiler'] = Field(default='profiler', frozen=True)
+
+    log_interval: float | None = Field(default=60.0)
+
+    log_level: int = Field(default=logging.INFO)
+
+    precision: float = Field(default=0.01)
+
+    def build(self) -> TinyProfilerMiddleware:
+        return TinyProfilerMiddleware(
+            log_interval=self.log_interval,
+            log_level=self.log_level,
+            precision=self.precision,
+        )
+
+
+class TinyProfilerMiddleware(TinyBaseMiddleware):
+    """Low-overhead latency profiler recording histograms across runs.
+
+    Every hook only reads the monotonic clock and increments a histogram
+    bucket, so the profiler can stay enabled in production. Latencies are
+    recorded per phase:
+    - `llm`: LLM calls, also per model as `llm:<model>` when the called LLM
+      has a model name
+    - `llm_ttft`: time to the first chunk of streamed LLM calls
+    - `tool`: tool executions, also per tool as `tool:<name>`
+    - `overhead`: time between an LLM or tool call and the next one, of which
+      `overhead:memory` was spent in the memory, `overhead:prompt` rendering
+      prompt templates and `overhead:middleware` in middleware hooks; the rest
+      is spent in the agent itself
+    - `run`: the whole run, from its first LLM or tool call to its end, also
+      for streamed runs
+
+    `snapshot()` returns count, mean, min, max and p50/p95/p99 of every phase.
+    With `log_interval` set, a summary line is logged at most once per interval
+    (checked on hook calls, no background thread).
+
+    Start times are kept per run and dropped when the run ends. A tool call
+    keeps its start time in its own hook kwargs; LLM calls of a run, whose
+    kwargs are passed on to the LLM, are matched in the order they started.
+
+    Args:
+        log_interval: Seconds between summary log lines (None = never log)
+        log_level: Logging level of the summary line
+        precision: Relative error of the recorded latencies
+    """
+
+    def __init__(
+        self,
+        *,
+        log_interval: float | None = 60.0,
+        log_level: int = logging.INFO,
+        precision: float = 0.01,
+    ) -> None:
+        self.log_interval = log_interval
+        self.log_level = log_level
+        self.precision = precision
+
+        self._lock = threading.Lock()
+        self._histograms: dict[str, LatencyHistogram] = {}
+
+        # start times of the LLM calls in progress, per run, oldest first
+        self._llm_started: dict[str, deque[float]] = {}
+        self._run_started: dict[str, float] = {}
+        self._last_event: dict[str, float] = {}
+        self._clocks: dict[str, TinyPhaseClock] = {}
+
+        self._last_log = time.monotonic()
+
+    def record(self, phase: str, seconds: float) -> None:
+        """Record a latency of the phase."""
+        histogram = self._histograms.get(phase)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(
+                    phase, LatencyHistogram(self.precision)
+                )
+        histogram.record(seconds)
+
+    def _start(self, run_id: str, now: float) -> None:
+        self._run_started.setdefault(run_id, now)
+        # the agent counts its phases into the clock of the run's context
+        clock = self._clocks.setdefault(run_id, start_phase_clock())
+        if (last := self._last_event.pop(run_id, None)) is not None:
+            self.record('overhead', now - last)
+            for phase, seconds in clock.drain().items():
+                self.record(f'overhead:{phase}', seconds)
+
+    def _finish(self, run_id: str, now: float) -> None:
+        self._last_event[run_id] = now
+        if (clock := self._clocks.get(run_id)) is not None:
+            # phases during the call itself are not overhead
+            clock.drain()
+        self._maybe_log(now)
+
+    def _end_run(self, run_id: str) -> None:
+        now = time.monotonic()
+        self._llm_started.pop(run_id, None)
+        self._last_event.pop(run_id, None)
+        self._clocks.pop(run_id, None)
+        if (started := self._run_started.pop(run_id, None)) is not None:
+            self.record('run', now - started)
+        self._maybe_log(now)
+
+    def _maybe_log(self, now: float) -> None:
+        if self.log_interval is None or now - self._last_log < self.log_interval:
+            return
+
+        self._last_log = now
+        logger.log(self.log_level, 'Latency profile: %s', self.format_snapshot())
+
+    async def before_llm_call(
+        self, *, run_id: str, llm_input: TinyLLMInput, kwargs: dict[str, Any]
+    ) -> None:
+        now = time.monotonic()
+        self._start(run_id, now)
+        self._llm_started.setdefault(run_id, deque()).append(now)
+
+    async def after_llm_call(
+        self,
+        *,
+        run_id: str,
+        llm_input: TinyLLMInput,
+        result: Any,
+        kwargs: dict[str, Any],
+    ) -> None:
+        now = time.monotonic()
+        if pending := self._llm_started.get(run_id):
+            started = pending.popleft()
+            self.record('llm', now - started)
+            if model := kwargs.get('llm_model'):
+                self.record(f'llm:{model}', now - started)
+
+        if (ttft := kwargs.get('stream_ttft')) is not None:
+            self.record('llm_ttft', ttft)
+
+        self._finish(run_id, now)
+
+    async def before_tool_call(
+        self,
+        *,
+        run_id: str,
+        tool: AbstractTool,
+        args: dict[str, Any],
+        kwargs: dict[str, Any],
+    ) -> None:
+        now = time.monotonic()
+        self._start(run_id, now)
+        kwargs['profiler_started'] = now
+
+    async def after_tool_call(
+        self,
+        *,
+        run_id: str,
+        tool: AbstractTool,
+        args: dict[str, Any],
+        result: Any,
+        kwargs: dict[str, Any],
+    ) -> None:
+        now = time.monotonic()
+        if (started := kwargs.pop('profiler_started', None)) is not None:
+            self.record('tool', now - started)
+            self.record(f'tool:{tool.info.name}', now - started)
+
+        self._finish(run_id, now)
+
+    async def on_error(
+        self, *, run_id: str, e: Exception, kwargs: dict[str, Any]
+    ) -> None:
+        if isinstance(e, (ToolCallBlockedException, ToolTimeoutError)):
+            # the run continues after a blocked or timed out tool call
+            kwargs.pop('profiler_started', None)
+            self._finish(run_id, time.monotonic())
+        else:
+            # a failed LLM call never reaches its after hook
+            self._llm_started.pop(run_id, None)
+
+    async def on_run_end(self, *, run_id: str, kwargs: dict[str, Any]) -> None:
+        self._end_run(run_id)
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        """Get the latency statistics of every phase, in seconds."""
+        with self._lock:
+            histograms = dict(self._histograms)
+        return {phase: h.snapshot() for phase, h in sorted(histograms.items())}
+
+    def format_snapshot(self) -> str:
+        """Format the p50/p95/p99 latencies of every phase in one line."""
+        return '; '.join(
+            f'{phase} n={s["count"]} p50={s["p50"] * 1000:.1f}ms '
+            f'p95={s["p95"] * 1000:.1f}ms p99={s["p99"] * 1000:.1f}ms'
+            for phase, s in self.snapshot().items()
+        )
+
+    def reset(self) -> None:
+        """Remove all recorded latencies."""
+        with self._lock:
+            for histogram in self._histograms.values():
+                histogram.reset()
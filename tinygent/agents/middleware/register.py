@@ -1,9 +1,33 @@
+from tinygent.agents.middleware.bm25_tool_selector import TinyBM25ToolSelectorMiddleware
+from tinygent.agents.middleware.bm25_tool_selector import (
+    TinyBM25ToolSelectorMiddlewareConfig,
+)
+from tinygent.agents.middleware.budget import TinyBudgetMiddleware
+from tinygent.agents.middleware.budget import TinyBudgetMiddlewareConfig
+from tinygent.agents.middleware.context_compaction import TinyContextCompactionMiddleware
+from tinygent.agents.middleware.context_compaction import (
+    TinyContextCompactionMiddlewareConfig,
+)
+from tinygent.agents.middleware.duplicate_tool_call import (
+    TinyDuplicateToolCallMiddleware,
+)
+from tinygent.agents.middleware.duplicate_tool_call import (
+    TinyDuplicateToolCallMiddlewareConfig,
+)
 from tinygent.agents.middleware.llm_tool_selector import TinyLLMToolSelectorMiddleware
 from tinygent.agents.middleware.llm_tool_selector import (
     TinyLLMToolSelectorMiddlewareConfig,
 )
+from tinygent.agents.middleware.profiler import TinyProfilerMiddleware
+from tinygent.agents.middleware.profiler import TinyProfilerMiddlewareConfig
+from tinygent.agents.middleware.tool_cache import TinyToolCacheMiddleware
+from tinygent.agents.middleware.tool_cache import TinyToolCacheMiddlewareConfig
 from tinygent.agents.middleware.tool_limiter import TinyToolCallLimiterMiddleware
 from tinygent.agents.middleware.tool_limiter import TinyToolCallLimiterMiddlewareConfig
+from tinygent.agents.middleware.tool_rate_limiter import TinyToolRateLimiterMiddleware
+from tinygent.agents.middleware.tool_rate_limiter import (
+    TinyToolRateLimiterMiddlewareConfig,
+)
 from tinygent.agents.middleware.vector_tool_selector import (
     TinyVectorToolSelectorMiddleware,
 )
@@ -21,6 +45,36 @@ def _register_middleware() -> None:
         TinyToolCallLimiterMiddlewareConfig,
         TinyToolCallLimiterMiddleware,
     )
+    registry.register_middleware(
+        'budget',
+        TinyBudgetMiddlewareConfig,
+        TinyBudgetMiddleware,
+    )
+    registry.register_middleware(
+        'context_compaction',
+        TinyContextCompactionMiddlewareConfig,
+        TinyContextCompactionMiddleware,
+    )
+    registry.register_middleware(
+        'duplicate_tool_call',
+        TinyDuplicateToolCallMiddlewareConfig,
+        TinyDuplicateToolCallMiddleware,
+    )
+    registry.register_middleware(
+        'profiler',
+        TinyProfilerMiddlewareConfig,
+        TinyProfilerMiddleware,
+    )
+    registry.register_middleware(
+        'tool_cache',
+        TinyToolCacheMiddlewareConfig,
+        TinyToolCacheMiddleware,
+    )
+    registry.register_middleware(
+        'tool_rate_limiter',
+        TinyToolRateLimiterMiddlewareConfig,
+        TinyToolRateLimiterMiddleware,
+    )
     registry.register_middleware(
         'llm_tool_selector',
         TinyLLMToolSelectorMiddlewareConfig,
@@ -31,6 +85,11 @@ def _register_middleware() -> None:
         TinyVectorToolSelectorMiddlewareConfig,
         TinyVectorToolSelectorMiddleware,
     )
+    registry.register_middleware(
+        'bm25_tool_selector',
+        TinyBM25ToolSelectorMiddlewareConfig,
+        TinyBM25ToolSelectorMiddleware,
+    )
 
 
 _register_middleware()
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Any
+from typing import Literal
+
+from pydantic import Field
+
+from tinygent.agents.middleware.base import TinyBaseMiddleware
+from tinygent.agents.middleware.base import TinyBaseMiddlewareConfig
+from tinygent.core.datamodels.tool import AbstractTool
+from tinygent.core.runtime.executors import run_sync_in_executor
+from tinygent.core.runtime.tool_cache import TinyMemoryToolCacheBackend
+from tinygent.core.runtime.tool_cache import TinySQLiteToolCacheBackend
+from tinygent.core.runtime.tool_cache import TinyToolCacheBackend
+from tinygent.core.runtime.tool_cache import tool_cache_key
+from tinygent.core.telemetry.decorators import tiny_trace
+from tinygent.core.telemetry.otel import set_tiny_attributes
+
+logger = logging.getLogger(__name__)
+
+# memory backends are shared per namespace, so agents built from the same
+# config in one process reuse each other's results
+_MEMORY_BACKENDS: dict[str, TinyMemoryToolCacheBackend] = {}
+_MEMORY_BACKENDS_LOCK = threading.Lock()
+
+
+def get_shared_memory_backend(
+    namespace: str = 'default', max_entries: int | None = 1024
+) -> TinyMemoryToolCacheBackend:
+    """Return the process-wide in-memory tool cache backend for the namespace."""
+    with _MEMORY_BACKENDS_LOCK:
+        backend = _MEMORY_BACKENDS.get(namespace)
+        if backend is None:
+            backend = _MEMORY_BACKENDS[namespace] = TinyMemoryToolCacheBackend(
+                max_entries
+            )
+        return backend
+
+
+class TinyToolCacheMiddlewareConfig(TinyBaseMiddlewareConfig['TinyToolCacheMiddleware']):
+    """Configuration for ToolCache Middleware."""
+
+    type: Literal['tool_cache'] = Field(default='tool_cache', frozen=True)
+
+    tool_ttls: dict[str, float | None] = Field(...)
+
+    backend: Literal['memory', 'sqlite'] = Field(default='memory')
+
+    namespace: str = Field(default='default')
+
+    max_entries: int | None = Field(default=1024)
+
+    max_bytes: int | None = Field(default=None)
+
+    path: str = Field(default='tinygent_tool_cache.db')
+
+    def build(self) -> TinyToolCacheMiddleware:
+        backend: TinyToolCacheBackend
+        if self.backend == 'sqlite':
+            backend = TinySQLiteToolCacheBackend(
+                self.path, self.max_entries, self.max_bytes
+            )
+        else:
+            backend = get_shared_memory_backend(self.namespace, self.max_entries)
+
+        return TinyToolCacheMiddleware(tool_ttls=self.tool_ttls, backend=backend)
+
+
+class TinyToolCacheMiddleware(TinyBaseMiddleware):
+    """Middleware caching tool results across runs and agents.
+
+    Caching is opt-in per tool: only tools listed in `tool_ttls` are cached,
+    each with its own time to live in seconds (None = never expires). Results
+    are keyed by the tool name and the canonicalized arguments, so calls that
+    differ only in argument order, coercible types or omitted defaults hit the
+    same entry.
+
+    On a hit the tool is not executed; the cached result is handed to the agent
+    through `kwargs['tool_result']`. Generator tools are never cached.
+
+    Backends are pluggable: the default in-memory backend is shared by all
+    middleware using the same namespace in the process, the SQLite backend
+    persists results and can be shared between processes. Blocking backends
+    are called from the default executor, off the event loop.
+
+    Args:
+        tool_ttls: Names of cached tools mapped to their TTL in seconds
+        backend: Cache storage (default: shared in-memory backend)
+    """
+
+    def __init__(
+        self,
+        *,
+        tool_ttls: dict[str, float | None],
+        backend: TinyToolCacheBackend | None = None,
+    ) -> None:
+        self.tool_ttls = tool_ttls
+        self.backend = backend or get_shared_memory_backend()
+
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def _is_cached_tool(self, tool: AbstractTool) -> bool:
+        return tool.info.name in self.tool_ttls and tool.info.is_cachable
+
+    @tiny_trace('tool_cache.before_tool_call')
+    async def before_tool_call(
+        self,
+        *,
+        run_id: str,
+        tool: AbstractTool,
+        args: dict[str, Any],
+        kwargs: dict[str, Any],
+    ) -> None:
+        if not self._is_cached_tool(tool) or 'tool_result' in kwargs:
+            return
+
+        key = tool_cache_key(tool, args)
+        if self.backend.blocking:
+            found, value = await run_sync_in_executor(self.backend.get, key)
+        else:
+            found, value = self.backend.get(key)
+        set_tiny_attributes(
+            {'tool_cache.tool_name': tool.info.name, 'tool_cache.hit': found}
+        )
+
+        if found:
+            self.hits += 1
+            logger.debug('Tool cache hit: %s(%s)', tool.info.name, args)
+            kwargs['tool_result'] = value
+        else:
+            self.misses += 1
+            kwargs['tool_cache_key'] = key
+
+    @tiny_trace('tool_cache.after_tool_call')
+    async def after_tool_call(
+        self,
+        *,
+        run_id: str,
+        tool: AbstractTool,
+        args: dict[str, Any],
+        result: Any,
+        kwargs: dict[str, Any],
+    ) -> None:
+        key = kwargs.pop('tool_cache_key', None)
+        if key is None or 'tool_result' in kwargs:
+            return
+
+        ttl = self.tool_ttls[tool.info.name]
+        if self.backend.blocking:
+            await run_sync_in_executor(self.backend.set, key, result, ttl)
+        else:
+            self.backend.set(key, result, ttl)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache hit and miss counts."""
+        total = self.hits + self.misses
+        return {
+            'cached_tools': list(self.tool_ttls),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+        }
@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from typing import Any
+from typing import Literal
+
+from pydantic import Field
+
+from tinygent.agents.middleware.base import TinyBaseMiddleware
+from tinygent.agents.middleware.base import TinyBaseMiddlewareConfig
+from tinygent.agents.middleware.tool_limiter import ToolCallBlockedException
+from tinygent.core.datamodels.tool import AbstractTool
+from tinygent.core.telemetry.decorators import tiny_trace
+from tinygent.core.telemetry.otel import set_tiny_attributes
+
+logger = logging.getLogger(__name__)
+
+# process-wide buckets shared by all rate limiter instances and event loops
+_BUCKETS: dict[tuple[Any, ...], TokenBucket] = {}
+_BUCKETS_LOCK = threading.Lock()
+_MAX_IDLE_BUCKETS = 10_000
+
+
+class TokenBucket:
+    """Thread-safe token bucket handing out FIFO reservations.
+
+    Reserving a token when none is available takes it "on credit": the bucket
+    goes negative and the caller is told how long to wait until its token
+    refills. This keeps waiting calls in arrival order without a separate queue.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+        self.queue_depth: int = 0
+        self.max_queue_depth: int = 0
+        self.acquired: int = 0
+        self.rejected: int = 0
+        self.waited: int = 0
+        self.total_wait: float = 0.0
+        self.max_wait: float = 0.0
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, max_wait: float | None, max_queue: int | None) -> float | None:
+        """Reserve a token and return the wait time, or None if it was rejected."""
+        with self._lock:
+            self._refill(time.monotonic())
+
+            wait = 0.0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+            if wait > 0 and (
+                (max_wait is not None and wait > max_wait)
+                or (max_queue is not None and self.queue_depth >= max_queue)
+            ):
+                self.rejected += 1
+                return None
+
+            self._tokens -= 1
+            self.acquired += 1
+            if wait > 0:
+                self.queue_depth += 1
+                self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+                self.waited += 1
+                self.total_wait += wait
+                self.max_wait = max(self.max_wait, wait)
+            return wait
+
+    def release_waiter(self, refund: bool = False) -> None:
+        """Mark a waiting reservation as done, optionally returning its token."""
+        with self._lock:
+            self.queue_depth -= 1
+            if refund:
+                self._tokens += 1
+                self.acquired -= 1
+
+    @property
+    def is_idle(self) -> bool:
+        with self._lock:
+            self._refill(time.monotonic())
+            return self.queue_depth == 0 and self._tokens >= self.burst
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            self._refill(time.monotonic())
+            return {
+                'rate': self.rate,
+                'burst': self.burst,
+                'available_tokens': max(self._tokens, 0.0),
+                'queue_depth': self.queue_depth,
+                'max_queue_depth': self.max_queue_depth,
+                'acquired': self.acquired,
+                'rejected': self.rejected,
+                'waited': self.waited,
+                'avg_wait': self.total_wait / self.waited if self.waited else 0.0,
+                'max_wait': self.max_wait,
+            }
+
+
+def _get_bucket(key: tuple[Any, ...], rate: float, burst: int) -> TokenBucket:
+    with _BUCKETS_LOCK:
+        bucket = _BUCKETS.get(key)
+        if bucket is None:
+            if len(_BUCKETS) >= _MAX_IDLE_BUCKETS:
+                # full buckets nobody waits on carry no state worth keeping
+                for k in [k for k, b in _BUCKETS.items() if b.is_idle]:
+                    del _BUCKETS[k]
+            bucket = _BUCKETS[key] = TokenBucket(rate, burst)
+        return bucket
+
+
+class TinyToolRateLimiterMiddlewareConfig(
+    TinyBaseMiddlewareConfig['TinyToolRateLimiterMiddleware']
+):
+    """Configuration for ToolRateLimiter Middleware."""
+
+    type: Literal['tool_rate_limiter'] = Field(default='tool_rate_limiter', frozen=True)
+
+    rate: float = Field(default=1.0)
+
+    burst: int = Field(default=1)
+
+    tool_name: str | None = Field(default=None)
+
+    key_args: list[str] | None = Field(default=None)
+
+    mode: Literal['queue', 'fail_fast'] = Field(default='queue')
+
+    max_wait: float | None = Field(default=None)
+
+    max_queue: int | None = Field(default=None)
+
+    def build(self) -> TinyToolRateLimiterMiddleware:
+        return TinyToolRateLimiterMiddleware(
+            rate=self.rate,
+            burst=self.burst,
+            tool_name=self.tool_name,
+            key_args=self.key_args,
+            mode=self.mode,
+            max_wait=self.max_wait,
+            max_queue=self.max_queue,
+        )
+
+
+class TinyToolRateLimiterMiddleware(TinyBaseMiddleware):
+    """Middleware that rate limits tool calls with process-wide token buckets.
+
+    Every limited tool gets a token bucket refilled at `rate` tokens per second
+    holding at most `burst` tokens. Buckets are shared by all middleware
+    instances with the same limits in the process, so concurrent runs and agents
+    calling the same quota-limited API draw from the same budget. With `key_args`
+    a separate bucket is kept for every combination of those argument values
+    (e.g. per repository or per user).
+
+    When no token is available:
+    - mode="queue": the call waits asynchronously, in arrival order, unless the
+      wait would exceed `max_wait` or `max_queue` calls are already waiting
+    - mode="fail_fast": the call is rejected immediately
+
+    Rejected calls are blocked with a tool result telling the LLM the tool is
+    rate limited. Queue depth and wait times are available via `get_stats`.
+
+    Args:
+        rate: Tokens added per second
+        burst: Maximum number of tokens (calls allowed at once)
+        tool_name: Specific tool to limit (None = limit every tool separately)
+        key_args: Argument names whose values select a separate bucket
+        mode: Whether to wait for a token ("queue") or reject ("fail_fast")
+        max_wait: Maximum seconds a queued call may wait (None = unlimited)
+        max_queue: Maximum number of waiting calls per bucket (None = unlimited)
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: float = 1.0,
+        burst: int = 1,
+        tool_name: str | None = None,
+        key_args: list[str] | None = None,
+        mode: Literal['queue', 'fail_fast'] = 'queue',
+        max_wait: float | None = None,
+        max_queue: int | None = None,
+    ) -> None:
+        if rate <= 0 or burst <= 0:
+            raise ValueError('rate and burst must be positive.')
+
+        self.rate = rate
+        self.burst = burst
+        self.tool_name = tool_name
+        self.key_args = key_args
+        self.mode = mode
+        self.max_wait = max_wait
+        self.max_queue = max_queue
+
+        self._bucket_keys: set[tuple[Any, ...]] = set()
+
+    def _bucket_key(self, tool: AbstractTool, args: dict[str, Any]) -> tuple[Any, ...]:
+        arg_key = (
+            json.dumps(
+                [args.get(name) for name in self.key_args], sort_keys=True, default=str
+            )
+            if self.key_args
+            else None
+        )
+        return (tool.info.name, arg_key, self.rate, self.burst)
+
+    @tiny_trace('tool_rate_limiter.before_tool_call')
+    async def before_tool_call(
+        self,
+        *,
+        run_id: str,
+        tool: AbstractTool,
+        args: dict[str, Any],
+        kwargs: dict[str, Any],
+    ) -> None:
+        if self.tool_name and self.tool_name != tool.info.name:
+            return
+
+        key = self._bucket_key(tool, args)
+        bucket = _get_bucket(key, self.rate, self.burst)
+        self._bucket_keys.add(key)
+
+        wait = bucket.reserve(
+            max_wait=0.0 if self.mode == 'fail_fast' else self.max_wait,
+            max_queue=self.max_queue,
+        )
+
+        set_tiny_attributes(
+            {
+                'tool_rate_limiter.tool_name': tool.info.name,
+                'tool_rate_limiter.queue_depth': bucket.queue_depth,
+                'tool_rate_limiter.wait': -1.0 if wait is None else wait,
+            }
+        )
+
+        if wait is None:
+            logger.warning('Tool call rate limited: %s', tool.info.name)
+            raise ToolCallBlockedException(
+                f'Tool "{tool.info.name}" is rate limited to {self.rate:g} calls per '
+                'second and no capacity is available right now. Try again later, '
+                'use a different tool or answer with the information you have.'
+            )
+
+        if wait > 0:
+            logger.debug(
+                'Tool call %s queued for %.3fs (queue depth %d)',
+                tool.info.name,
+                wait,
+                bucket.queue_depth,
+            )
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                bucket.release_waiter(refund=True)
+                raise
+            bucket.release_waiter()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get queue depth, wait times and rejections of the buckets used so far."""
+        with _BUCKETS_LOCK:
+            buckets = {k: _BUCKETS.get(k) for k in self._bucket_keys}
+
+        return {
+            'rate': self.rate,
+            'burst': self.burst,
+            'mode': self.mode,
+            'buckets': {
+                f'{name}[{arg_key}]' if arg_key else name: bucket.stats()
+                for (name, arg_key, *_), bucket in buckets.items()
+                if bucket is not None
+            },
+        }
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import atexit
+import hashlib
 import logging
+import os
+from pathlib import Path
+import threading
+import time
 from typing import Any
 from typing import Callable
 from typing import Literal
+import weakref
 
 import numpy as np
 from pydantic import Field
@@ -12,17 +19,32 @@ from tinygent.agents.middleware.base_tool_selector import TinyBaseToolSelectorMi
 from tinygent.agents.middleware.base_tool_selector import (
     TinyBaseToolSelectorMiddlewareConfig,
 )
+from tinygent.agents.middleware.base_tool_selector import TinyToolGroup
 from tinygent.core.datamodels.embedder import AbstractEmbedder
 from tinygent.core.datamodels.embedder import AbstractEmbedderConfig
 from tinygent.core.datamodels.messages import TinyHumanMessage
 from tinygent.core.datamodels.tool import AbstractTool
 from tinygent.core.factory.embedder import build_embedder
+from tinygent.core.runtime.executors import run_sync_in_executor
 from tinygent.core.telemetry.decorators import tiny_trace
 from tinygent.core.telemetry.otel import set_tiny_attributes
 from tinygent.core.types.io.llm_io_input import TinyLLMInput
 
 logger = logging.getLogger(__name__)
 
+# minimum seconds between two writes of the embedding cache file
+_CACHE_WRITE_INTERVAL = 5.0
+
+
+# selectors with a cache file, flushed once on interpreter exit
+_CACHED_SELECTORS: weakref.WeakSet[TinyVectorToolSelectorMiddleware] = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_caches_at_exit() -> None:
+    for selector in list(_CACHED_SELECTORS):
+        selector.flush_cache()
+
 
 class TinyVectorToolSelectorMiddlewareConfig(
     TinyBaseToolSelectorMiddlewareConfig['TinyVectorToolSelectorMiddleware']
@@ -41,6 +63,8 @@ class TinyVectorToolSelectorMiddlewareConfig(
 
     tool_transform_fn: Callable[[AbstractTool], str] | None = Field(default=None)
 
+    cache_path: str | None = Field(default=None)
+
     def build(self) -> TinyVectorToolSelectorMiddleware:
         return TinyVectorToolSelectorMiddleware(
             embedder=self.embedder
@@ -49,6 +73,7 @@ class TinyVectorToolSelectorMiddlewareConfig(
             similarity_threshold=self.similarity_threshold,
             query_transform_fn=self.query_transform_fn,
             tool_transform_fn=self.tool_transform_fn,
+            cache_path=self.cache_path,
             **self.build_base_kwargs(),
         )
 
@@ -56,10 +81,17 @@ class TinyVectorToolSelectorMiddlewareConfig(
 class TinyVectorToolSelectorMiddleware(TinyBaseToolSelectorMiddleware):
     """Middleware that selects relevant tools using vector similarity search.
 
-    Before each LLM call, this middleware embeds the latest human message and all
-    candidate tool descriptions, then ranks tools by cosine similarity to the query.
-    Only the most relevant tools are forwarded to the main agent, reducing token usage
-    and focusing the model on applicable capabilities.
+    Before each LLM call, this middleware embeds the latest human message and ranks
+    all candidate tool descriptions by cosine similarity to the query. Only the most
+    relevant tools are forwarded to the main agent, reducing token usage and focusing
+    the model on applicable capabilities.
+
+    Tool embeddings are cached by a hash of the embedder model and the transformed
+    description, so every tool is embedded only once (optionally persisted to
+    ``cache_path``; new embeddings are written at most every few seconds and
+    on interpreter exit, or explicitly with ``flush_cache``). Scores are
+    computed with a single matrix-vector product and the query embedding is
+    reused while the query does not change.
 
     An optional similarity threshold can further filter out low-relevance tools.
     Tools in ``always_include`` bypass the ranking and are always forwarded.
@@ -68,6 +100,9 @@ class TinyVectorToolSelectorMiddleware(TinyBaseToolSelectorMiddleware):
         embedder: Embedder used to produce dense vector representations.
         max_tools: Maximum number of tools to select (None = no limit).
         always_include: Tools to always include regardless of similarity score.
+        tool_groups: Explicit tool groups for two-stage selection.
+        group_separator: Separator deriving groups from tool name namespaces.
+        max_groups: Maximum number of groups whose tools are ranked.
         similarity_threshold: Minimum cosine similarity score for a tool to be
             selected. When None, all tools up to ``max_tools`` are included.
         query_transform_fn: Callable that extracts a query string from the
@@ -76,6 +111,7 @@ class TinyVectorToolSelectorMiddleware(TinyBaseToolSelectorMiddleware):
         tool_transform_fn: Callable that converts an ``AbstractTool`` to the
             string that will be embedded and compared against the query.
             Defaults to ``"<name> - <description>"``.
+        cache_path: File to persist tool embeddings to and load them from.
     """
 
     def __init__(
@@ -84,11 +120,17 @@ class TinyVectorToolSelectorMiddleware(TinyBaseToolSelectorMiddleware):
         embedder: AbstractEmbedder,
         max_tools: int | None = None,
         always_include: list[AbstractTool] | None = None,
+        tool_groups: list[TinyToolGroup] | None = None,
+        group_separator: str | None = None,
+        max_groups: int = 3,
         similarity_threshold: float | None = None,
         query_transform_fn: Callable[[TinyLLMInput], str] | None = None,
         tool_transform_fn: Callable[[AbstractTool], str] | None = None,
+        cache_path: str | Path | None = None,
     ):
-        super().__init__(max_tools, always_include)
+        super().__init__(
+            max_tools, always_include, tool_groups, group_separator, max_groups
+        )
 
         if not query_transform_fn:
 
@@ -111,29 +153,132 @@ class TinyVectorToolSelectorMiddleware(TinyBaseToolSelectorMiddleware):
         self.similarity_threshold = similarity_threshold
         self.query_transform_fn = query_transform_fn
         self.tool_transform_fn = tool_transform_fn
+        self.cache_path = Path(cache_path) if cache_path else None
+
+        self._tool_embeddings: dict[str, np.ndarray] = {}
+        self._matrix_cache: tuple[tuple[str, ...], np.ndarray] | None = None
+        self._query_cache: tuple[str, np.ndarray] | None = None
+        self._cache_dirty = False
+        self._cache_written_at = float('-inf')
+        self._cache_lock = threading.Lock()
+
+        if self.cache_path:
+            self._load_cache()
+            _CACHED_SELECTORS.add(self)
+
+    @staticmethod
+    def _normalize(rows: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(rows, axis=-1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return rows / norms
+
+    def _text_key(self, text: str) -> str:
+        return hashlib.blake2b(
+            f'{self.embedder.model}\0{text}'.encode(), digest_size=16
+        ).hexdigest()
+
+    def _load_cache(self) -> None:
+        assert self.cache_path is not None
+        if not self.cache_path.exists():
+            return
 
-    def _cosine_similarity(self, a: list[float], b: list[float]) -> float:
-        a_np = np.array(a, dtype=float)
-        b_np = np.array(b, dtype=float)
-
-        if a_np.shape != b_np.shape:
-            raise ValueError(
-                f'Vectors for cosine similarity must have the same shape a[{a_np.shape}], b[{b_np.shape}]'
+        try:
+            with np.load(self.cache_path) as stored:
+                self._tool_embeddings.update(
+                    {key: stored[key].astype(np.float32) for key in stored.files}
+                )
+        except Exception:
+            logger.warning(
+                'Failed to load tool embedding cache %s',
+                self.cache_path,
+                exc_info=True,
             )
 
-        norm_a = np.linalg.norm(a_np)
-        norm_b = np.linalg.norm(b_np)
+    def _store_cache(self, embeddings: dict[str, np.ndarray]) -> None:
+        assert self.cache_path is not None
+        with self._cache_lock:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+            tmp_path = self.cache_path.with_name(self.cache_path.name + '.tmp')
+            with tmp_path.open('wb') as f:
+                np.savez(f, **embeddings)  # type: ignore[arg-type]
+            os.replace(tmp_path, self.cache_path)
+
+    def _take_dirty_cache(self) -> dict[str, np.ndarray] | None:
+        if not self.cache_path or not self._cache_dirty:
+            return None
+        self._cache_dirty = False
+        self._cache_written_at = time.monotonic()
+        return dict(self._tool_embeddings)
+
+    def flush_cache(self) -> None:
+        """Write embeddings not yet persisted to ``cache_path``."""
+        embeddings = self._take_dirty_cache()
+        if embeddings is not None:
+            self._store_cache(embeddings)
+
+    async def _embed(
+        self, query: str, tool_texts: list[str]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return the normalized query vector and tool matrix, embedding only misses."""
+        keys = tuple(self._text_key(t) for t in tool_texts)
+
+        query_vec = (
+            self._query_cache[1]
+            if self._query_cache and self._query_cache[0] == query
+            else None
+        )
+        missing = list(
+            {
+                key: text
+                for key, text in zip(keys, tool_texts, strict=True)
+                if key not in self._tool_embeddings
+            }.items()
+        )
 
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
+        to_embed = ([query] if query_vec is None else []) + [t for _, t in missing]
+        if to_embed:
+            logger.debug(
+                'Embedding %d texts for vector tool selector (%d tools cached)',
+                len(to_embed),
+                len(keys) - len(missing),
+            )
+            rows = self._normalize(
+                np.asarray(await self.embedder.aembed_batch(to_embed), np.float32)
+            )
+            if query_vec is None:
+                query_vec, rows = rows[0], rows[1:]
+                self._query_cache = (query, query_vec)
+
+            for (key, _), row in zip(missing, rows, strict=True):
+                self._tool_embeddings[key] = row
+
+            if missing and self.cache_path:
+                # misses come in bursts when tools are added, so writes of
+                # the whole file are spaced out instead of done per miss
+                self._cache_dirty = True
+                if time.monotonic() - self._cache_written_at >= _CACHE_WRITE_INTERVAL:
+                    embeddings = self._take_dirty_cache()
+                    assert embeddings is not None
+                    await run_sync_in_executor(self._store_cache, embeddings)
+
+        assert query_vec is not None
+
+        if self._matrix_cache is None or self._matrix_cache[0] != keys:
+            matrix = (
+                np.stack([self._tool_embeddings[key] for key in keys])
+                if keys
+                else np.empty((0, len(query_vec)), np.float32)
+            )
+            self._matrix_cache = (keys, matrix)
 
-        return float(np.dot(a_np, b_np) / (norm_a * norm_b))
+        return query_vec, self._matrix_cache[1]
 
     @tiny_trace('vector_tool_selector.before_llm_call')
     async def before_llm_call(
         self, *, run_id: str, llm_input: TinyLLMInput, kwargs: dict[str, Any]
     ) -> None:
-        candidates = self._prepare_candidates(kwargs)
+        candidates = await self._aprepare_candidates(llm_input, kwargs)
 
         if candidates is None:
             return
@@ -155,38 +300,22 @@ class TinyVectorToolSelectorMiddleware(TinyBaseToolSelectorMiddleware):
         transformed_query = self.query_transform_fn(llm_input)
         transformed_tools = [self.tool_transform_fn(t) for t in remaining_tools]
 
-        query_emb, *tool_embs = await self.embedder.aembed_batch(
-            [transformed_query] + transformed_tools
-        )
+        query_vec, tool_matrix = await self._embed(transformed_query, transformed_tools)
+        scores = tool_matrix @ query_vec
 
-        similarities = [
-            self._cosine_similarity(query_emb, tool_emb) for tool_emb in tool_embs
-        ]
-        tool_sim_pairs = [
-            (s, t, tt)
-            for s, t, tt in zip(
-                similarities, remaining_tools, transformed_tools, strict=True
-            )
-        ]
-        tool_sim_pairs = sorted(
-            tool_sim_pairs, key=lambda x: x[0], reverse=True
-        )  # sort by highest similarity
-
-        for s, t, tt in tool_sim_pairs:
-            set_tiny_attributes(
-                {
-                    f'vector_tool_selector.{t.info.name}.transformed_description': tt,
-                    f'vector_tool_selector.{t.info.name}.similarity_score': s,
-                }
-            )
-
-            if self.max_tools and len(selected_tools) >= self.max_tools:
-                continue
+        n = len(remaining_tools)
+        k = (
+            n
+            if candidates.remaining_space is None
+            else min(candidates.remaining_space, n)
+        )
+        top = np.argpartition(-scores, k - 1)[:k] if 0 < k < n else np.arange(k)
+        top = top[np.argsort(-scores[top], kind='stable')]  # highest similarity first
 
-            if self.similarity_threshold is None or (
-                self.similarity_threshold and s > self.similarity_threshold
-            ):
-                selected_tools.add(t)
+        for i in top:
+            s = float(scores[i])
+            if self.similarity_threshold is None or s > self.similarity_threshold:
+                selected_tools.add(remaining_tools[i])
 
         set_tiny_attributes(
             {
@@ -195,6 +324,10 @@ class TinyVectorToolSelectorMiddleware(TinyBaseToolSelectorMiddleware):
                     t.info.name for t in selected_tools
                 ],
                 'vector_tool_selector.selected_tools.total': len(selected_tools),
+                **{
+                    f'vector_tool_selector.{t.info.name}.similarity_score': float(s)
+                    for t, s in zip(remaining_tools, scores, strict=True)
+                },
             }
         )
 
@@ -17,7 +17,6 @@ from tinygent.core.datamodels.memory import AbstractMemory
 from tinygent.core.datamodels.messages import AllTinyMessages
 from tinygent.core.datamodels.messages import TinyChatMessage
 from tinygent.core.datamodels.messages import TinyChatMessageChunk
-from tinygent.core.datamodels.messages import TinyHumanMessage
 from tinygent.core.datamodels.messages import TinyPlanMessage
 from tinygent.core.datamodels.messages import TinyReasoningMessage
 from tinygent.core.datamodels.messages import TinySystemMessage
@@ -25,7 +24,9 @@ from tinygent.core.datamodels.messages import TinyToolCall
 from tinygent.core.datamodels.messages import TinyUserMessage
 from tinygent.core.datamodels.middleware import AbstractMiddleware
 from tinygent.core.datamodels.tool import AbstractTool
+from tinygent.core.runtime.blob_store import TinyBlobStore
 from tinygent.core.runtime.executors import run_async_in_executor
+from tinygent.core.runtime.tool_catalog import materialize_tool
 from tinygent.core.telemetry.decorators import tiny_trace
 from tinygent.core.telemetry.otel import set_tiny_attributes
 from tinygent.core.telemetry.otel import tiny_trace_span
@@ -50,6 +51,9 @@ class TinyMultiStepAgentConfig(TinyBaseAgentConfig['TinyMultiStepAgent']):
     prompt_template: MultiStepPromptTemplate = Field(default=_DEFAULT_PROMPT)
     max_iterations: int = Field(default=15)
     plan_interval: int = Field(default=5)
+    auto_checkpoint: bool = Field(default=False)
+    tool_timeout: float | None = Field(default=None)
+    blob_threshold: int | None = Field(default=None)
 
     def build(self) -> TinyMultiStepAgent:
         return TinyMultiStepAgent(
@@ -61,6 +65,9 @@ class TinyMultiStepAgentConfig(TinyBaseAgentConfig['TinyMultiStepAgent']):
             prompt_template=self.prompt_template,
             max_iterations=self.max_iterations,
             plan_interval=self.plan_interval,
+            auto_checkpoint=self.auto_checkpoint,
+            tool_timeout=self.tool_timeout,
+            blob_threshold=self.blob_threshold,
         )
 
 
@@ -93,6 +100,15 @@ class TinyMultiStepAgent(TinyBaseAgent):
         max_iterations: Maximum number of action iterations (default: 15)
         plan_interval: Number of iterations between plan updates (default: 5)
         middleware: List of middleware to apply during execution
+        checkpointer: Checkpointer holding the agent state between runs
+        auto_checkpoint: Persist the checkpointer state in the background after
+            every iteration, so a crashed run can be resumed via `checkpoint_id`
+        tool_timeout: Seconds to wait for a tool call before cancelling it, for
+            tools without their own `timeout` (default: None = no limit)
+        blob_threshold: Tool results longer than this many characters are kept
+            in the blob store and only previewed in the conversation; also adds
+            the `read_blob` and `grep_blob` tools (default: None = never)
+        blob_store: Store of large tool results (default: the process-wide store)
     """
 
     def __init__(
@@ -105,6 +121,10 @@ class TinyMultiStepAgent(TinyBaseAgent):
         plan_interval: int = 5,
         middleware: Sequence[AbstractMiddleware] = [],
         checkpointer: AbstractCheckpointer | None = None,
+        auto_checkpoint: bool = False,
+        tool_timeout: float | None = None,
+        blob_threshold: int | None = None,
+        blob_store: TinyBlobStore | None = None,
     ) -> None:
         super().__init__(
             llm=llm,
@@ -112,6 +132,10 @@ class TinyMultiStepAgent(TinyBaseAgent):
             memory=memory,
             middleware=middleware,
             checkpointer=checkpointer,
+            auto_checkpoint=auto_checkpoint,
+            tool_timeout=tool_timeout,
+            blob_threshold=blob_threshold,
+            blob_store=blob_store,
         )
 
         self.max_iterations = max_iterations
@@ -260,141 +284,159 @@ class TinyMultiStepAgent(TinyBaseAgent):
 
         logger.debug('[%s] Running agent with input %s', run_id, input_text)
 
-        self._checkpointer['_iteration_number'] = 1
+        if not self._resume_task(input_text):
+            self._checkpointer['_iteration_number'] = 1
+            self._start_task(input_text)
         returned_final_answer: bool = False
         yielded_final_answer: str = ''
 
-        self.memory.save_context(TinyHumanMessage(content=input_text))
+        self._start_auto_checkpoint(run_id)
 
-        while not returned_final_answer and (
-            self._checkpointer['_iteration_number'] <= self.max_iterations
-        ):
-            with tiny_trace_span(
-                'multi_step_agent_single_iteration',
-                iteration=self._checkpointer['_iteration_number'],
+        try:
+            while not returned_final_answer and (
+                self._checkpointer['_iteration_number'] <= self.max_iterations
             ):
-                logger.debug(
-                    '--- ITERATION %d ---', self._checkpointer['_iteration_number']
-                )
-
-                if self._checkpointer['_iteration_number'] == 1 or (
-                    (self._checkpointer['_iteration_number'] - 1) % self.plan_interval
-                    == 0
+                with tiny_trace_span(
+                    'multi_step_agent_single_iteration',
+                    iteration=self._checkpointer['_iteration_number'],
                 ):
-                    # Create new plan
-                    plan_generator = self._stream_steps(run_id=run_id, task=input_text)
-                    self._checkpointer['_planned_steps'] = []
-
-                    async for planner_msg in plan_generator:
-                        if isinstance(planner_msg, TinyPlanMessage):
-                            logger.debug(
-                                '[%d. ITERATION - Plan]: %s',
-                                self._checkpointer['_iteration_number'],
-                                planner_msg.content,
-                            )
-                            await self.on_plan(
-                                run_id=run_id, plan=planner_msg.content, kwargs={}
-                            )
-                            self._checkpointer['_planned_steps'].append(planner_msg)
-
-                        if isinstance(planner_msg, TinyReasoningMessage):
-                            logger.debug(
-                                '[%d. ITERATION - Reasoning]: %s',
-                                self._checkpointer['_iteration_number'],
-                                planner_msg.content,
-                            )
-                            await self.on_reasoning(
-                                run_id=run_id, reasoning=planner_msg.content, kwargs={}
-                            )
-                        self.memory.save_context(planner_msg)
-
-                try:
-                    # Execute action
-                    async for msg in self._stream_action(run_id=run_id, task=input_text):
-                        if msg.is_message and isinstance(
-                            msg.message, TinyChatMessageChunk
-                        ):
-                            returned_final_answer = True
-                            yielded_final_answer += msg.message.content
+                    logger.debug(
+                        '--- ITERATION %d ---', self._checkpointer['_iteration_number']
+                    )
+
+                    if self._checkpointer['_iteration_number'] == 1 or (
+                        (self._checkpointer['_iteration_number'] - 1)
+                        % self.plan_interval
+                        == 0
+                    ):
+                        # Create new plan
+                        plan_generator = self._stream_steps(
+                            run_id=run_id, task=input_text
+                        )
+                        self._checkpointer['_planned_steps'] = []
+
+                        async for planner_msg in plan_generator:
+                            if isinstance(planner_msg, TinyPlanMessage):
+                                logger.debug(
+                                    '[%d. ITERATION - Plan]: %s',
+                                    self._checkpointer['_iteration_number'],
+                                    planner_msg.content,
+                                )
+                                await self.on_plan(
+                                    run_id=run_id, plan=planner_msg.content, kwargs={}
+                                )
+                                self._checkpointer['_planned_steps'].append(planner_msg)
 
-                            yield msg.message.content
+                            if isinstance(planner_msg, TinyReasoningMessage):
+                                logger.debug(
+                                    '[%d. ITERATION - Reasoning]: %s',
+                                    self._checkpointer['_iteration_number'],
+                                    planner_msg.content,
+                                )
+                                await self.on_reasoning(
+                                    run_id=run_id,
+                                    reasoning=planner_msg.content,
+                                    kwargs={},
+                                )
+                            self.memory.save_context(planner_msg)
 
-                        elif msg.is_tool_call and isinstance(
-                            msg.full_tool_call, TinyToolCall
+                    try:
+                        # Execute action
+                        async for msg in self._stream_action(
+                            run_id=run_id, task=input_text
                         ):
-                            tool_call: TinyToolCall = msg.full_tool_call
-                            called_tool = self.get_tool(tool_call.tool_name)
+                            if msg.is_message and isinstance(
+                                msg.message, TinyChatMessageChunk
+                            ):
+                                returned_final_answer = True
+                                yielded_final_answer += msg.message.content
+
+                                yield msg.message.content
+
+                            elif msg.is_tool_call and isinstance(
+                                msg.full_tool_call, TinyToolCall
+                            ):
+                                tool_call: TinyToolCall = msg.full_tool_call
+                                called_tool = self.get_tool(tool_call.tool_name)
+
+                                self.memory.save_context(tool_call)
+                                if called_tool:
+                                    self.memory.save_context(
+                                        await self.run_tool(
+                                            run_id=run_id,
+                                            tool=called_tool,
+                                            call=tool_call,
+                                        )
+                                    )
+                                    self._checkpointer['_tool_calls'].append(tool_call)
+                                else:
+                                    logger.error(
+                                        'Tool %s not found. Skipping tool call.',
+                                        tool_call.tool_name,
+                                    )
 
-                            self.memory.save_context(tool_call)
-                            if called_tool:
-                                self.memory.save_context(
-                                    await self.run_tool(
-                                        run_id=run_id, tool=called_tool, call=tool_call
+                                if called_tool and isinstance(
+                                    materialize_tool(called_tool), ReasoningTool
+                                ):
+                                    reasoning = tool_call.arguments.get('reasoning', '')
+                                    logger.debug(
+                                        '[%d. ITERATION - Tool Reasoning]: %s',
+                                        self._checkpointer['_iteration_number'],
+                                        reasoning,
+                                    )
+                                    await self.on_tool_reasoning(
+                                        run_id=run_id, reasoning=reasoning, kwargs={}
                                     )
-                                )
-                                self._checkpointer['_tool_calls'].append(tool_call)
-                            else:
-                                logger.error(
-                                    'Tool %s not found. Skipping tool call.',
-                                    tool_call.tool_name,
-                                )
 
-                            if isinstance(called_tool, ReasoningTool):
-                                reasoning = tool_call.arguments.get('reasoning', '')
                                 logger.debug(
-                                    '[%d. ITERATION - Tool Reasoning]: %s',
+                                    '[%s. ITERATION - Tool Call]: %s(%s) = %s',
                                     self._checkpointer['_iteration_number'],
-                                    reasoning,
+                                    tool_call.tool_name,
+                                    tool_call.arguments,
+                                    tool_call.result,
                                 )
-                                await self.on_tool_reasoning(
-                                    run_id=run_id, reasoning=reasoning, kwargs={}
+
+                        if returned_final_answer:
+                            if yielded_final_answer:
+                                self.memory.save_context(
+                                    TinyChatMessage(content=yielded_final_answer)
                                 )
+                            break
+                    except Exception as e:
+                        await self.on_error(run_id=run_id, e=e, kwargs={})
+                        raise e
+                    finally:
+                        self._checkpointer['_iteration_number'] += 1
+
+                self._auto_checkpoint()
+
+            if not returned_final_answer:
+                logger.warning(
+                    'Max iterations reached without returning a final answer. '
+                    'Returning the last known answer or a default message.'
+                )
 
-                            logger.debug(
-                                '[%s. ITERATION - Tool Call]: %s(%s) = %s',
-                                self._checkpointer['_iteration_number'],
-                                tool_call.tool_name,
-                                tool_call.arguments,
-                                tool_call.result,
-                            )
-
-                    if returned_final_answer:
-                        if yielded_final_answer:
-                            self.memory.save_context(
-                                TinyChatMessage(content=yielded_final_answer)
-                            )
-                        break
-                except Exception as e:
-                    await self.on_error(run_id=run_id, e=e, kwargs={})
-                    raise e
-                finally:
-                    self._checkpointer['_iteration_number'] += 1
-
-        if not returned_final_answer:
-            logger.warning(
-                'Max iterations reached without returning a final answer. '
-                'Returning the last known answer or a default message.'
-            )
-
-            yield_fallback = False
-            final_yielded_answer = ''
-
-            logger.debug('--- FALLBACK FINAL ANSWER ---')
-            async for chunk in self._stream_fallback_answer(
-                run_id=run_id, task=input_text
-            ):
-                yield_fallback = True
-                final_yielded_answer += chunk.content
+                yield_fallback = False
+                final_yielded_answer = ''
 
-                yield chunk.content
+                logger.debug('--- FALLBACK FINAL ANSWER ---')
+                async for chunk in self._stream_fallback_answer(
+                    run_id=run_id, task=input_text
+                ):
+                    yield_fallback = True
+                    final_yielded_answer += chunk.content
 
-            if not yield_fallback:
-                final_yielded_answer = (
-                    'I am unable to provide a final answer at this time.'
-                )
-                yield final_yielded_answer
+                    yield chunk.content
 
-            self.memory.save_context(TinyChatMessage(content=final_yielded_answer))
+                if not yield_fallback:
+                    final_yielded_answer = (
+                        'I am unable to provide a final answer at this time.'
+                    )
+                    yield final_yielded_answer
+
+                self.memory.save_context(TinyChatMessage(content=final_yielded_answer))
+        finally:
+            await self._finish_auto_checkpoint()
 
     def reset(self) -> None:
         super().reset()
@@ -416,6 +458,7 @@ class TinyMultiStepAgent(TinyBaseAgent):
         if history:
             self.memory.save_multiple_context(history)
 
+        self._checkpoint_id = checkpoint_id
         if checkpoint_id:
             self.checkpointer.load(checkpoint_id)
 
@@ -434,12 +477,15 @@ class TinyMultiStepAgent(TinyBaseAgent):
         self.setup(reset=reset, history=history, checkpoint_id=checkpoint_id)
 
         async def _run() -> str:
-            final_answer: str = ''
-            async for res in self._run_agent(input_text, run_id):
-                final_answer += res
+            try:
+                final_answer: str = ''
+                async for res in self._run_agent(input_text, run_id):
+                    final_answer += res
 
-            await self.on_answer(run_id=run_id, answer=final_answer, kwargs={})
-            return final_answer
+                await self.on_answer(run_id=run_id, answer=final_answer, kwargs={})
+                return final_answer
+            finally:
+                await self.on_run_end(run_id=run_id, kwargs={})
 
         return run_async_in_executor(_run)
 
@@ -458,13 +504,18 @@ class TinyMultiStepAgent(TinyBaseAgent):
         self.setup(reset=reset, history=history, checkpoint_id=checkpoint_id)
 
         async def _generator():
-            idx = 0
-            async for res in self._run_agent(run_id=run_id, input_text=input_text):
-                await self.on_answer_chunk(
-                    run_id=run_id, chunk=res, idx=str(idx), kwargs={}
-                )
-                idx += 1
-                yield res
+            try:
+                idx = 0
+                dispatch_chunks = self.handles('on_answer_chunk')
+                async for res in self._run_agent(run_id=run_id, input_text=input_text):
+                    if dispatch_chunks:
+                        await self.on_answer_chunk(
+                            run_id=run_id, chunk=res, idx=str(idx), kwargs={}
+                        )
+                    idx += 1
+                    yield res
+            finally:
+                await self.on_run_end(run_id=run_id, kwargs={})
 
         return _generator()
 
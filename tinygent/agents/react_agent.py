@@ -16,13 +16,14 @@ from tinygent.core.datamodels.memory import AbstractMemory
 from tinygent.core.datamodels.messages import AllTinyMessages
 from tinygent.core.datamodels.messages import TinyChatMessage
 from tinygent.core.datamodels.messages import TinyChatMessageChunk
-from tinygent.core.datamodels.messages import TinyHumanMessage
 from tinygent.core.datamodels.messages import TinyReasoningMessage
 from tinygent.core.datamodels.messages import TinySystemMessage
 from tinygent.core.datamodels.messages import TinyToolCall
 from tinygent.core.datamodels.middleware import AbstractMiddleware
 from tinygent.core.datamodels.tool import AbstractTool
+from tinygent.core.runtime.blob_store import TinyBlobStore
 from tinygent.core.runtime.executors import run_async_in_executor
+from tinygent.core.runtime.tool_catalog import materialize_tool
 from tinygent.core.telemetry.decorators import tiny_trace
 from tinygent.core.telemetry.otel import set_tiny_attributes
 from tinygent.core.telemetry.otel import tiny_trace_span
@@ -46,6 +47,9 @@ class TinyReActAgentConfig(TinyBaseAgentConfig['TinyReActAgent']):
 
     prompt_template: ReActPromptTemplate = Field(default=_DEFAULT_PROMPT)
     max_iterations: int = Field(default=10)
+    auto_checkpoint: bool = Field(default=False)
+    tool_timeout: float | None = Field(default=None)
+    blob_threshold: int | None = Field(default=None)
 
     def build(self) -> TinyReActAgent:
         return TinyReActAgent(
@@ -56,6 +60,9 @@ class TinyReActAgentConfig(TinyBaseAgentConfig['TinyReActAgent']):
             memory=self.build_memory_instance(),
             checkpointer=self.build_checkpointer_instance(),
             max_iterations=self.max_iterations,
+            auto_checkpoint=self.auto_checkpoint,
+            tool_timeout=self.tool_timeout,
+            blob_threshold=self.blob_threshold,
         )
 
 
@@ -86,6 +93,15 @@ class TinyReActAgent(TinyBaseAgent):
         tools: List of tools available to the agent
         max_iterations: Maximum number of reasoning-action cycles (default: 10)
         middleware: List of middleware to apply during execution
+        checkpointer: Checkpointer holding the agent state between runs
+        auto_checkpoint: Persist the checkpointer state in the background after
+            every iteration, so a crashed run can be resumed via `checkpoint_id`
+        tool_timeout: Seconds to wait for a tool call before cancelling it, for
+            tools without their own `timeout` (default: None = no limit)
+        blob_threshold: Tool results longer than this many characters are kept
+            in the blob store and only previewed in the conversation; also adds
+            the `read_blob` and `grep_blob` tools (default: None = never)
+        blob_store: Store of large tool results (default: the process-wide store)
     """
 
     class TinyReactIteration(TinyModel):
@@ -110,6 +126,10 @@ class TinyReActAgent(TinyBaseAgent):
         max_iterations: int = 10,
         middleware: Sequence[AbstractMiddleware] = [],
         checkpointer: AbstractCheckpointer | None = None,
+        auto_checkpoint: bool = False,
+        tool_timeout: float | None = None,
+        blob_threshold: int | None = None,
+        blob_store: TinyBlobStore | None = None,
     ) -> None:
         super().__init__(
             llm=llm,
@@ -117,6 +137,10 @@ class TinyReActAgent(TinyBaseAgent):
             memory=memory,
             middleware=middleware,
             checkpointer=checkpointer,
+            auto_checkpoint=auto_checkpoint,
+            tool_timeout=tool_timeout,
+            blob_threshold=blob_threshold,
+            blob_store=blob_store,
         )
 
         self.prompt_template = prompt_template
@@ -253,148 +277,174 @@ class TinyReActAgent(TinyBaseAgent):
         )
         logger.debug('Running agent with task: %s', input_text)
 
-        self._init_state()
-
-        self.memory.save_context(TinyHumanMessage(content=input_text))
-
-        while not self.checkpointer['returned_final_answer'] and (
-            self.checkpointer['iteration_number'] <= self.max_iterations
-        ):
-            with tiny_trace_span(
-                'react_agent_single_iteration',
-                iteration=self.checkpointer['iteration_number'],
+        if self._resume_task(input_text):
+            self._init_state()
+            if self.checkpointer['returned_final_answer']:
+                # resumed from a checkpoint of a run which already produced its answer
+                yield self.checkpointer['yielded_final_answer']
+                return
+        else:
+            self.checkpointer.clear()
+            self._init_state()
+            self._start_task(input_text)
+        self._start_auto_checkpoint(run_id)
+
+        try:
+            while not self.checkpointer['returned_final_answer'] and (
+                self.checkpointer['iteration_number'] <= self.max_iterations
             ):
-                logger.debug(
-                    '--- ITERATION %d ---', self.checkpointer['iteration_number']
-                )
-
-                try:
-                    reasoning_result = await self._stream_reasoning(
-                        run_id=run_id, task=input_text
-                    )
+                with tiny_trace_span(
+                    'react_agent_single_iteration',
+                    iteration=self.checkpointer['iteration_number'],
+                ):
                     logger.debug(
-                        '[%d. ITERATION - Reasoning Result]: %s',
-                        self.checkpointer['iteration_number'],
-                        reasoning_result.content,
+                        '--- ITERATION %d ---', self.checkpointer['iteration_number']
                     )
 
-                    if isinstance(reasoning_result, TinyChatMessage):
+                    try:
+                        reasoning_result = await self._stream_reasoning(
+                            run_id=run_id, task=input_text
+                        )
                         logger.debug(
-                            '[%d. ITERATION - Reasoning Final Answer]: %s',
+                            '[%d. ITERATION - Reasoning Result]: %s',
                             self.checkpointer['iteration_number'],
                             reasoning_result.content,
                         )
-                        self.checkpointer['returned_final_answer'] = True
 
-                        self.memory.save_context(reasoning_result)
-
-                        yield reasoning_result.content
+                        if isinstance(reasoning_result, TinyChatMessage):
+                            logger.debug(
+                                '[%d. ITERATION - Reasoning Final Answer]: %s',
+                                self.checkpointer['iteration_number'],
+                                reasoning_result.content,
+                            )
+                            self.checkpointer['returned_final_answer'] = True
+                            self.checkpointer['yielded_final_answer'] = (
+                                reasoning_result.content
+                            )
 
-                    else:
-                        logger.debug(
-                            '[%d. ITERATION - Streaming Action]',
-                            self.checkpointer['iteration_number'],
-                        )
+                            self.memory.save_context(reasoning_result)
 
-                        tool_calls: list[TinyToolCall] = []
-                        async for msg in self._stream_action(
-                            run_id=run_id, reasoning=reasoning_result.content
-                        ):
-                            if msg.is_message and isinstance(
-                                msg.message, TinyChatMessageChunk
-                            ):
-                                self.checkpointer['returned_final_answer'] = True
-                                self.checkpointer['yielded_final_answer'] += (
-                                    msg.message.content
-                                )
+                            yield reasoning_result.content
 
-                                yield msg.message.content
+                        else:
+                            logger.debug(
+                                '[%d. ITERATION - Streaming Action]',
+                                self.checkpointer['iteration_number'],
+                            )
 
-                            elif msg.is_tool_call and isinstance(
-                                msg.full_tool_call, TinyToolCall
+                            tool_calls: list[TinyToolCall] = []
+                            async for msg in self._stream_action(
+                                run_id=run_id, reasoning=reasoning_result.content
                             ):
-                                full_tc = msg.full_tool_call
-                                called_tool = self.get_tool(full_tc.tool_name)
-                                if called_tool:
-                                    tool_result = await self.run_tool(
-                                        run_id=run_id, tool=called_tool, call=full_tc
+                                if msg.is_message and isinstance(
+                                    msg.message, TinyChatMessageChunk
+                                ):
+                                    self.checkpointer['returned_final_answer'] = True
+                                    self.checkpointer['yielded_final_answer'] += (
+                                        msg.message.content
                                     )
 
-                                    self.memory.save_context(full_tc)
-                                    self.memory.save_context(tool_result)
-
-                                    tool_calls.append(full_tc)
+                                    yield msg.message.content
 
-                                    if isinstance(called_tool, ReasoningTool):
-                                        reasoning = full_tc.arguments.get(
-                                            'reasoning', ''
+                                elif msg.is_tool_call and isinstance(
+                                    msg.full_tool_call, TinyToolCall
+                                ):
+                                    full_tc = msg.full_tool_call
+                                    called_tool = self.get_tool(full_tc.tool_name)
+                                    if called_tool:
+                                        tool_result = await self.run_tool(
+                                            run_id=run_id, tool=called_tool, call=full_tc
                                         )
-                                        logger.debug(
-                                            '[%d. ITERATION - Tool Reasoning]: %s',
-                                            self.checkpointer['iteration_number'],
-                                            reasoning,
-                                        )
-                                        await self.on_tool_reasoning(
-                                            run_id=run_id, reasoning=reasoning, kwargs={}
+
+                                        self.memory.save_context(full_tc)
+                                        self.memory.save_context(tool_result)
+
+                                        tool_calls.append(full_tc)
+
+                                        if isinstance(
+                                            materialize_tool(called_tool), ReasoningTool
+                                        ):
+                                            reasoning = full_tc.arguments.get(
+                                                'reasoning', ''
+                                            )
+                                            logger.debug(
+                                                '[%d. ITERATION - Tool Reasoning]: %s',
+                                                self.checkpointer['iteration_number'],
+                                                reasoning,
+                                            )
+                                            await self.on_tool_reasoning(
+                                                run_id=run_id,
+                                                reasoning=reasoning,
+                                                kwargs={},
+                                            )
+                                    else:
+                                        logger.error(
+                                            'Tool %s not found. Skipping tool call.',
+                                            full_tc.tool_name,
                                         )
-                                else:
-                                    logger.error(
-                                        'Tool %s not found. Skipping tool call.',
+
+                                    logger.debug(
+                                        '[%s. ITERATION - Tool Call]: %s(%s) = %s',
+                                        self.checkpointer['iteration_number'],
                                         full_tc.tool_name,
+                                        full_tc.arguments,
+                                        full_tc.result,
                                     )
 
-                                logger.debug(
-                                    '[%s. ITERATION - Tool Call]: %s(%s) = %s',
-                                    self.checkpointer['iteration_number'],
-                                    full_tc.tool_name,
-                                    full_tc.arguments,
-                                    full_tc.result,
+                            if self.checkpointer['yielded_final_answer']:
+                                self.memory.save_context(
+                                    TinyChatMessage(
+                                        content=self.checkpointer['yielded_final_answer']
+                                    )
                                 )
 
-                        if self.checkpointer['yielded_final_answer']:
-                            self.memory.save_context(
-                                TinyChatMessage(
-                                    content=self.checkpointer['yielded_final_answer']
+                            self.checkpointer['react_iterations'].append(
+                                self.TinyReactIteration(
+                                    iteration_number=self.checkpointer[
+                                        'iteration_number'
+                                    ],
+                                    tool_calls=tool_calls,
+                                    reasoning=reasoning_result.content,
                                 )
                             )
+                    except Exception as e:
+                        logger.warning('Error happen during main react loop %s', e)
+                        await self.on_error(run_id=run_id, e=e, kwargs={})
+                        raise e
+                    finally:
+                        self.checkpointer['iteration_number'] += 1
+
+                self._auto_checkpoint()
+
+            if not self.checkpointer['returned_final_answer']:
+                logger.warning(
+                    'Max iterations reached without final answer. Using fallback.'
+                    'Returning fallback answer.'
+                )
 
-                        self.checkpointer['react_iterations'].append(
-                            self.TinyReactIteration(
-                                iteration_number=self.checkpointer['iteration_number'],
-                                tool_calls=tool_calls,
-                                reasoning=reasoning_result.content,
-                            )
-                        )
-                except Exception as e:
-                    logger.warning('Error happen during main react loop %s', e)
-                    await self.on_error(run_id=run_id, e=e, kwargs={})
-                    raise e
-                finally:
-                    self.checkpointer['iteration_number'] += 1
-
-        if not self.checkpointer['returned_final_answer']:
-            logger.warning(
-                'Max iterations reached without final answer. Using fallback.'
-                'Returning fallback answer.'
-            )
+                yielded_fallback = False
+                final_yielded_answer = ''
 
-            yielded_fallback = False
-            final_yielded_answer = ''
+                async for fallback_chunk in self._stream_fallback(
+                    run_id=run_id, task=input_text
+                ):
+                    yielded_fallback = True
+                    final_yielded_answer += fallback_chunk
 
-            async for fallback_chunk in self._stream_fallback(
-                run_id=run_id, task=input_text
-            ):
-                yielded_fallback = True
-                final_yielded_answer += fallback_chunk
+                    yield fallback_chunk
 
-                yield fallback_chunk
+                if not yielded_fallback:
+                    raise RuntimeError(
+                        'Something went wrong, cannot return answer from react agent.'
+                    )
 
-            if not yielded_fallback:
-                raise RuntimeError(
-                    'Something went wrong, cannot return answer from react agent.'
-                )
+                self.memory.save_context(TinyChatMessage(content=final_yielded_answer))
 
-            self.memory.save_context(TinyChatMessage(content=final_yielded_answer))
+                self.checkpointer['returned_final_answer'] = True
+                self.checkpointer['yielded_final_answer'] = final_yielded_answer
+                self._auto_checkpoint()
+        finally:
+            await self._finish_auto_checkpoint()
 
     def reset(self) -> None:
         super().reset()
@@ -415,6 +465,7 @@ class TinyReActAgent(TinyBaseAgent):
         if history:
             self.memory.save_multiple_context(history)
 
+        self._checkpoint_id = checkpoint_id
         if checkpoint_id:
             self.checkpointer.load(checkpoint_id)
 
@@ -433,12 +484,17 @@ class TinyReActAgent(TinyBaseAgent):
         self.setup(reset=reset, history=history, checkpoint_id=checkpoint_id)
 
         async def _run() -> str:
-            final_answer = ''
-            async for output in self._run_agent(run_id=run_id, input_text=input_text):
-                final_answer += output
-
-            await self.on_answer(run_id=run_id, answer=final_answer, kwargs={})
-            return final_answer
+            try:
+                final_answer = ''
+                async for output in self._run_agent(
+                    run_id=run_id, input_text=input_text
+                ):
+                    final_answer += output
+
+                await self.on_answer(run_id=run_id, answer=final_answer, kwargs={})
+                return final_answer
+            finally:
+                await self.on_run_end(run_id=run_id, kwargs={})
 
         return run_async_in_executor(_run)
 
@@ -457,13 +513,18 @@ class TinyReActAgent(TinyBaseAgent):
         self.setup(reset=reset, history=history, checkpoint_id=checkpoint_id)
 
         async def _generator():
-            idx = 0
-            async for res in self._run_agent(run_id=run_id, input_text=input_text):
-                await self.on_answer_chunk(
-                    run_id=run_id, chunk=res, idx=str(idx), kwargs={}
-                )
-                idx += 1
-                yield res
+            try:
+                idx = 0
+                dispatch_chunks = self.handles('on_answer_chunk')
+                async for res in self._run_agent(run_id=run_id, input_text=input_text):
+                    if dispatch_chunks:
+                        await self.on_answer_chunk(
+                            run_id=run_id, chunk=res, idx=str(idx), kwargs={}
+                        )
+                    idx += 1
+                    yield res
+            finally:
+                await self.on_run_end(run_id=run_id, kwargs={})
 
         return _generator()
 
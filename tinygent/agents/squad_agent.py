@@ -87,6 +87,7 @@ class TinySquadAgentConfig(TinyBaseAgentConfig['TinySquadAgent']):
 
     prompt_template: SquadPromptTemplate = Field(default=_DEFAULT_PROMPT)
     squad: list[AgentSquadMemberConfig] = Field(...)
+    tool_timeout: float | None = Field(default=None)
 
     def build(self) -> TinySquadAgent:
         return TinySquadAgent(
@@ -97,6 +98,7 @@ class TinySquadAgentConfig(TinyBaseAgentConfig['TinySquadAgent']):
             squad=[AgentSquadMember.from_config(agent_cfg) for agent_cfg in self.squad],
             checkpointer=self.build_checkpointer_instance(),
             prompt_template=self.prompt_template,
+            tool_timeout=self.tool_timeout,
         )
 
     @model_validator(mode='after')
@@ -139,6 +141,10 @@ class TinySquadAgent(TinyBaseAgent):
         tools: List of tools available (typically empty, as tools are on sub-agents)
         squad: List of squad members (specialized agents with names and descriptions)
         middleware: List of middleware to apply during execution
+        checkpointer: Checkpointer holding the agent state between runs
+        tool_timeout: Seconds to wait for a tool call before cancelling it, for
+            tools without their own `timeout`; also the default of squad
+            members without their own `tool_timeout` (default: None = no limit)
     """
 
     def __init__(
@@ -150,6 +156,7 @@ class TinySquadAgent(TinyBaseAgent):
         squad: list[AgentSquadMember] = [],
         middleware: Sequence[AbstractMiddleware] = [],
         checkpointer: AbstractCheckpointer | None = None,
+        tool_timeout: float | None = None,
     ) -> None:
         super().__init__(
             llm=llm,
@@ -157,9 +164,15 @@ class TinySquadAgent(TinyBaseAgent):
             memory=memory,
             middleware=middleware,
             checkpointer=checkpointer,
+            tool_timeout=tool_timeout,
         )
 
         self._squad = [self._normalize_squad_member(member) for member in squad]
+        if tool_timeout is not None:
+            for member in self._squad:
+                agent = member.agent
+                if isinstance(agent, TinyBaseAgent) and agent.tool_timeout is None:
+                    agent.tool_timeout = tool_timeout
 
         self.prompt_template = prompt_template
 
@@ -176,6 +189,9 @@ class TinySquadAgent(TinyBaseAgent):
             m.on_answer = _empty  # type: ignore[method-assign]
             m.on_answer_chunk = _empty  # type: ignore[method-assign]
 
+        # recompile the dispatch table so the patched hooks are used
+        member.agent.middleware = member.agent.middleware
+
         return member
 
     def _get_squad_member(self, name: str) -> AgentSquadMember:
@@ -339,12 +355,17 @@ class TinySquadAgent(TinyBaseAgent):
         self.setup(reset=reset, history=history, checkpoint_id=checkpoint_id)
 
         async def _run() -> str:
-            final_answer = ''
-            async for output in self._run_agent(run_id=run_id, input_text=input_text):
-                final_answer += output
+            try:
+                final_answer = ''
+                async for output in self._run_agent(
+                    run_id=run_id, input_text=input_text
+                ):
+                    final_answer += output
 
-            await self.on_answer(run_id=run_id, answer=final_answer, kwargs={})
-            return final_answer
+                await self.on_answer(run_id=run_id, answer=final_answer, kwargs={})
+                return final_answer
+            finally:
+                await self.on_run_end(run_id=run_id, kwargs={})
 
         return run_async_in_executor(_run)
 
@@ -363,13 +384,18 @@ class TinySquadAgent(TinyBaseAgent):
         self.setup(reset=reset, history=history, checkpoint_id=checkpoint_id)
 
         async def _generator():
-            idx = 0
-            async for res in self._run_agent(run_id=run_id, input_text=input_text):
-                await self.on_answer_chunk(
-                    run_id=run_id, chunk=res, idx=str(idx), kwargs={}
-                )
-                idx += 1
-                yield res
+            try:
+                idx = 0
+                dispatch_chunks = self.handles('on_answer_chunk')
+                async for res in self._run_agent(run_id=run_id, input_text=input_text):
+                    if dispatch_chunks:
+                        await self.on_answer_chunk(
+                            run_id=run_id, chunk=res, idx=str(idx), kwargs={}
+                        )
+                    idx += 1
+                    yield res
+            finally:
+                await self.on_run_end(run_id=run_id, kwargs={})
 
         return _generator()
 
@@ -1,6 +1,7 @@
 import logging
 from typing import Callable
 from typing import Sequence
+from typing import TypeVar
 
 from pydantic import PrivateAttr
 
@@ -12,18 +13,31 @@ from tinygent.core.types.base import TinyModel
 
 logger = logging.getLogger(__name__)
 
+M = TypeVar('M')
+
 
 class BaseChatHistory(TinyModel):
+    """Ordered chat history with incrementally maintained filtered views.
+
+    Filters are evaluated once per message when it is inserted, so reading
+    `messages`, `len()` and type-indexed access never rescan the history.
+    The lists returned by `messages` and `get_messages_by_type` are live views
+    and must not be mutated directly; use the `add_*`, `pop_message` and
+    `clear` methods instead.
+    """
+
     _messages: list[AllTinyMessages] = PrivateAttr(default_factory=list)
     _filters: dict[str, Callable[[AllTinyMessages], bool]] = PrivateAttr(
         default_factory=dict
     )
+    _view: list[AllTinyMessages] = PrivateAttr(default_factory=list)
+    _type_index: dict[type, list[AllTinyMessages]] = PrivateAttr(default_factory=dict)
 
     @property
     def messages(self) -> list[AllTinyMessages]:
         if not self._filters:
             return self._messages
-        return [m for m in self._messages if all(f(m) for f in self._filters.values())]
+        return self._view
 
     @messages.setter
     def messages(self, value: list[AllTinyMessages]) -> None:
@@ -31,15 +45,45 @@ class BaseChatHistory(TinyModel):
             "Direct assignment to 'messages' is not allowed. Use 'add_message' or 'add_messages' methods."
         )
 
+    @property
+    def all_messages(self) -> list[AllTinyMessages]:
+        """All messages, including those hidden by filters (live, read-only)."""
+        return self._messages
+
+    def get_messages_by_type(self, message_type: type[M]) -> list[M]:
+        """Return all visible messages of exactly the given type, in order."""
+        return self._type_index.get(message_type, [])  # type: ignore[return-value]
+
+    def _matches(self, message: AllTinyMessages) -> bool:
+        return all(f(message) for f in self._filters.values())
+
+    def _index(self, message: AllTinyMessages) -> None:
+        if self._filters:
+            if not self._matches(message):
+                return
+            self._view.append(message)
+        self._type_index.setdefault(type(message), []).append(message)
+
+    def _rebuild_views(self) -> None:
+        self._view = (
+            [m for m in self._messages if self._matches(m)] if self._filters else []
+        )
+        self._type_index = {}
+        for message in self.messages:
+            self._type_index.setdefault(type(message), []).append(message)
+
     def add_message(self, message: AllTinyMessages) -> None:
         logger.debug('Adding message to chat history: %s', message)
 
-        self.messages.append(message)
+        self._messages.append(message)
+        self._index(message)
 
     def add_messages(self, messages: Sequence[AllTinyMessages]) -> None:
         logger.debug('Adding multiple messages to chat history: %s', messages)
 
-        self.messages.extend(messages)
+        for message in messages:
+            self._messages.append(message)
+            self._index(message)
 
     def add_ai_message(self, message: TinyAIMessage | str) -> None:
         logger.debug('Adding AI message to chat history: %s', message)
@@ -47,7 +91,7 @@ class BaseChatHistory(TinyModel):
         if isinstance(message, str):
             message = TinyChatMessage(content=message)
 
-        self.messages.append(message)
+        self.add_message(message)
 
     def add_human_message(self, message: str | TinyHumanMessage) -> None:
         logger.debug('Adding human message to chat history: %s', message)
@@ -55,11 +99,45 @@ class BaseChatHistory(TinyModel):
         if isinstance(message, str):
             message = TinyHumanMessage(content=message)
 
-        self.messages.append(message)
+        self.add_message(message)
+
+    def pop_message(self, index: int = -1) -> AllTinyMessages:
+        """Remove and return the message at `index` of the unfiltered history."""
+        message = self._messages.pop(index)
+
+        for view in (self._view, self._type_index.get(type(message))):
+            if not view:
+                continue
+            # Popping from either end is the common case, check it before scanning.
+            if view[0] is message:
+                view.pop(0)
+            elif view[-1] is message:
+                view.pop()
+            else:
+                for i, m in enumerate(view):
+                    if m is message:
+                        del view[i]
+                        break
+
+        return message
+
+    def pop_visible_message(self, index: int = -1) -> AllTinyMessages:
+        """Remove and return the message at `index` of the filtered `messages` view."""
+        if not self._filters:
+            return self.pop_message(index)
+
+        message = self._view[index]
+        for i, m in enumerate(self._messages):
+            if m is message:
+                return self.pop_message(i)
+        raise IndexError('message of the view is missing from the history')
 
     def clear(self) -> None:
         logger.debug('Clearing chat history')
-        self.messages.clear()
+
+        self._messages.clear()
+        self._view.clear()
+        self._type_index.clear()
 
     def add_filter(self, name: str, func: Callable[[AllTinyMessages], bool]) -> None:
         logger.debug('Adding filter to chat history: %s', name)
@@ -67,6 +145,7 @@ class BaseChatHistory(TinyModel):
         if name in self._filters:
             raise ValueError(f"Filter with name '{name}' already exists.")
         self._filters[name] = func
+        self._rebuild_views()
 
     def remove_filter(self, name: str) -> None:
         logger.debug('Removing filter from chat history: %s', name)
@@ -74,10 +153,14 @@ class BaseChatHistory(TinyModel):
         if name not in self._filters:
             raise ValueError(f"Filter with name '{name}' does not exist.")
         self._filters.pop(name)
+        self._rebuild_views()
 
     def list_filters(self) -> list[str]:
         return list(self._filters.keys())
 
+    def __len__(self) -> int:
+        return len(self.messages)
+
     def __str__(self) -> str:
         parts = []
 
@@ -35,6 +35,22 @@ class AbstractCheckpointer(ABC):
         """Delete desired checkpoint."""
         pass
 
+    def snapshot(self) -> Any:
+        """Capture the current state independently of later mutations.
+
+        The returned value is opaque and only meant to be passed back to
+        `save_snapshot`, which allows persisting it off the agent's critical path.
+        """
+        raise NotImplementedError(
+            f'{self.__class__.__name__} does not support snapshots.'
+        )
+
+    def save_snapshot(self, checkpoint_id: str, snapshot: Any) -> None:
+        """Persist a state previously captured by `snapshot`."""
+        raise NotImplementedError(
+            f'{self.__class__.__name__} does not support snapshots.'
+        )
+
     @abstractmethod
     def set_data(self, data: dict[str, Any]) -> None:
         """Set checkpoint data manyally."""
@@ -66,6 +66,17 @@ class AbstractMiddleware(ABC):
         """Called after a tool execution completes."""
         pass
 
+    async def on_tool_chunk(
+        self,
+        *,
+        run_id: str,
+        tool: AbstractTool,
+        chunk: Any,
+        idx: str,
+        kwargs: dict[str, Any],
+    ) -> None:
+        """Called when a streaming tool produces a chunk of its result."""
+
     @abstractmethod
     async def on_plan(self, *, run_id: str, plan: str, kwargs: dict[str, Any]) -> None:
         """Called when the agent creates a plan."""
@@ -105,3 +116,6 @@ class AbstractMiddleware(ABC):
     ) -> None:
         """Called when an error occurs during agent execution."""
         pass
+
+    async def on_run_end(self, *, run_id: str, kwargs: dict[str, Any]) -> None:
+        """Called when a run ends: it answered, failed or its stream was closed."""
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import Awaitable
 import typing
 from typing import Any
 from typing import Callable
@@ -61,5 +62,16 @@ class AbstractTool(ABC):
         """Get information about the tool's cache."""
         pass
 
+    async def stream(
+        self, on_chunk: Callable[[Any], Awaitable[None]], *args: Any, **kwargs: Any
+    ) -> Any:
+        """Invoke the tool, passing each produced chunk to `on_chunk`.
+
+        Returns the same result as calling the tool. Tools producing their
+        output incrementally (generators) override this; by default the tool
+        is called and produces no chunks.
+        """
+        return self(*args, **kwargs)
+
     def __repr__(self) -> str:
         return self.__str__()
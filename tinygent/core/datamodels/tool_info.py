@@ -5,13 +5,22 @@ from dataclasses import field
 from dataclasses import fields
 import inspect
 import sys
+import threading
+from types import NoneType
+from types import UnionType
+from typing import Annotated
 from typing import Any
 from typing import Callable
 from typing import Generic
+from typing import Literal
 from typing import TextIO
 from typing import TypeVar
+from typing import Union
 from typing import cast
+from typing import get_args
+from typing import get_origin
 from typing import get_type_hints
+import weakref
 
 from pydantic import Field
 
@@ -20,6 +29,93 @@ from tinygent.core.types.base import TinyModel
 P = TypeVar('P')
 R = TypeVar('R')
 
+ToolExecutionMode = Literal['inline', 'thread', 'process']
+
+_PLAIN_TYPES = (str, int, float, bool, bytes, NoneType)
+_PLAIN_CONTAINERS = (list, dict, tuple, set, frozenset, Union, UnionType)
+
+
+def _is_plain_annotation(annotation: Any) -> bool:
+    """Check if validated values of the annotation are plain Python values."""
+    if annotation in _PLAIN_TYPES:
+        return True
+
+    origin = get_origin(annotation)
+    if origin is Literal:
+        return True
+    if origin is Annotated:
+        return _is_plain_annotation(get_args(annotation)[0])
+    if origin not in _PLAIN_CONTAINERS:
+        return False
+
+    return all(a is Ellipsis or _is_plain_annotation(a) for a in get_args(annotation))
+
+
+def _is_plain_schema(schema: type[TinyModel]) -> bool:
+    """Check if dumping the validated schema returns its attributes unchanged."""
+    return all(_is_plain_annotation(f.annotation) for f in schema.model_fields.values())
+
+
+_FIELD_NAMES: dict[type, frozenset[str]] = {}
+
+
+def _field_names(cls: type) -> frozenset[str]:
+    names = _FIELD_NAMES.get(cls)
+    if names is None:
+        names = _FIELD_NAMES[cls] = frozenset(f.name for f in fields(cls))
+    return names
+
+
+def _compile_argument_validator(
+    schema: type[TinyModel],
+) -> Callable[[dict[str, Any]], dict[str, Any]]:
+    """Build a validator returning the validated arguments of the schema.
+
+    Schemas of plain values (strings, numbers, containers of them) take the
+    validated attributes directly instead of dumping the model.
+    """
+    validate = schema.__pydantic_validator__.validate_python
+
+    if _is_plain_schema(schema):
+
+        def validate_plain(arguments: dict[str, Any]) -> dict[str, Any]:
+            return dict(validate(arguments).__dict__)
+
+        return validate_plain
+
+    def validate_and_dump(arguments: dict[str, Any]) -> dict[str, Any]:
+        return validate(arguments).model_dump()
+
+    return validate_and_dump
+
+
+@dataclass(frozen=True)
+class _CallableSpec:
+    """Introspection results of a tool callable, shared by all its ToolInfos."""
+
+    name: str
+    description: str
+    arg_count: int
+    is_coroutine: bool
+    is_generator: bool
+    is_async_generator: bool
+    input_schema: type[TinyModel]
+    output_schema: type[TinyModel] | None
+    required_fields: tuple[str, ...]
+    uses_auto_schema: bool
+    argument_validator: Callable[[dict[str, Any]], dict[str, Any]] | None
+
+
+# introspecting a callable builds pydantic models, which is slow, so the
+# results are kept per callable for the lifetime of the callable
+_SPEC_CACHE: weakref.WeakKeyDictionary[Callable[..., Any], _CallableSpec] = (
+    weakref.WeakKeyDictionary()
+)
+_METHOD_SPEC_CACHE: weakref.WeakKeyDictionary[Callable[..., Any], _CallableSpec] = (
+    weakref.WeakKeyDictionary()
+)
+_SPEC_CACHE_LOCK = threading.Lock()
+
 
 @dataclass
 class ToolInfo(Generic[R]):
@@ -61,6 +157,17 @@ class ToolInfo(Generic[R]):
     uses_auto_schema: bool = False
     """Indicates if the input schema was auto-generated from regular function parameters."""
 
+    timeout: float | None = None
+    """Seconds an agent waits for the tool before cancelling the call (None = agent default)."""
+
+    execution: ToolExecutionMode = 'inline'
+    """Where agents run the sync tool: in the event loop, an executor thread or a worker process."""
+
+    argument_validator: Callable[[dict[str, Any]], dict[str, Any]] | None = field(
+        default=None, repr=False, compare=False
+    )
+    """Precompiled validator turning raw keyword arguments into call arguments."""
+
     @classmethod
     def build_input_model_from_fn(
         cls,
@@ -116,7 +223,55 @@ class ToolInfo(Generic[R]):
 
     @classmethod
     def from_callable(cls, fn: Callable[..., R], *args, **kwargs) -> ToolInfo[R]:
-        """Create a ToolInfo instance from a callable function."""
+        """Create a ToolInfo instance from a callable function.
+
+        The introspection of `fn` (signature, docstring, input and output
+        models) is memoized per callable, so creating further ToolInfos for the
+        same callable only copies the cached results.
+        """
+        spec = cls._get_callable_spec(fn)
+
+        extra_kwargs = {
+            key: value for key, value in kwargs.items() if key in _field_names(cls)
+        }
+
+        return cls(
+            name=spec.name,
+            description=spec.description,
+            arg_count=spec.arg_count,
+            is_coroutine=spec.is_coroutine,
+            is_generator=spec.is_generator,
+            is_async_generator=spec.is_async_generator,
+            input_schema=spec.input_schema,
+            output_schema=spec.output_schema,
+            required_fields=list(spec.required_fields),
+            uses_auto_schema=spec.uses_auto_schema,
+            argument_validator=spec.argument_validator,
+            **extra_kwargs,
+        )
+
+    @classmethod
+    def _get_callable_spec(cls, fn: Callable[..., Any]) -> _CallableSpec:
+        # bound methods are recreated on every attribute access, so they are
+        # keyed by their function (the spec does not depend on the instance)
+        if inspect.ismethod(fn):
+            cache, key = _METHOD_SPEC_CACHE, fn.__func__
+        else:
+            cache, key = _SPEC_CACHE, fn
+
+        try:
+            spec = cache.get(key)
+        except TypeError:  # not weak-referenceable
+            return cls._introspect(fn)
+
+        if spec is None:
+            spec = cls._introspect(fn)
+            with _SPEC_CACHE_LOCK:
+                cache[key] = spec
+        return spec
+
+    @classmethod
+    def _introspect(cls, fn: Callable[..., Any]) -> _CallableSpec:
         name = fn.__name__
         description = inspect.getdoc(fn) or ''
 
@@ -132,11 +287,11 @@ class ToolInfo(Generic[R]):
             param = next(iter(sig.parameters.values()))
             input_schema = cast(type[TinyModel], param.annotation)
 
-        required_fields = [
+        required_fields = tuple(
             fname
-            for fname, field in input_schema.model_fields.items()  # type: ignore[attr-defined]
+            for fname, field in input_schema.model_fields.items()
             if field.is_required()
-        ]
+        )
 
         return_annotation = sig.return_annotation
         if (
@@ -156,15 +311,10 @@ class ToolInfo(Generic[R]):
         else:
             output_schema = None
 
-        field_names = {f.name for f in fields(cls)}
-        extra_kwargs = {
-            key: value for key, value in kwargs.items() if key in field_names
-        }
-
-        return cls(
+        return _CallableSpec(
             name=name,
             description=description,
-            arg_count=1,  # TODO: its not always 1 right now, tool accepts normal params as well so repair it here
+            arg_count=len(sig.parameters),
             is_coroutine=is_coroutine,
             is_generator=is_generator,
             is_async_generator=is_async_generator,
@@ -172,9 +322,22 @@ class ToolInfo(Generic[R]):
             output_schema=output_schema,
             required_fields=required_fields,
             uses_auto_schema=uses_auto_schema,
-            **extra_kwargs,
+            argument_validator=(
+                _compile_argument_validator(input_schema) if uses_auto_schema else None
+            ),
         )
 
+    def validate_arguments(self, arguments: dict[str, Any]) -> dict[str, Any]:
+        """Validate keyword arguments of an auto-schema tool.
+
+        Returns the validated arguments as keyword arguments for the callable.
+        """
+        validator = self.argument_validator
+        if validator is None:
+            schema = cast(type[TinyModel], self.input_schema)
+            validator = self.argument_validator = _compile_argument_validator(schema)
+        return validator(arguments)
+
     def print_summary(self, stream: TextIO = sys.stdout):
         """Print a summary of the tool's metadata to the specified stream."""
 
@@ -0,0 +1,333 @@
+from __future__ import annotations
+
+from abc import ABC
+from abc import abstractmethod
+import hashlib
+import logging
+import os
+from pathlib import Path
+import re
+import sqlite3
+import threading
+
+from tinygent.core.types.base import TinyModel
+
+logger = logging.getLogger(__name__)
+
+
+class TinyBlobHandle(TinyModel):
+    """Reference to a large tool result kept in a `TinyBlobStore`.
+
+    Messages, memories and checkpoints hold the handle instead of the result,
+    so the payload is stored once however often the state is copied.
+    """
+
+    blob_id: str
+    size: int
+    lines: int
+    pages: int
+    preview: str
+
+    def to_string(self) -> str:
+        """Return the preview with instructions for reading the rest, for prompts."""
+        return (
+            f'[Large result stored as blob "{self.blob_id}": {self.size} characters, '
+            f'{self.lines} lines. Preview:]\n'
+            f'{self.preview}\n'
+            f'[... Call read_blob(blob_id="{self.blob_id}", page=N) with N from 1 to '
+            f'{self.pages}, or grep_blob(blob_id="{self.blob_id}", pattern="...") '
+            'to see more.]'
+        )
+
+    def __str__(self) -> str:
+        return f'<blob {self.blob_id}: {self.size} characters>'
+
+
+class TinyBlobStoreStats(TinyModel):
+    """Point-in-time counters of a `TinyBlobStore`."""
+
+    blobs: int
+    chars: int
+    runs: int
+    rejected: int
+
+
+class TinyBlobBackend(ABC):
+    """Durable storage of blob contents, keyed by blob id.
+
+    Backends doing I/O set `blocking` to True, so async callers run their
+    methods in an executor instead of on the event loop.
+    """
+
+    blocking: bool = False
+
+    @abstractmethod
+    def get(self, blob_id: str) -> str | None:
+        """Return the stored content, or None if the blob is missing."""
+
+    @abstractmethod
+    def put(self, blob_id: str, content: str) -> None:
+        """Store the content under the blob id, keeping an existing copy."""
+
+    @abstractmethod
+    def delete(self, blob_id: str) -> None:
+        """Remove the blob, if stored."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all blobs."""
+
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    blob_id TEXT PRIMARY KEY,
+    content TEXT NOT NULL
+)
+"""
+
+
+class TinySQLiteBlobBackend(TinyBlobBackend):
+    """Blob backend keeping contents in a SQLite database file.
+
+    Connections are opened per thread and per process, and the database runs
+    in WAL mode, so several processes can share one file. Blobs stay in the
+    file until they are deleted, since checkpoints saved by earlier runs may
+    still reference them.
+
+    Args:
+        path: Path to the SQLite database file
+    """
+
+    blocking = True
+
+    def __init__(self, path: str | Path = 'tinygent_blobs.db') -> None:
+        self.path = str(path)
+        self._local = threading.local()
+
+        with self._connection() as conn:
+            conn.executescript(_SQLITE_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn: sqlite3.Connection | None = getattr(self._local, 'conn', None)
+        # connections must not be shared with a forked child process
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30.0)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def get(self, blob_id: str) -> str | None:
+        row = (
+            self._connection()
+            .execute('SELECT content FROM blobs WHERE blob_id = ?', (blob_id,))
+            .fetchone()
+        )
+        return None if row is None else str(row[0])
+
+    def put(self, blob_id: str, content: str) -> None:
+        with self._connection() as conn:
+            conn.execute(
+                'INSERT OR IGNORE INTO blobs (blob_id, content) VALUES (?, ?)',
+                (blob_id, content),
+            )
+
+    def delete(self, blob_id: str) -> None:
+        with self._connection() as conn:
+            conn.execute('DELETE FROM blobs WHERE blob_id = ?', (blob_id,))
+
+    def clear(self) -> None:
+        with self._connection() as conn:
+            conn.execute('DELETE FROM blobs')
+
+
+class TinyBlobStore:
+    """Thread-safe in-memory store of large tool results, scoped to runs.
+
+    Blobs are addressed by a hash of their content, so the same result saved
+    repeatedly is kept once. Every blob records the runs which stored it and
+    is dropped when all of them are released with `release_run`. Stored blobs
+    are never evicted, since messages and checkpoints may still reference
+    them: once the store holds `max_chars` characters, `put` refuses new blobs
+    and callers keep the content where it was.
+
+    With a durable `backend`, every blob is also written there, and blobs not
+    in memory (released, over `max_chars`, or stored by another process) are
+    read from it. Checkpoints only hold `TinyBlobHandle`s, so a run resumed
+    in another process reads its blobs from the backend. Released blobs stay
+    in the backend until `delete` or `clear` removes them.
+
+    Args:
+        max_chars: Maximum total size of blobs kept in memory (None = unbounded)
+        preview_chars: Characters of a blob shown in its handle's preview
+        page_chars: Characters per page when reading a blob with `read_blob`
+        backend: Durable storage of the blobs (default: None = memory only)
+    """
+
+    def __init__(
+        self,
+        max_chars: int | None = 256 * 1024 * 1024,
+        preview_chars: int = 1000,
+        page_chars: int = 4000,
+        backend: TinyBlobBackend | None = None,
+    ) -> None:
+        self.max_chars = max_chars
+        self.preview_chars = preview_chars
+        self.page_chars = page_chars
+        self.backend = backend
+
+        self._lock = threading.Lock()
+        self._blobs: dict[str, str] = {}
+        self._owners: dict[str, set[str]] = {}
+        self._runs: dict[str, set[str]] = {}
+        self._chars = 0
+        self._rejected = 0
+
+    def _remove(self, blob_id: str) -> None:
+        content = self._blobs.pop(blob_id)
+        self._chars -= len(content)
+        for run_id in self._owners.pop(blob_id, ()):
+            self._runs.get(run_id, set()).discard(blob_id)
+
+    @property
+    def blocking(self) -> bool:
+        """Whether the store does I/O, so async callers should use an executor."""
+        return self.backend is not None and self.backend.blocking
+
+    def put(self, run_id: str, content: str) -> TinyBlobHandle | None:
+        """Store the content for the run and return its handle.
+
+        Returns None when the content does not fit into `max_chars` and there
+        is no backend to keep it.
+        """
+        blob_id = 'blob_' + hashlib.blake2b(content.encode(), digest_size=8).hexdigest()
+        if self.backend is not None:
+            self.backend.put(blob_id, content)
+
+        with self._lock:
+            if blob_id not in self._blobs:
+                if (
+                    self.max_chars is not None
+                    and self._chars + len(content) > self.max_chars
+                ):
+                    if self.backend is not None:
+                        # kept in the backend only
+                        return self._handle(blob_id, content)
+                    self._rejected += 1
+                    logger.warning(
+                        'Blob store is full (%d characters), not storing %d more',
+                        self._chars,
+                        len(content),
+                    )
+                    return None
+
+                self._blobs[blob_id] = content
+                self._chars += len(content)
+
+            self._owners.setdefault(blob_id, set()).add(run_id)
+            self._runs.setdefault(run_id, set()).add(blob_id)
+
+        return self._handle(blob_id, content)
+
+    def _handle(self, blob_id: str, content: str) -> TinyBlobHandle:
+        return TinyBlobHandle(
+            blob_id=blob_id,
+            size=len(content),
+            lines=content.count('\n') + 1,
+            pages=max(-(-len(content) // self.page_chars), 1),
+            preview=content[: self.preview_chars],
+        )
+
+    def get(self, blob_id: str) -> str | None:
+        """Return the stored content, or None if it is missing or was released."""
+        with self._lock:
+            content = self._blobs.get(blob_id)
+        if content is None and self.backend is not None:
+            content = self.backend.get(blob_id)
+        return content
+
+    def delete(self, blob_id: str) -> None:
+        """Remove the blob from memory and from the backend."""
+        with self._lock:
+            if blob_id in self._blobs:
+                self._remove(blob_id)
+        if self.backend is not None:
+            self.backend.delete(blob_id)
+
+    def grep(
+        self,
+        blob_id: str,
+        pattern: str,
+        max_matches: int = 50,
+        max_line_chars: int = 300,
+    ) -> list[tuple[int, str]] | None:
+        """Return numbered lines matching the pattern, or None if the blob is missing.
+
+        The pattern is a case-insensitive regular expression, or a plain
+        substring if it is not a valid expression.
+        """
+        content = self.get(blob_id)
+        if content is None:
+            return None
+
+        try:
+            regex = re.compile(pattern, re.IGNORECASE)
+        except re.error:
+            regex = re.compile(re.escape(pattern), re.IGNORECASE)
+
+        matches: list[tuple[int, str]] = []
+        for number, line in enumerate(content.splitlines(), start=1):
+            if regex.search(line):
+                matches.append((number, line[:max_line_chars]))
+                if len(matches) >= max_matches:
+                    break
+        return matches
+
+    def release_run(self, run_id: str) -> int:
+        """Drop the run's blobs not stored by other runs; return how many were dropped."""
+        removed = 0
+        with self._lock:
+            for blob_id in self._runs.pop(run_id, set()):
+                owners = self._owners.get(blob_id)
+                if owners is None:
+                    continue
+                owners.discard(run_id)
+                if not owners:
+                    self._remove(blob_id)
+                    removed += 1
+        return removed
+
+    def clear(self) -> None:
+        """Remove all blobs, also from the backend, keeping the statistics."""
+        with self._lock:
+            self._blobs.clear()
+            self._owners.clear()
+            self._runs.clear()
+            self._chars = 0
+        if self.backend is not None:
+            self.backend.clear()
+
+    def stats(self) -> TinyBlobStoreStats:
+        """Return the current size and the number of rejected blobs."""
+        with self._lock:
+            return TinyBlobStoreStats(
+                blobs=len(self._blobs),
+                chars=self._chars,
+                runs=len(self._runs),
+                rejected=self._rejected,
+            )
+
+    def __contains__(self, blob_id: str) -> bool:
+        with self._lock:
+            if blob_id in self._blobs:
+                return True
+        return self.backend is not None and self.backend.get(blob_id) is not None
+
+
+_GLOBAL_BLOB_STORE = TinyBlobStore()
+
+
+def get_global_blob_store() -> TinyBlobStore:
+    """Return the process-wide blob store shared by agents by default."""
+    return _GLOBAL_BLOB_STORE
@@ -0,0 +1,329 @@
+from __future__ import annotations
+
+from abc import ABC
+from abc import abstractmethod
+from collections import OrderedDict
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import pickle
+import sqlite3
+import threading
+import time
+from typing import Any
+
+from pydantic import BaseModel
+from pydantic import ValidationError
+
+from tinygent.core.datamodels.tool import AbstractTool
+
+logger = logging.getLogger(__name__)
+
+# default of `get_shared_sqlite_backend` limits, keeping the backend's current limit
+_KEEP: Any = object()
+
+
+def _to_jsonable(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode='json')
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    return repr(value)
+
+
+def canonical_arguments(tool: AbstractTool, args: dict[str, Any]) -> str:
+    """Return a canonical JSON form of the tool arguments.
+
+    Arguments are validated against the tool's input schema when possible, so
+    equivalent calls (coercible types, omitted defaults, different key order)
+    produce the same string.
+    """
+    normalized: Any = args
+    schema = tool.info.input_schema
+    if schema is not None:
+        try:
+            normalized = schema.model_validate(args).model_dump(mode='json')
+        except ValidationError:
+            # fall back to the raw arguments, the tool itself reports the error
+            normalized = args
+
+    return json.dumps(
+        normalized, sort_keys=True, separators=(',', ':'), default=_to_jsonable
+    )
+
+
+def tool_cache_key(tool: AbstractTool, args: dict[str, Any], version: str = '') -> str:
+    """Return the cache key of a tool call: tool name, version and canonical args."""
+    payload = f'{tool.info.name}\0{version}\0{canonical_arguments(tool, args)}'
+    return hashlib.blake2b(payload.encode(), digest_size=20).hexdigest()
+
+
+class TinyToolCacheBackend(ABC):
+    """Storage of cached tool results.
+
+    Backends doing I/O set `blocking` to True, so async callers run their
+    methods in an executor instead of on the event loop.
+    """
+
+    blocking: bool = False
+
+    @abstractmethod
+    def get(self, key: str) -> tuple[bool, Any]:
+        """Return `(True, value)` for a live entry, `(False, None)` otherwise."""
+        raise NotImplementedError('Subclasses must implement this method.')
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """Store the value, expiring after `ttl` seconds (None = never)."""
+        raise NotImplementedError('Subclasses must implement this method.')
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove the entry if present."""
+        raise NotImplementedError('Subclasses must implement this method.')
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries."""
+        raise NotImplementedError('Subclasses must implement this method.')
+
+    @abstractmethod
+    def delete_prefix(self, prefix: str) -> None:
+        """Remove all entries whose key starts with the prefix."""
+        raise NotImplementedError('Subclasses must implement this method.')
+
+    @abstractmethod
+    def count(self, prefix: str = '') -> int:
+        """Return the number of entries whose key starts with the prefix."""
+        raise NotImplementedError('Subclasses must implement this method.')
+
+
+class TinyMemoryToolCacheBackend(TinyToolCacheBackend):
+    """Thread-safe in-memory LRU cache backend.
+
+    Args:
+        max_entries: Maximum number of cached results (None = unbounded)
+    """
+
+    def __init__(self, max_entries: int | None = 1024) -> None:
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[Any, float | None]] = OrderedDict()
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return False, None
+
+            self._entries.move_to_end(key)
+            return True, value
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+
+            if self.max_entries is not None:
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                del self._entries[key]
+
+    def count(self, prefix: str = '') -> int:
+        with self._lock:
+            return sum(1 for k in self._entries if k.startswith(prefix))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tool_cache (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    expires_at REAL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_tool_cache_accessed_at ON tool_cache (accessed_at);
+"""
+
+
+class TinySQLiteToolCacheBackend(TinyToolCacheBackend):
+    """Persistent cache backend storing pickled results in a SQLite database.
+
+    The database runs in WAL mode with a busy timeout, so several processes can
+    share one cache file. Connections are opened per thread and per process, so
+    the backend also stays safe after `fork`. When more than `max_entries`
+    results or more than `max_bytes` of pickled data are stored, the least
+    recently used ones are deleted.
+
+    Note: values are serialized with `pickle`; only use cache files you trust.
+
+    Args:
+        path: Path to the SQLite database file
+        max_entries: Maximum number of cached results (None = unbounded)
+        max_bytes: Maximum total size of the pickled results (None = unbounded)
+    """
+
+    blocking = True
+
+    def __init__(
+        self,
+        path: str | Path = 'tinygent_tool_cache.db',
+        max_entries: int | None = 10_000,
+        max_bytes: int | None = None,
+    ) -> None:
+        self.path = str(path)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._local = threading.local()
+
+        with self._connection() as conn:
+            conn.executescript(_SQLITE_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn: sqlite3.Connection | None = getattr(self._local, 'conn', None)
+        # connections must not be shared with a forked child process
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30.0)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        now = time.time()
+        conn = self._connection()
+        row = conn.execute(
+            'SELECT value, expires_at FROM tool_cache WHERE key = ?', (key,)
+        ).fetchone()
+        if row is None:
+            return False, None
+
+        blob, expires_at = row
+        with conn:
+            if expires_at is not None and expires_at <= now:
+                conn.execute('DELETE FROM tool_cache WHERE key = ?', (key,))
+                return False, None
+            conn.execute(
+                'UPDATE tool_cache SET accessed_at = ? WHERE key = ?', (now, key)
+            )
+
+        try:
+            return True, pickle.loads(blob)
+        except Exception:
+            logger.warning('Dropping unreadable tool cache entry %s', key, exc_info=True)
+            self.delete(key)
+            return False, None
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            logger.warning(
+                'Tool result for %s is not picklable, not cached', key, exc_info=True
+            )
+            return
+
+        now = time.time()
+        with self._connection() as conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO tool_cache '
+                '(key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)',
+                (key, blob, None if ttl is None else now + ttl, now),
+            )
+            if self.max_entries is not None:
+                conn.execute(
+                    'DELETE FROM tool_cache WHERE key IN ('
+                    'SELECT key FROM tool_cache ORDER BY accessed_at DESC '
+                    'LIMIT -1 OFFSET ?)',
+                    (self.max_entries,),
+                )
+            if self.max_bytes is not None:
+                conn.execute(
+                    'DELETE FROM tool_cache WHERE key IN ('
+                    'SELECT key FROM (SELECT key, SUM(LENGTH(value)) OVER ('
+                    'ORDER BY accessed_at DESC, key) AS total FROM tool_cache) '
+                    'WHERE total > ?)',
+                    (self.max_bytes,),
+                )
+
+    def delete(self, key: str) -> None:
+        with self._connection() as conn:
+            conn.execute('DELETE FROM tool_cache WHERE key = ?', (key,))
+
+    def clear(self) -> None:
+        with self._connection() as conn:
+            conn.execute('DELETE FROM tool_cache')
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self._connection() as conn:
+            conn.execute(
+                'DELETE FROM tool_cache WHERE SUBSTR(key, 1, ?) = ?',
+                (len(prefix), prefix),
+            )
+
+    def count(self, prefix: str = '') -> int:
+        row = (
+            self._connection()
+            .execute(
+                'SELECT COUNT(*) FROM tool_cache WHERE SUBSTR(key, 1, ?) = ?',
+                (len(prefix), prefix),
+            )
+            .fetchone()
+        )
+        return int(row[0])
+
+
+# persistent backends are shared per database file, so tools caching into the
+# same file reuse one set of connections
+_SQLITE_BACKENDS: dict[str, TinySQLiteToolCacheBackend] = {}
+_SQLITE_BACKENDS_LOCK = threading.Lock()
+
+
+def get_shared_sqlite_backend(
+    path: str | Path = 'tinygent_tool_cache.db',
+    *,
+    max_entries: int | None = _KEEP,
+    max_bytes: int | None = _KEEP,
+) -> TinySQLiteToolCacheBackend:
+    """Return the process-wide SQLite tool cache backend of the database file.
+
+    Given limits apply to the shared backend, so they affect every tool
+    caching into the file. Omitted limits keep their current value (the
+    `TinySQLiteToolCacheBackend` defaults for a new backend); pass None to
+    remove a limit.
+    """
+    key = os.path.abspath(path)
+    with _SQLITE_BACKENDS_LOCK:
+        backend = _SQLITE_BACKENDS.get(key)
+        if backend is None:
+            backend = _SQLITE_BACKENDS[key] = TinySQLiteToolCacheBackend(path)
+        if max_entries is not _KEEP:
+            backend.max_entries = max_entries
+        if max_bytes is not _KEEP:
+            backend.max_bytes = max_bytes
+        return backend
@@ -1,17 +1,123 @@
 from __future__ import annotations
 
+from collections.abc import Awaitable
 import logging
+import threading
+import typing
+from typing import Any
 from typing import Callable
 
 from tinygent.core.datamodels.tool import AbstractTool
 
+if typing.TYPE_CHECKING:
+    from tinygent.core.datamodels.tool_info import ToolInfo
+
 logger = logging.getLogger(__name__)
 
+# attributes of specific tool classes (beyond AbstractTool) forwarded to the real tool
+_FORWARDED_ATTRIBUTES = frozenset({'reasoning'})
+
+
+class LazyTool(AbstractTool):
+    """Cheap descriptor of a catalog tool, materialized on first use.
+
+    The descriptor carries the tool's info (name, description and schema) so
+    agents, tool selectors and LLM tool schemas can use it without building
+    the tool. The real tool is created by its factory on the first call (or
+    when its `raw` function or cache info is needed) and reused afterwards.
+    Probing any other attribute does not build the tool.
+
+    Args:
+        name: Name of the tool in the catalog
+        factory: Creates the real tool
+        info: Returns the tool's info without building the tool
+            (None = the tool is materialized to get its info)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        factory: Callable[[], AbstractTool],
+        info: Callable[[], ToolInfo] | None = None,
+    ) -> None:
+        self._name = name
+        self._factory = factory
+        self._info_fn = info
+
+        self._lock = threading.Lock()
+        self._info: ToolInfo | None = None
+        self._tool: AbstractTool | None = None
+
+    @property
+    def is_materialized(self) -> bool:
+        """Whether the real tool was already created."""
+        return self._tool is not None
+
+    def materialize(self) -> AbstractTool:
+        """Return the real tool, creating it on the first call."""
+        tool = self._tool
+        if tool is None:
+            with self._lock:
+                tool = self._tool
+                if tool is None:
+                    logger.debug('Materializing tool %s', self._name)
+                    tool = self._tool = self._factory()
+        return tool
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.materialize()(*args, **kwargs)
+
+    async def stream(
+        self, on_chunk: Callable[[Any], Awaitable[None]], *args: Any, **kwargs: Any
+    ) -> Any:
+        return await self.materialize().stream(on_chunk, *args, **kwargs)
+
+    @property
+    def info(self) -> ToolInfo:
+        if self._tool is not None:
+            return self._tool.info
+        if self._info is None:
+            if self._info_fn is None:
+                return self.materialize().info
+            self._info = self._info_fn()
+        return self._info
+
+    @property
+    def raw(self) -> Callable[..., Any]:
+        return self.materialize().raw
+
+    def clear_cache(self) -> None:
+        if self._tool is not None:
+            self._tool.clear_cache()
+
+    def cache_info(self) -> Any:
+        return self.materialize().cache_info()
+
+    def __getattr__(self, name: str) -> Any:
+        if name not in _FORWARDED_ATTRIBUTES:
+            raise AttributeError(
+                f'{type(self).__name__!r} object has no attribute {name!r}'
+            )
+        return getattr(self.materialize(), name)
+
+    def __str__(self) -> str:
+        if self._tool is not None:
+            return str(self._tool)
+        return f'LazyTool - {self._name}\n'
+
+
+def materialize_tool(tool: AbstractTool) -> AbstractTool:
+    """Return the real tool behind a lazy catalog descriptor."""
+    if isinstance(tool, LazyTool):
+        return tool.materialize()
+    return tool
+
 
 class ToolCatalog:
     def __init__(self) -> None:
         self._tools: dict[str, Callable[[], AbstractTool]] = {}
         self._hidden_tools: dict[str, Callable[[], AbstractTool]] = {}
+        self._lazy_tools: dict[str, LazyTool] = {}
 
     def register(
         self,
@@ -19,8 +125,16 @@ class ToolCatalog:
         factory: Callable[[], AbstractTool],
         *,
         hidden: bool = False,
-    ) -> None:
-        """Register a tool factory by name."""
+        info: Callable[[], ToolInfo] | None = None,
+    ) -> LazyTool:
+        """Register a tool factory by name and return its lazy descriptor.
+
+        `info` returns the tool's info without calling the factory, so the
+        descriptor never builds the tool until it is used. The descriptor is
+        shared by everyone asking the catalog for the tool (e.g. the object a
+        `register_*` decorator returns and the agents using the catalog);
+        `get_tool` still builds a fresh one.
+        """
         logger.debug('Registering tool %s (hidden=%s)', name, hidden)
 
         if name in self._tools or name in self._hidden_tools:
@@ -31,6 +145,9 @@ class ToolCatalog:
         else:
             self._tools[name] = factory
 
+        lazy_tool = self._lazy_tools[name] = LazyTool(name, factory, info)
+        return lazy_tool
+
     def get_tool(self, name: str) -> AbstractTool:
         """Return a fresh Tool instance by name."""
         if name in self._tools:
@@ -39,12 +156,21 @@ class ToolCatalog:
             return self._hidden_tools[name]()
         raise ValueError(f'Tool {name} not registered.')
 
+    def get_lazy_tool(self, name: str) -> LazyTool:
+        """Return the lazy descriptor of a tool by name."""
+        lazy_tool = self._lazy_tools.get(name)
+        if lazy_tool is None:
+            raise ValueError(f'Tool {name} not registered.')
+        return lazy_tool
+
     def get_tools(self, include_hidden: bool = False) -> dict[str, AbstractTool]:
-        """Return fresh Tool instances for all registered tools."""
-        entries = (
-            {**self._tools, **self._hidden_tools} if include_hidden else self._tools
-        )
-        return {name: factory() for name, factory in entries.items()}
+        """Return the lazy descriptors of all registered tools.
+
+        A descriptor builds its tool on first use and reuses it afterwards,
+        so only the tools actually called pay their construction cost.
+        """
+        names = {**self._tools, **self._hidden_tools} if include_hidden else self._tools
+        return {name: self._lazy_tools[name] for name in names}
 
 
 class GlobalToolCatalog:
@@ -0,0 +1,453 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import wait
+from concurrent.futures.process import BrokenProcessPool
+import importlib
+import logging
+import multiprocessing
+import os
+import pickle
+import queue
+import threading
+import time
+from typing import Any
+
+from tinygent.core.datamodels.tool import AbstractTool
+from tinygent.core.runtime.executors import run_sync_in_executor
+
+logger = logging.getLogger(__name__)
+
+# timed out sync tool calls, whose threads cannot be killed and finish on their own
+_ABANDONED_CALLS: set[Callable[[], None]] = set()
+_ABANDONED_CALLS_LOCK = threading.Lock()
+
+# sync tool calls with a timeout run on reusable daemon threads, which unlike
+# executor threads never block the shutdown of a loop or of the interpreter
+_TIMED_CALLS: queue.SimpleQueue[Callable[[], None]] = queue.SimpleQueue()
+_TIMED_THREADS_LOCK = threading.Lock()
+_MAX_IDLE_TIMED_THREADS = min(32, (os.cpu_count() or 1) + 4)
+_idle_timed_threads = 0
+
+# deadline and timeout of the process tool call made by the current thread
+_PROCESS_CALL = threading.local()
+
+_process_pool: ProcessPoolExecutor | None = None
+_process_pool_lock = threading.Lock()
+
+# idle single-worker pools running process tool calls with a timeout
+_timed_workers: list[ProcessPoolExecutor] = []
+
+_process_workers: int | None = int(os.getenv('TINY_TOOL_PROCESS_WORKERS', '0')) or None
+_max_payload_bytes = int(
+    os.getenv('TINY_TOOL_PROCESS_MAX_PAYLOAD_BYTES', str(64 * 1024 * 1024))
+)
+
+# functions resolved in a worker process, by module and qualified name
+_WORKER_FUNCTIONS: dict[tuple[str, str], Callable[..., Any]] = {}
+
+
+class ToolTimeoutError(TimeoutError):
+    """Exception raised when a tool call exceeds its timeout."""
+
+    def __init__(self, tool_name: str, timeout: float) -> None:
+        super().__init__(f'Tool {tool_name} timed out after {timeout:g} seconds.')
+        self.tool_name = tool_name
+        self.timeout = timeout
+
+
+class ToolPayloadTooLargeError(ValueError):
+    """Exception raised when process tool arguments or results exceed the size limit."""
+
+    def __init__(self, tool_name: str, what: str, size: int, limit: int) -> None:
+        super().__init__(
+            f'Serialized {what} of tool {tool_name} take {size} bytes, '
+            f'more than the limit of {limit} bytes.'
+        )
+        self.tool_name = tool_name
+        self.what = what
+        self.size = size
+        self.limit = limit
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # raised in worker processes, so it must survive pickling
+        return (type(self), (self.tool_name, self.what, self.size, self.limit))
+
+
+def abandoned_tool_threads() -> int:
+    """Return the number of timed out sync tool calls still running."""
+    with _ABANDONED_CALLS_LOCK:
+        return len(_ABANDONED_CALLS)
+
+
+def _run_on_timed_thread(call: Callable[[], None]) -> None:
+    """Run `call` on an idle timed-call thread, starting a new one if none is idle."""
+    global _idle_timed_threads
+
+    with _TIMED_THREADS_LOCK:
+        start = _idle_timed_threads == 0
+        if not start:
+            _idle_timed_threads -= 1
+
+    _TIMED_CALLS.put(call)
+    if start:
+        threading.Thread(
+            target=_timed_thread_worker, name='tiny-tool-call', daemon=True
+        ).start()
+
+
+def _timed_thread_worker() -> None:
+    global _idle_timed_threads
+
+    while True:
+        _TIMED_CALLS.get()()
+
+        # a thread freed by an abandoned call is reused as well
+        with _TIMED_THREADS_LOCK:
+            if _idle_timed_threads >= _MAX_IDLE_TIMED_THREADS:
+                return
+            _idle_timed_threads += 1
+
+
+async def _ignore_chunk(chunk: Any) -> None:
+    pass
+
+
+async def call_tool_with_timeout(
+    tool: AbstractTool,
+    args: dict[str, Any],
+    timeout: float,
+    on_chunk: Callable[[Any], Awaitable[None]] | None = None,
+) -> Any:
+    """Call the tool, raising `ToolTimeoutError` when it runs longer than `timeout`.
+
+    Async tools (and streamed generator tools) run in the current task and are
+    cancelled cooperatively at their next `await` once the timeout expires.
+
+    Sync tools run on a set of reusable daemon threads kept apart from the
+    loop's executor, so a hung call never blocks the executor or the shutdown
+    of the loop. A new thread is only started when none is idle, e.g. while
+    earlier calls are abandoned. Threads cannot be killed: on timeout the call
+    is abandoned, keeps its thread until it returns on its own and its result
+    is discarded. `abandoned_tool_threads()` reports how many are still running.
+
+    Tools with `execution='process'` run on a worker process of their own and
+    are stopped on timeout by terminating just that process; calls running in
+    the shared tool process pool are not affected.
+    """
+    info = tool.info
+    if (
+        info.is_coroutine
+        or info.is_async_generator
+        or (on_chunk is not None and info.is_generator)
+    ):
+        try:
+            return await asyncio.wait_for(
+                tool.stream(on_chunk or _ignore_chunk, **args), timeout
+            )
+        except TimeoutError:
+            raise ToolTimeoutError(info.name, timeout) from None
+
+    loop = asyncio.get_running_loop()
+    future: asyncio.Future[Any] = loop.create_future()
+
+    def resolve(result: Any, error: BaseException | None) -> None:
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    finished = False
+
+    def finish(result: Any, error: BaseException | None) -> None:
+        nonlocal finished
+        with _ABANDONED_CALLS_LOCK:
+            finished = True
+            abandoned = target in _ABANDONED_CALLS
+            _ABANDONED_CALLS.discard(target)
+
+        if abandoned:
+            logger.debug('Abandoned call of tool %s finished', info.name)
+            return
+        try:
+            loop.call_soon_threadsafe(resolve, result, error)
+        except RuntimeError:  # the loop was closed meanwhile
+            pass
+
+    def target() -> None:
+        result: Any = None
+        error: BaseException | None = None
+        if info.execution == 'process':
+            _PROCESS_CALL.deadline = time.monotonic() + timeout
+            _PROCESS_CALL.timeout = timeout
+        try:
+            result = tool(**args)
+        except BaseException as e:
+            error = e
+            if not isinstance(e, Exception):
+                # the caller gets it too, but the thread must still exit
+                raise
+        finally:
+            _PROCESS_CALL.deadline = None
+            finish(result, error)
+
+    _run_on_timed_thread(target)
+
+    try:
+        return await asyncio.wait_for(future, timeout)
+    except TimeoutError:
+        with _ABANDONED_CALLS_LOCK:
+            if not finished:
+                _ABANDONED_CALLS.add(target)
+            abandoned = len(_ABANDONED_CALLS)
+
+        logger.warning(
+            'Tool %s timed out after %gs, abandoning its call (%d abandoned)',
+            info.name,
+            timeout,
+            abandoned,
+        )
+        raise ToolTimeoutError(info.name, timeout) from None
+
+
+def check_process_callable(fn: Callable[..., Any]) -> None:
+    """Check that worker processes can import `fn`, raising ValueError otherwise.
+
+    Functions are sent to workers by module and qualified name, so only
+    module-level functions can run in the process pool.
+    """
+    qualname = getattr(fn, '__qualname__', '')
+    if not getattr(fn, '__module__', None) or not qualname:
+        raise ValueError(f'Process execution requires a named function, got {fn!r}.')
+    if '<' in qualname:
+        raise ValueError(
+            f'Process execution requires a module-level function, '
+            f'{qualname} cannot be imported by worker processes.'
+        )
+    if hasattr(fn, '__self__'):
+        raise ValueError(
+            f'Process execution does not support bound methods, got {qualname}.'
+        )
+
+
+def configure_tool_process_pool(
+    *,
+    max_workers: int | None = None,
+    max_payload_bytes: int | None = None,
+    warm: bool = False,
+) -> None:
+    """Configure the process pool running tools with `execution='process'`.
+
+    Changing the number of workers shuts the current pool down, the next
+    process tool call starts a new one.
+
+    Args:
+        max_workers: Number of worker processes (default: None = keep the
+            current setting, initially `TINY_TOOL_PROCESS_WORKERS` or the CPU count)
+        max_payload_bytes: Size limit of the pickled arguments and result of
+            a call (default: None = keep the current setting, initially
+            `TINY_TOOL_PROCESS_MAX_PAYLOAD_BYTES` or 64 MiB)
+        warm: Start all worker processes now instead of on the first calls
+    """
+    global _process_workers, _max_payload_bytes
+
+    if max_payload_bytes is not None:
+        _max_payload_bytes = max_payload_bytes
+
+    if max_workers is not None and max_workers != _process_workers:
+        _process_workers = max_workers
+        shutdown_tool_process_pool(wait=False)
+
+    if warm:
+        pool = get_tool_process_pool()
+        workers = pool._max_workers  # type: ignore[attr-defined]
+        for future in [pool.submit(os.getpid) for _ in range(workers)]:
+            future.result()
+
+
+def get_tool_process_pool() -> ProcessPoolExecutor:
+    """Return the process pool shared by process tools, starting it if needed.
+
+    The pool lives for the whole process, so its workers stay warm (with
+    their imports done) between calls.
+    """
+    global _process_pool
+
+    with _process_pool_lock:
+        if _process_pool is None:
+            _process_pool = _new_pool(_process_workers)
+            logger.debug(
+                'Started tool process pool with %d workers',
+                _process_pool._max_workers,  # type: ignore[attr-defined]
+            )
+        return _process_pool
+
+
+def shutdown_tool_process_pool(wait: bool = True) -> None:
+    """Shut the tool process pool down, the next process tool call starts a new one.
+
+    Idle worker processes kept for process tool calls with a timeout are shut
+    down as well.
+    """
+    global _process_pool
+
+    with _process_pool_lock:
+        pool, _process_pool = _process_pool, None
+        workers = _timed_workers[:]
+        _timed_workers.clear()
+
+    for executor in [*workers, pool]:
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+def _new_pool(max_workers: int | None) -> ProcessPoolExecutor:
+    start_method = os.getenv('TINY_TOOL_PROCESS_START_METHOD') or None
+    return ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context(start_method)
+    )
+
+
+def _discard_broken_pool(pool: ProcessPoolExecutor) -> None:
+    global _process_pool
+
+    with _process_pool_lock:
+        if _process_pool is pool:
+            _process_pool = None
+
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _acquire_timed_worker() -> ProcessPoolExecutor:
+    """Return an idle single-process pool for a call with a timeout, or a new one.
+
+    A timed out call is stopped by terminating its worker process, which the
+    shared pool cannot do without breaking the other calls it runs.
+    """
+    with _process_pool_lock:
+        if _timed_workers:
+            return _timed_workers.pop()
+    return _new_pool(1)
+
+
+def _release_timed_worker(worker: ProcessPoolExecutor) -> None:
+    with _process_pool_lock:
+        if len(_timed_workers) < (_process_workers or os.cpu_count() or 1):
+            _timed_workers.append(worker)
+            return
+    worker.shutdown(wait=False)
+
+
+def _kill_timed_worker(worker: ProcessPoolExecutor, name: str) -> None:
+    logger.warning('Process tool %s timed out, terminating its worker process', name)
+    processes = worker._processes or {}  # type: ignore[attr-defined]
+    for process in list(processes.values()):
+        process.terminate()
+    worker.shutdown(wait=False, cancel_futures=True)
+
+
+def _resolve_function(module: str, qualname: str) -> Callable[..., Any]:
+    fn = _WORKER_FUNCTIONS.get((module, qualname))
+    if fn is None:
+        obj: Any = importlib.import_module(module)
+        for part in qualname.split('.'):
+            obj = getattr(obj, part)
+
+        # decorated tools replace their function in the module, so unwrap them
+        fn = _WORKER_FUNCTIONS[(module, qualname)] = getattr(obj, 'raw', obj)
+    return fn
+
+
+def _call_in_worker(
+    module: str, qualname: str, payload: bytes, max_payload_bytes: int
+) -> bytes:
+    args, kwargs = pickle.loads(payload)
+    result = pickle.dumps(
+        _resolve_function(module, qualname)(*args, **kwargs),
+        protocol=pickle.HIGHEST_PROTOCOL,
+    )
+    if len(result) > max_payload_bytes:
+        raise ToolPayloadTooLargeError(
+            qualname, 'result', len(result), max_payload_bytes
+        )
+    return result
+
+
+def call_in_tool_process(
+    fn: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> Any:
+    """Call `fn` in the tool process pool, blocking until the result is back.
+
+    Arguments and the result are pickled, and must stay under the payload
+    size limit. If a worker dies (e.g. killed by the OS for using too much
+    memory), the call raises `BrokenProcessPool` and the next call starts a
+    new pool. Within `call_tool_with_timeout`, the call runs on a worker
+    process of its own, which is terminated when the tool's timeout expires.
+    """
+    name = fn.__qualname__
+    payload = pickle.dumps((args, kwargs), protocol=pickle.HIGHEST_PROTOCOL)
+    if len(payload) > _max_payload_bytes:
+        raise ToolPayloadTooLargeError(
+            name, 'arguments', len(payload), _max_payload_bytes
+        )
+
+    deadline: float | None = getattr(_PROCESS_CALL, 'deadline', None)
+    if deadline is not None:
+        return _call_in_timed_worker(name, fn.__module__, payload, deadline)
+
+    pool = get_tool_process_pool()
+    future = pool.submit(
+        _call_in_worker, fn.__module__, name, payload, _max_payload_bytes
+    )
+    try:
+        result = future.result()
+    except BrokenProcessPool:
+        logger.warning('Tool process pool broke while running %s, restarting it', name)
+        _discard_broken_pool(pool)
+        raise
+
+    return pickle.loads(result)
+
+
+def _call_in_timed_worker(
+    name: str, module: str, payload: bytes, deadline: float
+) -> Any:
+    worker = _acquire_timed_worker()
+    future = worker.submit(_call_in_worker, module, name, payload, _max_payload_bytes)
+
+    if not wait((future,), max(deadline - time.monotonic(), 0)).done:
+        _kill_timed_worker(worker, name)
+        raise ToolTimeoutError(name, _PROCESS_CALL.timeout)
+
+    if isinstance(future.exception(), BrokenProcessPool):
+        logger.warning('Tool process running %s died, starting a new one', name)
+        worker.shutdown(wait=False)
+    else:
+        _release_timed_worker(worker)
+    return pickle.loads(future.result())
+
+
+async def call_tool(
+    tool: AbstractTool,
+    args: dict[str, Any],
+    on_chunk: Callable[[Any], Awaitable[None]] | None = None,
+) -> Any:
+    """Call the tool from async code according to its execution mode.
+
+    Sync tools with `execution='thread'` or `'process'` run in the default
+    executor, so the event loop stays free while they (or the worker process
+    they wait for) compute. Tools with `execution='inline'` run in the
+    calling task.
+    """
+    if on_chunk is not None:
+        return await tool.stream(on_chunk, **args)
+
+    info = tool.info
+    if info.execution != 'inline' and not (info.is_coroutine or info.is_async_generator):
+        return await run_sync_in_executor(tool, **args)
+    return tool(**args)
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from contextvars import ContextVar
+from functools import wraps
+import time
+from typing import Any
+from typing import TypeVar
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+
+class TinyPhaseClock:
+    """Accumulates the time an agent run spends in its phases (memory, prompt...).
+
+    A clock only counts once it is started for the current context with
+    `start_phase_clock`; until then `tiny_phase` blocks cost a single context
+    variable lookup. Phases do not nest: time spent in a phase entered from
+    within another phase is counted only in the outer one.
+    """
+
+    __slots__ = ('active', 'times')
+
+    def __init__(self) -> None:
+        self.active: str | None = None
+        self.times: dict[str, float] = {}
+
+    def add(self, phase: str, seconds: float) -> None:
+        """Add seconds spent in the phase."""
+        self.times[phase] = self.times.get(phase, 0.0) + seconds
+
+    def drain(self) -> dict[str, float]:
+        """Return the accumulated times and start counting from zero."""
+        times, self.times = self.times, {}
+        return times
+
+
+_PHASE_CLOCK: ContextVar[TinyPhaseClock | None] = ContextVar(
+    'tiny_phase_clock', default=None
+)
+
+
+def start_phase_clock() -> TinyPhaseClock:
+    """Return the phase clock of the current context, starting one if needed.
+
+    Tasks created afterwards copy the context and count into the same clock.
+    """
+    clock = _PHASE_CLOCK.get()
+    if clock is None:
+        clock = TinyPhaseClock()
+        _PHASE_CLOCK.set(clock)
+    return clock
+
+
+def get_phase_clock() -> TinyPhaseClock | None:
+    """Return the phase clock of the current context, if one was started."""
+    return _PHASE_CLOCK.get()
+
+
+def tiny_phase(phase: str) -> Callable[[F], F]:
+    """Count the time spent in the decorated (sync) function as the phase."""
+
+    def _wrapper(func: F) -> F:
+        @wraps(func)
+        def _inner(*args: Any, **kwargs: Any) -> Any:
+            clock = _PHASE_CLOCK.get()
+            if clock is None or clock.active is not None:
+                return func(*args, **kwargs)
+
+            clock.active = phase
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                clock.active = None
+                clock.add(phase, time.perf_counter() - started)
+
+        return _inner  # type: ignore[return-value]
+
+    return _wrapper
@@ -7,11 +7,13 @@ if TYPE_CHECKING:
     from .io.llm_io_chunks import TinyLLMResultChunk
     from .io.llm_io_input import TinyLLMInput
     from .io.llm_io_result import TinyLLMResult
+    from .io.tool_io_chunks import TinyToolResultChunk
 
 __all__ = [
     'TinyLLMResultChunk',
     'TinyLLMInput',
     'TinyLLMResult',
+    'TinyToolResultChunk',
     'TinyModel',
     'TinyModelBuildable',
     'HasDiscriminatorField',
@@ -34,6 +36,11 @@ def __getattr__(name: str):
 
         return TinyLLMResult
 
+    if name == 'TinyToolResultChunk':
+        from .io.tool_io_chunks import TinyToolResultChunk
+
+        return TinyToolResultChunk
+
     if name == 'TinyModel':
         from .base import TinyModel
 
@@ -1,4 +1,6 @@
+from contextvars import ContextVar
 from itertools import chain
+from typing import Any
 from typing import Iterator
 from typing import cast
 
@@ -10,6 +12,53 @@ from tinygent.core.datamodels.messages import TinyAIMessage
 from tinygent.core.datamodels.messages import TinyChatMessage
 from tinygent.core.datamodels.messages import TinyToolCall
 
+# usage keys of the supported providers (OpenAI/Mistral, Anthropic, Gemini)
+_INPUT_TOKEN_KEYS = ('prompt_tokens', 'input_tokens', 'prompt_token_count')
+_OUTPUT_TOKEN_KEYS = ('completion_tokens', 'output_tokens', 'candidates_token_count')
+
+
+# usage of the last structured or streamed call of the current context
+_REPORTED_USAGE: ContextVar[tuple[int, int] | None] = ContextVar(
+    'tiny_reported_usage', default=None
+)
+
+
+def _first_int(usage: dict, keys: tuple[str, ...]) -> int | None:
+    for key in keys:
+        value = usage.get(key)
+        if isinstance(value, int):
+            return value
+    return None
+
+
+def usage_token_counts(usage: Any) -> tuple[int, int] | None:
+    """Return the (input, output) token counts of a provider usage dict."""
+    if not isinstance(usage, dict):
+        return None
+    input_tokens = _first_int(usage, _INPUT_TOKEN_KEYS)
+    output_tokens = _first_int(usage, _OUTPUT_TOKEN_KEYS)
+    if input_tokens is None and output_tokens is None:
+        return None
+    return input_tokens or 0, output_tokens or 0
+
+
+def report_token_usage(usage: Any) -> None:
+    """Report the provider usage of a call whose result cannot carry it.
+
+    LLMs call this from structured output and streaming methods, whose results
+    are the parsed model or chunks. The agent making the call reads it with
+    `take_reported_token_usage`.
+    """
+    _REPORTED_USAGE.set(usage_token_counts(usage))
+
+
+def take_reported_token_usage() -> tuple[int, int] | None:
+    """Return the (input, output) token counts last reported and forget them."""
+    usage = _REPORTED_USAGE.get()
+    if usage is not None:
+        _REPORTED_USAGE.set(None)
+    return usage
+
 
 class TinyLLMResult(LLMResult):
     """Result from an LLM, consisting of generations and optional metadata."""
@@ -25,6 +74,28 @@ class TinyLLMResult(LLMResult):
             for part in content
         )
 
+    def token_usage(self) -> tuple[int, int] | None:
+        """Return the (input, output) token counts reported by the provider.
+
+        Reads the provider usage stored in `llm_output['usage']`, falling back to
+        the usage metadata of the generated messages. Returns None when the
+        provider reported no usage.
+        """
+        usage = usage_token_counts((self.llm_output or {}).get('usage'))
+        if usage is not None:
+            return usage
+
+        found = False
+        input_tokens = output_tokens = 0
+        for generation in chain.from_iterable(self.generations):
+            message = getattr(generation, 'message', None)
+            metadata = getattr(message, 'usage_metadata', None)
+            if metadata:
+                found = True
+                input_tokens += metadata.get('input_tokens', 0)
+                output_tokens += metadata.get('output_tokens', 0)
+        return (input_tokens, output_tokens) if found else None
+
     def to_string(self) -> str:
         return '\n'.join(
             msg.content for msg in self.tiny_iter() if isinstance(msg, TinyChatMessage)
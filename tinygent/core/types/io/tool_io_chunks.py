@@ -0,0 +1,22 @@
+from typing import Any
+
+from tinygent.core.types.base import TinyModel
+
+
+class TinyToolResultChunk(TinyModel):
+    """A chunk of a streamed tool result, as produced by the tool."""
+
+    tool_name: str
+
+    call_id: str | None = None
+
+    idx: int
+
+    content: Any
+
+    def to_string(self) -> str:
+        """Convert the chunk to a string representation."""
+        return (
+            f'TinyToolResultChunk(tool_name={self.tool_name}, '
+            f'call_id={self.call_id}, idx={self.idx}, content={self.content!r})'
+        )
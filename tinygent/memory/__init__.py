@@ -3,6 +3,7 @@ from .buffer_chat_memory import BufferChatMemory
 from .buffer_summary_chat_memory import BufferSummaryChatMemory
 from .buffer_window_chat_memory import BufferWindowChatMemory
 from .combined_memory import CombinedMemory
+from .vector_retriever_chat_memory import VectorRetrieverChatMemory
 
 __all__ = [
     'BaseChatMemory',
@@ -10,4 +11,5 @@ __all__ = [
     'BufferSummaryChatMemory',
     'BufferWindowChatMemory',
     'CombinedMemory',
+    'VectorRetrieverChatMemory',
 ]
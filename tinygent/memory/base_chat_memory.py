@@ -6,6 +6,7 @@ import typing
 
 from tinygent.core.chat_history import BaseChatHistory
 from tinygent.core.datamodels.memory import AbstractMemory
+from tinygent.core.telemetry.phases import tiny_phase
 from tinygent.utils.pydantic_utils import tiny_deep_copy
 
 if typing.TYPE_CHECKING:
@@ -16,12 +17,15 @@ class BaseChatMemory(AbstractMemory, ABC):
     def __init__(self) -> None:
         self._chat_history: BaseChatHistory = BaseChatHistory()
 
+    @tiny_phase('memory')
     def copy_chat_messages(self) -> list[AllTinyMessages]:
         return [tiny_deep_copy(msg) for msg in self._chat_history.messages]  # type: ignore
 
+    @tiny_phase('memory')
     def save_context(self, message: AllTinyMessages) -> None:
         self._chat_history.add_message(message)
 
+    @tiny_phase('memory')
     def save_multiple_context(self, messages: list[AllTinyMessages]) -> None:
         for msg in messages:
             self.save_context(msg)
@@ -33,6 +37,6 @@ class BaseChatMemory(AbstractMemory, ABC):
         buff = StringIO()
 
         buff.write('Chat Memory:\n')
-        buff.write(f'\tNumber of messages stored: {len(self._chat_history.messages)}\n')
+        buff.write(f'\tNumber of messages stored: {len(self._chat_history)}\n')
 
         return buff.getvalue()
@@ -4,6 +4,7 @@ from typing import Literal
 from pydantic import Field
 
 from tinygent.core.datamodels.memory import AbstractMemoryConfig
+from tinygent.core.telemetry.phases import tiny_phase
 from tinygent.memory import BaseChatMemory
 
 
@@ -39,6 +40,7 @@ class BufferChatMemory(BaseChatMemory):
     def memory_keys(self) -> list[str]:
         return [self._memory_key]
 
+    @tiny_phase('memory')
     def load_variables(self) -> dict[str, str]:
         return {
             self._memory_key: str([msg.tiny_str for msg in self._chat_history.messages])
@@ -17,6 +17,7 @@ from tinygent.core.prompts.memory.factory.buffer_summary_chat_memory import (
 from tinygent.core.prompts.memory.template.buffer_summary_chat_memory import (
     SummaryUpdatePromptTemplate,
 )
+from tinygent.core.telemetry.phases import tiny_phase
 from tinygent.core.types.io.llm_io_input import TinyLLMInput
 from tinygent.memory.base_chat_memory import BaseChatMemory
 from tinygent.utils.jinja_utils import render_template
@@ -89,8 +90,9 @@ class BufferSummaryChatMemory(BaseChatMemory):
     def memory_keys(self) -> list[str]:
         return [self._memory_key]
 
+    @tiny_phase('memory')
     def load_variables(self) -> dict[str, str | list[AllTinyMessages]]:
-        final_buffer = self._chat_history.messages
+        final_buffer = list(self._chat_history.messages)
         if self._summary_message:
             final_buffer.insert(0, self._summary_message)
 
@@ -104,6 +106,7 @@ class BufferSummaryChatMemory(BaseChatMemory):
             self._memory_key: final,
         }
 
+    @tiny_phase('memory')
     def save_context(self, message: AllTinyMessages) -> None:
         super().save_context(message)
         self.prune()
@@ -114,8 +117,9 @@ class BufferSummaryChatMemory(BaseChatMemory):
 
         if curr_buffer_length > self.max_token_limit:
             pruned_buffer_memory = []
-            while curr_buffer_length > self.max_token_limit:
-                pruned_buffer_memory.append(curr_buffer_memory.pop(0))
+            while curr_buffer_length > self.max_token_limit and curr_buffer_memory:
+                # prune the oldest message the token count was based on
+                pruned_buffer_memory.append(self._chat_history.pop_visible_message(0))
                 curr_buffer_length = self.llm.count_tokens_in_messages(
                     curr_buffer_memory
                 )
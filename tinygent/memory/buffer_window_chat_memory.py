@@ -5,6 +5,7 @@ from pydantic import Field
 
 from tinygent.core.datamodels.memory import AbstractMemoryConfig
 from tinygent.core.datamodels.messages import AllTinyMessages
+from tinygent.core.telemetry.phases import tiny_phase
 from tinygent.memory import BaseChatMemory
 
 
@@ -53,6 +54,7 @@ class BufferWindowChatMemory(BaseChatMemory):
     def memory_keys(self) -> list[str]:
         return [self._memory_key]
 
+    @tiny_phase('memory')
     def load_variables(self) -> dict[str, str]:
         return {self._memory_key: str([msg.tiny_str for msg in self.chat_buffer_window])}
 
@@ -9,6 +9,7 @@ from tinygent.core.datamodels.memory import AbstractMemory
 from tinygent.core.datamodels.memory import AbstractMemoryConfig
 from tinygent.core.datamodels.messages import AllTinyMessages
 from tinygent.core.factory.memory import build_memory
+from tinygent.core.telemetry.phases import tiny_phase
 from tinygent.memory.base_chat_memory import BaseChatMemory
 
 
@@ -53,12 +54,14 @@ class CombinedMemory(BaseChatMemory):
             keys.extend(memory.memory_keys)
         return keys
 
+    @tiny_phase('memory')
     def load_variables(self) -> dict[str, str]:
         memory_vars = {}
         for memory in self.memory_list:
             memory_vars.update(memory.load_variables())
         return memory_vars
 
+    @tiny_phase('memory')
     def save_context(self, message: AllTinyMessages) -> None:
         self._chat_history.add_message(message)
 
@@ -7,6 +7,8 @@ from tinygent.memory.buffer_window_chat_memory import BufferWindowChatMemory
 from tinygent.memory.buffer_window_chat_memory import BufferWindowChatMemoryConfig
 from tinygent.memory.combined_memory import CombinedMemory
 from tinygent.memory.combined_memory import CombinedMemoryConfig
+from tinygent.memory.vector_retriever_chat_memory import VectorRetrieverChatMemory
+from tinygent.memory.vector_retriever_chat_memory import VectorRetrieverChatMemoryConfig
 
 
 def _register_memories() -> None:
@@ -20,6 +22,9 @@ def _register_memories() -> None:
         'buffer_window', BufferWindowChatMemoryConfig, BufferWindowChatMemory
     )
     registry.register_memory('combined', CombinedMemoryConfig, CombinedMemory)
+    registry.register_memory(
+        'vector_retriever', VectorRetrieverChatMemoryConfig, VectorRetrieverChatMemory
+    )
 
 
 _register_memories()
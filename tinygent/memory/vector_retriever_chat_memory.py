@@ -0,0 +1,354 @@
+from __future__ import annotations
+
+from io import StringIO
+import json
+import logging
+from pathlib import Path
+from typing import Literal
+
+import numpy as np
+from pydantic import Field
+from pydantic import TypeAdapter
+
+from tinygent.core.datamodels.embedder import AbstractEmbedder
+from tinygent.core.datamodels.embedder import AbstractEmbedderConfig
+from tinygent.core.datamodels.memory import AbstractMemoryConfig
+from tinygent.core.datamodels.messages import AllTinyMessages
+from tinygent.core.datamodels.messages import TinyHumanMessage
+from tinygent.core.factory.embedder import build_embedder
+from tinygent.core.telemetry.phases import tiny_phase
+from tinygent.memory.base_chat_memory import BaseChatMemory
+from tinygent.utils.pydantic_utils import tiny_deep_copy
+
+logger = logging.getLogger(__name__)
+
+_MESSAGE_ADAPTER: TypeAdapter[AllTinyMessages] = TypeAdapter(AllTinyMessages)
+
+_EMBEDDINGS_FILE = 'embeddings.f32'
+_MESSAGES_FILE = 'messages.jsonl'
+_META_FILE = 'meta.json'
+
+
+class VectorRetrieverChatMemoryConfig(AbstractMemoryConfig['VectorRetrieverChatMemory']):
+    type: Literal['vector_retriever'] = Field(default='vector_retriever', frozen=True)
+
+    embedder: AbstractEmbedder | AbstractEmbedderConfig = Field(...)
+
+    k: int = Field(default=4)
+
+    window: int = Field(default=4)
+
+    batch_size: int = Field(default=16)
+
+    similarity_threshold: float | None = Field(default=None)
+
+    persist_dir: str | None = Field(default=None)
+
+    def build(self) -> VectorRetrieverChatMemory:
+        return VectorRetrieverChatMemory(
+            embedder=self.embedder
+            if isinstance(self.embedder, AbstractEmbedder)
+            else build_embedder(self.embedder),
+            k=self.k,
+            window=self.window,
+            batch_size=self.batch_size,
+            similarity_threshold=self.similarity_threshold,
+            persist_dir=self.persist_dir,
+        )
+
+
+class VectorRetrieverChatMemory(BaseChatMemory):
+    """Memory that recalls relevant older messages via vector similarity.
+
+    Every saved message is embedded (in batches) and stored as a row of a
+    contiguous, L2-normalized float32 matrix. When variables are loaded, the
+    last human message is used as the query: the top-k most similar messages
+    outside the recent window are retrieved with a single matrix-vector product
+    and returned, in chronological order, together with the last `window`
+    messages. Tool calls and their results are always returned as pairs.
+    Embeddings are kept for the whole history; chat history filters only
+    decide which messages can be returned.
+
+    This keeps the prompt size flat for very long sessions while still allowing
+    the agent to recall facts mentioned many turns ago.
+
+    When `persist_dir` is set, messages and embeddings are appended to files in
+    that directory and memory-mapped back on restart, so previously embedded
+    history does not need to be re-embedded.
+
+    Suitable for:
+    - Very long conversations where old details must stay retrievable
+    - Keeping per-call token usage bounded regardless of history length
+
+    Args:
+        embedder: Embedder used to vectorize messages and queries
+        k: Number of older messages to retrieve (default: 4)
+        window: Number of most recent messages always included (default: 4)
+        batch_size: Number of pending messages embedded per batch (default: 16)
+        similarity_threshold: Minimum cosine similarity for a retrieved message
+        persist_dir: Directory to persist messages and embeddings to
+    """
+
+    def __init__(
+        self,
+        embedder: AbstractEmbedder,
+        k: int = 4,
+        window: int = 4,
+        batch_size: int = 16,
+        similarity_threshold: float | None = None,
+        persist_dir: str | Path | None = None,
+    ) -> None:
+        super().__init__()
+
+        if batch_size <= 0:
+            raise ValueError('batch_size must be a positive integer.')
+
+        self.embedder = embedder
+        self.k = k
+        self.window = window
+        self.batch_size = batch_size
+        self.similarity_threshold = similarity_threshold
+        self.persist_dir = Path(persist_dir) if persist_dir else None
+
+        self._memory_key: str = 'relevant_chat_history'
+
+        self._embeddings: np.ndarray | None = None
+        self._size: int = 0
+        self._query_cache: tuple[str, np.ndarray] | None = None
+        self._call_positions: dict[str, list[int]] = {}
+
+        if self.persist_dir:
+            self._restore()
+
+    @property
+    def memory_keys(self) -> list[str]:
+        return [self._memory_key]
+
+    @property
+    def embedded_count(self) -> int:
+        """Number of messages that already have an embedding in the index."""
+        return self._size
+
+    @tiny_phase('memory')
+    def load_variables(self) -> dict[str, str]:
+        return {self._memory_key: str([msg.tiny_str for msg in self.retrieve()])}
+
+    @tiny_phase('memory')
+    def copy_chat_messages(self) -> list[AllTinyMessages]:
+        return [tiny_deep_copy(msg) for msg in self.retrieve()]  # type: ignore
+
+    @tiny_phase('memory')
+    def save_context(self, message: AllTinyMessages) -> None:
+        super().save_context(message)
+        # positions refer to the unfiltered history, filters apply on retrieval
+        history = self._chat_history.all_messages
+        self._index_call_id(len(history) - 1, message)
+
+        if self.persist_dir:
+            with (self.persist_dir / _MESSAGES_FILE).open('a', encoding='utf-8') as f:
+                f.write(_MESSAGE_ADAPTER.dump_json(message).decode() + '\n')
+
+        if len(history) - self._size >= self.batch_size:
+            self._flush(len(history))
+
+    def clear(self) -> None:
+        super().clear()
+
+        self._embeddings = None
+        self._size = 0
+        self._query_cache = None
+        self._call_positions.clear()
+
+        if self.persist_dir:
+            for name in (_EMBEDDINGS_FILE, _MESSAGES_FILE, _META_FILE):
+                (self.persist_dir / name).unlink(missing_ok=True)
+
+    def retrieve(self) -> list[AllTinyMessages]:
+        """Return the retrieved older messages followed by the recent window."""
+        messages = self._chat_history.all_messages
+        visible = self._visible_positions()
+        n_recent = min(max(self.window, 0), len(visible))
+        recent = visible[len(visible) - n_recent :]
+        older = visible[: len(visible) - n_recent]
+
+        selected: set[int] = set(recent)
+
+        query = self._get_query(self._chat_history.messages)
+        if self.k > 0 and older and query:
+            self._flush(older[-1] + 1)
+            assert self._embeddings is not None
+
+            candidates = np.asarray(older)
+            scores = self._embeddings[candidates] @ self._embed_query(query)
+            k = min(self.k, len(candidates))
+            top = (
+                np.argpartition(-scores, k - 1)[:k]
+                if k < len(candidates)
+                else np.arange(len(candidates))
+            )
+            if self.similarity_threshold is not None:
+                top = top[scores[top] > self.similarity_threshold]
+
+            selected.update(int(i) for i in candidates[top])
+
+        pairs = self._with_tool_pairs(messages, selected)
+        if len(visible) != len(messages):
+            pairs &= set(visible)
+        return [messages[i] for i in sorted(pairs)]
+
+    def _visible_positions(self) -> list[int]:
+        """Positions in the unfiltered history of the messages passing the filters."""
+        messages = self._chat_history.all_messages
+        view = self._chat_history.messages
+        if view is messages:
+            return list(range(len(messages)))
+
+        shown = {id(m) for m in view}
+        return [i for i, m in enumerate(messages) if id(m) in shown]
+
+    def _index_call_id(self, position: int, message: AllTinyMessages) -> None:
+        if (call_id := getattr(message, 'call_id', None)) is not None:
+            self._call_positions.setdefault(call_id, []).append(position)
+
+    def _get_query(self, messages: list[AllTinyMessages]) -> str | None:
+        for m in reversed(messages):
+            if isinstance(m, TinyHumanMessage):
+                return m.content
+        return None
+
+    def _with_tool_pairs(
+        self, messages: list[AllTinyMessages], selected: set[int]
+    ) -> set[int]:
+        call_ids = {
+            call_id
+            for i in selected
+            if (call_id := getattr(messages[i], 'call_id', None)) is not None
+        }
+        if not call_ids:
+            return selected
+
+        return selected | {
+            i for call_id in call_ids for i in self._call_positions.get(call_id, [])
+        }
+
+    def _embed_query(self, query: str) -> np.ndarray:
+        if self._query_cache and self._query_cache[0] == query:
+            return self._query_cache[1]
+
+        vector = self._normalize(np.asarray([self.embedder.embed(query)], np.float32))[0]
+        self._query_cache = (query, vector)
+        return vector
+
+    def _flush(self, upto: int) -> None:
+        """Embed all not yet embedded messages with index lower than `upto`."""
+        messages = self._chat_history.all_messages
+
+        while self._size < upto:
+            end = min(self._size + self.batch_size, upto)
+            texts = [m.tiny_str for m in messages[self._size : end]]
+
+            logger.debug('Embedding %d messages for vector memory', len(texts))
+            rows = self._normalize(
+                np.asarray(self.embedder.embed_batch(texts), dtype=np.float32)
+            )
+            self._append(rows)
+
+    def _append(self, rows: np.ndarray) -> None:
+        if self._embeddings is None:
+            self._embeddings = np.empty(
+                (max(self.batch_size, len(rows)), rows.shape[1]), dtype=np.float32
+            )
+            self._write_meta(rows.shape[1])
+
+        required = self._size + len(rows)
+        if required > len(self._embeddings):
+            grown = np.empty(
+                (max(required, 2 * len(self._embeddings)), self._embeddings.shape[1]),
+                dtype=np.float32,
+            )
+            grown[: self._size] = self._embeddings[: self._size]
+            self._embeddings = grown
+
+        self._embeddings[self._size : required] = rows
+        self._size = required
+
+        if self.persist_dir:
+            with (self.persist_dir / _EMBEDDINGS_FILE).open('ab') as f:
+                rows.tofile(f)
+
+    @staticmethod
+    def _normalize(rows: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(rows, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return rows / norms
+
+    def _write_meta(self, dim: int) -> None:
+        if not self.persist_dir:
+            return
+
+        (self.persist_dir / _META_FILE).write_text(
+            json.dumps({'model': self.embedder.model, 'dim': dim})
+        )
+
+    def _restore(self) -> None:
+        assert self.persist_dir is not None
+        self.persist_dir.mkdir(parents=True, exist_ok=True)
+
+        messages_path = self.persist_dir / _MESSAGES_FILE
+        if messages_path.exists():
+            with messages_path.open(encoding='utf-8') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    message = _MESSAGE_ADAPTER.validate_json(line)
+                    self._chat_history.add_message(message)
+                    self._index_call_id(
+                        len(self._chat_history.all_messages) - 1, message
+                    )
+
+        meta_path = self.persist_dir / _META_FILE
+        embeddings_path = self.persist_dir / _EMBEDDINGS_FILE
+        if not (meta_path.exists() and embeddings_path.exists()):
+            return
+
+        meta = json.loads(meta_path.read_text())
+        if meta.get('model') != self.embedder.model:
+            logger.warning(
+                'Persisted embeddings were created with model %s, current model is %s; '
+                'history will be re-embedded.',
+                meta.get('model'),
+                self.embedder.model,
+            )
+            embeddings_path.unlink()
+            meta_path.unlink()
+            return
+
+        dim = int(meta['dim'])
+        stored = np.memmap(embeddings_path, dtype=np.float32, mode='r')
+        rows = min(len(stored) // dim, len(self._chat_history.all_messages))
+        if rows == 0:
+            return
+
+        self._embeddings = np.empty((max(rows, self.batch_size), dim), np.float32)
+        self._embeddings[:rows] = stored[: rows * dim].reshape(rows, dim)
+        self._size = rows
+        del stored
+
+        expected_bytes = rows * dim * np.dtype(np.float32).itemsize
+        if embeddings_path.stat().st_size != expected_bytes:
+            # drop partially written or orphaned rows so the file matches the index
+            with embeddings_path.open('r+b') as f:
+                f.truncate(expected_bytes)
+
+    def __str__(self) -> str:
+        base = super().__str__()
+
+        buff = StringIO()
+
+        buff.write(base)
+        buff.write('\ttype: Vector Retriever Chat Memory\n')
+        buff.write(f'\tTop k: {self.k}\n')
+        buff.write(f'\tWindow size: {self.window}\n')
+        buff.write(f'\tEmbedded messages: {self._size}\n')
+
+        return buff.getvalue()
@@ -1,3 +1,4 @@
+from .blob_tools import blob_tools
 from .jit_tool import JITInstructionTool
 from .jit_tool import JITInstructionToolConfig
 from .jit_tool import jit_tool
@@ -6,12 +7,18 @@ from .reasoning_tool import ReasoningTool
 from .reasoning_tool import ReasoningToolConfig
 from .reasoning_tool import reasoning_tool
 from .reasoning_tool import register_reasoning_tool
+from .sandbox import SandboxLimits
+from .sandbox import SandboxResult
+from .sandbox import TinySandboxPool
+from .sandbox import get_default_sandbox_pool
+from .sandbox import sandbox_tool
 from .tool import Tool
 from .tool import ToolConfig
 from .tool import register_tool
 from .tool import tool
 
 __all__ = [
+    'blob_tools',
     'JITInstructionTool',
     'JITInstructionToolConfig',
     'jit_tool',
@@ -20,6 +27,11 @@ __all__ = [
     'ReasoningToolConfig',
     'reasoning_tool',
     'register_reasoning_tool',
+    'SandboxLimits',
+    'SandboxResult',
+    'TinySandboxPool',
+    'get_default_sandbox_pool',
+    'sandbox_tool',
     'Tool',
     'ToolConfig',
     'tool',
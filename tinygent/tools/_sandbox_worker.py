@@ -0,0 +1,182 @@
+"""Worker process of the tool sandbox, see `tinygent.tools.sandbox`.
+
+Runs as a standalone script in an isolated interpreter, so it only uses the
+standard library. Requests (JSON lines) are read from stdin and responses are
+written to the file descriptor given on the command line. Each response echoes
+the id of its request, so lines written to that descriptor by the executed
+code are ignored by the pool.
+"""
+
+import contextlib
+import io
+import json
+import math
+import os
+import resource
+import shutil
+import signal
+import sys
+import tempfile
+import time
+import traceback
+from typing import Any
+
+_NETWORK_EVENTS = ('socket.', 'ctypes.')
+_PROCESS_EVENTS = (
+    'subprocess.Popen',
+    'os.system',
+    'os.exec',
+    'os.posix_spawn',
+    'os.spawn',
+    'os.fork',
+    'os.forkpty',
+    'pty.spawn',
+)
+
+
+class CpuLimitExceeded(BaseException):
+    pass
+
+
+def _on_cpu_limit(signum: int, frame: Any) -> None:
+    raise CpuLimitExceeded()
+
+
+def _isolate_network() -> None:
+    # a new user and network namespace has only a loopback device, which is down
+    try:
+        os.unshare(os.CLONE_NEWUSER | os.CLONE_NEWNET)
+    except (AttributeError, OSError):
+        pass  # unprivileged namespaces unavailable, the audit hook still applies
+
+
+def _install_guard(allow_network: bool, allow_subprocess: bool) -> None:
+    blocked: tuple[str, ...] = ()
+    if not allow_network:
+        blocked += _NETWORK_EVENTS
+    if not allow_subprocess:
+        blocked += _PROCESS_EVENTS
+    if not blocked:
+        return
+
+    def guard(event: str, args: tuple[Any, ...]) -> None:
+        if event.startswith(blocked):
+            raise PermissionError(f'{event} is not allowed in the sandbox')
+
+    # audit hooks cannot be removed, so the executed code cannot lift the guard
+    sys.addaudithook(guard)
+
+
+def _format_error(error: BaseException) -> str:
+    # skip the frame of this module, so the traceback starts in the executed code
+    tb = error.__traceback__
+    return ''.join(
+        traceback.format_exception(type(error), error, tb.tb_next if tb else None)
+    )
+
+
+def _truncate(text: str, limit: int) -> str:
+    if len(text) <= limit:
+        return text
+    return text[:limit] + f'\n... [truncated {len(text) - limit} characters]'
+
+
+def _execute(
+    request: dict[str, Any], config: dict[str, Any], root: str
+) -> dict[str, Any]:
+    workdir = tempfile.mkdtemp(dir=root)
+    os.chdir(workdir)
+
+    cpu_seconds = config['cpu_seconds']
+    _, cpu_hard = resource.getrlimit(resource.RLIMIT_CPU)
+    if cpu_seconds is not None:
+        # the CPU limit counts the whole process lifetime, so raise it per call
+        soft = math.ceil(_cpu_used() + cpu_seconds)
+        if cpu_hard != resource.RLIM_INFINITY:
+            soft = min(soft, cpu_hard)
+        resource.setrlimit(resource.RLIMIT_CPU, (soft, cpu_hard))
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    namespace: dict[str, Any] = {'__name__': '__sandbox__'}
+    error: str | None = None
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            # running the given code is the purpose of the sandbox
+            exec(compile(request['code'], '<sandbox>', 'exec'), namespace)  # noqa: S102
+    except CpuLimitExceeded:
+        error = f'CPU time limit of {cpu_seconds} seconds exceeded'
+    except MemoryError:
+        error = 'Memory limit exceeded'
+    except BaseException as e:  # noqa: BLE001 - also SystemExit raised by the code
+        error = _format_error(e)
+    finally:
+        if cpu_seconds is not None:
+            resource.setrlimit(resource.RLIMIT_CPU, (cpu_hard, cpu_hard))
+        os.chdir(root)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    limit = config['max_output_chars']
+    return {
+        'stdout': _truncate(stdout.getvalue(), limit),
+        'stderr': _truncate(stderr.getvalue(), limit),
+        'error': error,
+        'duration': time.perf_counter() - start,
+    }
+
+
+def _cpu_used() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _limit_worker_cpu(cpu_seconds: float, max_calls: int) -> None:
+    # the per-call limit is soft, so code can raise it or ignore SIGXCPU; the
+    # hard limit (SIGKILL) caps what the worker's calls use altogether
+    hard = math.ceil(_cpu_used() + cpu_seconds * max_calls) + 1
+    _, current = resource.getrlimit(resource.RLIMIT_CPU)
+    if current != resource.RLIM_INFINITY:
+        hard = min(hard, current)
+    resource.setrlimit(resource.RLIMIT_CPU, (hard, hard))
+
+
+def _write(fd: int, message: dict[str, Any]) -> None:
+    data = (json.dumps(message) + '\n').encode()
+    while data:
+        data = data[os.write(fd, data) :]
+
+
+def main() -> None:
+    config = json.loads(sys.argv[1])
+    out_fd = int(sys.argv[2])
+    requests = sys.stdin.buffer
+    root = os.getcwd()
+
+    for module in config['preload']:
+        __import__(module)
+
+    if not config['allow_network']:
+        _isolate_network()
+
+    if config['cpu_seconds'] is not None:
+        _limit_worker_cpu(config['cpu_seconds'], config['max_calls'])
+
+    memory_bytes = config['memory_bytes']
+    if memory_bytes is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_bytes, memory_bytes))
+
+    signal.signal(signal.SIGXCPU, _on_cpu_limit)
+    _install_guard(config['allow_network'], config['allow_subprocess'])
+    sys.stdin = io.StringIO()
+
+    _write(out_fd, {'ready': True})
+    while line := requests.readline():
+        request = json.loads(line)
+        request_id = request.pop('id')
+        response = _execute(request, config, root)
+        response['id'] = request_id
+        _write(out_fd, response)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from tinygent.core.datamodels.tool_info import ToolExecutionMode
+from tinygent.core.runtime.blob_store import TinyBlobStore
+from tinygent.core.runtime.blob_store import get_global_blob_store
+from tinygent.tools.tool import Tool
+
+BLOB_TOOL_NAMES = ('read_blob', 'grep_blob')
+
+
+def blob_tools(store: TinyBlobStore | None = None) -> list[Tool[str]]:
+    """Create the `read_blob` and `grep_blob` tools reading blobs of the store.
+
+    Agents storing large tool results as blobs add these tools automatically,
+    so the model can look past the preview it gets in the conversation.
+
+    Args:
+        store: Blob store to read from (default: None = the process-wide store)
+    """
+    blobs = store or get_global_blob_store()
+
+    def read_blob(blob_id: str, page: int = 1) -> str:
+        """Read one page of a large tool result stored as a blob.
+
+        Args:
+            blob_id: The id of the blob, as given in the tool result
+            page: The page to read, starting at 1
+        """
+        content = blobs.get(blob_id)
+        if content is None:
+            return f'Blob "{blob_id}" does not exist or is no longer available.'
+
+        pages = max(-(-len(content) // blobs.page_chars), 1)
+        if not 1 <= page <= pages:
+            return f'Blob "{blob_id}" has pages 1 to {pages}, there is no page {page}.'
+
+        start = (page - 1) * blobs.page_chars
+        return (
+            f'[Blob "{blob_id}", page {page} of {pages}]\n'
+            f'{content[start : start + blobs.page_chars]}'
+        )
+
+    def grep_blob(blob_id: str, pattern: str) -> str:
+        """Find the lines of a large tool result stored as a blob matching a pattern.
+
+        Args:
+            blob_id: The id of the blob, as given in the tool result
+            pattern: A case-insensitive regular expression or plain text to find
+        """
+        matches = blobs.grep(blob_id, pattern)
+        if matches is None:
+            return f'Blob "{blob_id}" does not exist or is no longer available.'
+        if not matches:
+            return f'No lines of blob "{blob_id}" match "{pattern}".'
+        return '\n'.join(f'{number}: {line}' for number, line in matches)
+
+    # blobs read from a durable backend do I/O, which must not block the loop
+    execution: ToolExecutionMode = 'thread' if blobs.blocking else 'inline'
+    return [Tool(read_blob, execution=execution), Tool(grep_blob, execution=execution)]
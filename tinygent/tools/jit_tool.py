@@ -1,5 +1,5 @@
+from collections.abc import Awaitable
 from collections.abc import Generator
-import inspect
 from io import StringIO
 from types import GeneratorType
 from typing import Any
@@ -15,6 +15,7 @@ from tinygent.core.datamodels.tool import AbstractTool
 from tinygent.core.datamodels.tool import AbstractToolConfig
 from tinygent.core.datamodels.tool_info import ToolInfo
 from tinygent.core.runtime.tool_catalog import GlobalToolCatalog
+from tinygent.core.runtime.tool_catalog import LazyTool
 from tinygent.core.types.base import TinyModel
 from tinygent.tools.tool import Tool
 
@@ -32,7 +33,7 @@ class JITInstructionToolConfig(AbstractToolConfig['JITInstructionTool'], Generic
 
     def build(self) -> 'JITInstructionTool':
         return JITInstructionTool(
-            inner_tool=GlobalToolCatalog().get_active_catalog().get_tool(self.name),
+            inner_tool=GlobalToolCatalog().get_active_catalog().get_lazy_tool(self.name),
             jit_instruction=self.instruction,
         )
 
@@ -67,8 +68,9 @@ class JITInstructionTool(AbstractTool):
     """
 
     def __init__(self, inner_tool: AbstractTool, jit_instruction: str) -> None:
-        raw = inner_tool.raw
-        if inspect.iscoroutinefunction(raw) or inspect.isasyncgenfunction(raw):
+        # checked on the info, so a lazy catalog tool is not built here
+        info = inner_tool.info
+        if info.is_coroutine or info.is_async_generator:
             raise TypeError(
                 'JITInstructionTool does not support async functions or async generators.'
             )
@@ -108,6 +110,15 @@ class JITInstructionTool(AbstractTool):
             self.__instruction_field_name: self._jit_instruction,
         }
 
+    async def stream(
+        self, on_chunk: Callable[[Any], Awaitable[None]], *args: Any, **kwargs: Any
+    ) -> Any:
+        tool_result = await self._inner.stream(on_chunk, *args, **kwargs)
+        return {
+            'tool_result': tool_result,
+            self.__instruction_field_name: self._jit_instruction,
+        }
+
     def __getattr__(self, item: str) -> Any:
         return getattr(self._inner, item)
 
@@ -166,7 +177,7 @@ def register_jit_tool(
     use_cache: bool = False,
     cache_size: int = 128,
     hidden: bool = False,
-) -> JITInstructionTool: ...
+) -> LazyTool: ...
 
 
 @overload
@@ -177,7 +188,7 @@ def register_jit_tool(
     use_cache: bool = False,
     cache_size: int = 128,
     hidden: bool = False,
-) -> Callable[[Callable[[T], Any]], JITInstructionTool]: ...
+) -> Callable[[Callable[[T], Any]], LazyTool]: ...
 
 
 def register_jit_tool(
@@ -187,22 +198,18 @@ def register_jit_tool(
     use_cache: bool = False,
     cache_size: int = 128,
     hidden: bool = False,
-) -> JITInstructionTool | Callable[[Callable[[T], Any]], JITInstructionTool]:
-    def wrapper(f: Callable[[T], Any]) -> JITInstructionTool:
-        name = ToolInfo.from_callable(f, use_cache=use_cache, cache_size=cache_size).name
-
+) -> LazyTool | Callable[[Callable[[T], Any]], LazyTool]:
+    def wrapper(f: Callable[[T], Any]) -> LazyTool:
         def factory() -> JITInstructionTool:
             return JITInstructionTool(
                 Tool(f, use_cache=use_cache, cache_size=cache_size),
                 jit_instruction=jit_instruction,
             )
 
-        GlobalToolCatalog().get_active_catalog().register(name, factory, hidden=hidden)
-        return jit_tool(
-            f,
-            jit_instruction=jit_instruction,
-            use_cache=use_cache,
-            cache_size=cache_size,
+        return (
+            GlobalToolCatalog()
+            .get_active_catalog()
+            .register(f.__name__, factory, hidden=hidden)
         )
 
     if fn is not None:
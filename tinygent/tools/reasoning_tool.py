@@ -1,3 +1,4 @@
+from collections.abc import Awaitable
 from dataclasses import replace
 from io import StringIO
 from typing import Any
@@ -13,8 +14,8 @@ from pydantic import create_model
 
 from tinygent.core.datamodels.tool import AbstractTool
 from tinygent.core.datamodels.tool import AbstractToolConfig
-from tinygent.core.datamodels.tool_info import ToolInfo
 from tinygent.core.runtime.tool_catalog import GlobalToolCatalog
+from tinygent.core.runtime.tool_catalog import LazyTool
 from tinygent.core.types.base import TinyModel
 from tinygent.tools.tool import Tool
 
@@ -30,7 +31,7 @@ class ReasoningToolConfig(AbstractToolConfig['ReasoningTool'], Generic[T]):
 
     def build(self) -> 'ReasoningTool':
         return ReasoningTool(
-            inner_tool=GlobalToolCatalog().get_active_catalog().get_tool(self.name),
+            inner_tool=GlobalToolCatalog().get_active_catalog().get_lazy_tool(self.name),
             reasoning_prompt=self.prompt,
         )
 
@@ -116,7 +117,7 @@ class ReasoningTool(AbstractTool):
     def raw(self) -> Callable[..., Any]:
         return self._inner.raw
 
-    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+    def _inner_input(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
         if args and isinstance(args[0], dict):
             data = self._input_model(**args[0])
         else:
@@ -127,7 +128,7 @@ class ReasoningTool(AbstractTool):
         orig_model = self._inner.info.input_schema
         assert orig_model is not None
 
-        input_data = orig_model(
+        return orig_model(
             **{
                 k: v
                 for k, v in data.model_dump().items()
@@ -135,7 +136,13 @@ class ReasoningTool(AbstractTool):
             }
         )
 
-        return self._inner(input_data)
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._inner(self._inner_input(args, kwargs))
+
+    async def stream(
+        self, on_chunk: Callable[[Any], Awaitable[None]], *args: Any, **kwargs: Any
+    ) -> Any:
+        return await self._inner.stream(on_chunk, self._inner_input(args, kwargs))
 
     def clear_cache(self) -> None:
         return self._inner.clear_cache()
@@ -189,7 +196,7 @@ def reasoning_tool(
 
 
 @overload
-def register_reasoning_tool(fn: Callable[[T], Any]) -> ReasoningTool: ...
+def register_reasoning_tool(fn: Callable[[T], Any]) -> LazyTool: ...
 
 
 @overload
@@ -199,7 +206,7 @@ def register_reasoning_tool(
     use_cache: bool = False,
     cache_size: int = 128,
     hidden: bool = False,
-) -> Callable[[Callable[[T], Any]], ReasoningTool]: ...
+) -> Callable[[Callable[[T], Any]], LazyTool]: ...
 
 
 def register_reasoning_tool(
@@ -209,20 +216,18 @@ def register_reasoning_tool(
     use_cache: bool = False,
     cache_size: int = 128,
     hidden: bool = False,
-) -> ReasoningTool | Callable[[Callable[[T], Any]], ReasoningTool]:
-    def wrapper(f: Callable[[T], Any]) -> ReasoningTool:
-        name = ToolInfo.from_callable(f, use_cache=use_cache, cache_size=cache_size).name
-
+) -> LazyTool | Callable[[Callable[[T], Any]], LazyTool]:
+    def wrapper(f: Callable[[T], Any]) -> LazyTool:
         def factory() -> ReasoningTool:
             return ReasoningTool(
                 Tool(f, use_cache=use_cache, cache_size=cache_size),
                 reasoning_prompt=reasoning_prompt,
             )
 
-        GlobalToolCatalog().get_active_catalog().register(name, factory, hidden=hidden)
-        return ReasoningTool(
-            Tool(f, use_cache=use_cache, cache_size=cache_size),
-            reasoning_prompt=reasoning_prompt,
+        return (
+            GlobalToolCatalog()
+            .get_active_catalog()
+            .register(f.__name__, factory, hidden=hidden)
         )
 
     if fn is None:
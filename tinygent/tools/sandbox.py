@@ -0,0 +1,448 @@
+from __future__ import annotations
+
+import atexit
+from dataclasses import dataclass
+import json
+import logging
+import os
+from pathlib import Path
+import queue
+import secrets
+import select
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import Any
+from typing import Self
+
+from tinygent.core.runtime.executors import run_sync_in_executor
+from tinygent.tools.tool import Tool
+
+logger = logging.getLogger(__name__)
+
+_WORKER_SCRIPT = str(Path(__file__).with_name('_sandbox_worker.py'))
+
+# seconds a new worker may take to start and import its preloaded modules
+_STARTUP_TIMEOUT = 30.0
+
+# seconds between checks whether the pool was closed while waiting for a worker
+_ACQUIRE_POLL_INTERVAL = 0.5
+
+
+@dataclass(frozen=True)
+class SandboxLimits:
+    """Resource limits of sandboxed code, applied to every call."""
+
+    cpu_seconds: float | None = 10.0
+    """CPU time a call may use (None = unlimited).
+
+    This is a soft limit: code can raise it or ignore its signal, up to the
+    worker's hard limit of `cpu_seconds` times the pool's
+    `max_calls_per_worker`. `wall_seconds` still stops such a call.
+    """
+
+    wall_seconds: float = 30.0
+    """Time a call may take before its worker is killed."""
+
+    memory_bytes: int | None = 512 * 1024 * 1024
+    """Address space limit of a worker process (None = unlimited)."""
+
+    allow_network: bool = False
+    """Allow sockets. When disallowed, workers also get an empty network namespace where supported.
+
+    Disallowing the network blocks `ctypes` as well, since native code could open
+    sockets without passing the guard. Libraries using `ctypes` only work when
+    listed in the pool's `preload`, so they load their native functions before
+    the guard is installed; resolving new native functions later still fails.
+    """
+
+    allow_subprocess: bool = False
+    """Allow starting other processes, which could escape the other limits."""
+
+    max_output_chars: int = 20_000
+    """Characters of stdout and stderr returned per call, the rest is truncated."""
+
+
+@dataclass(frozen=True)
+class SandboxResult:
+    """Output of code run in the sandbox."""
+
+    stdout: str
+    stderr: str
+    error: str | None
+    duration: float
+    timed_out: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def to_string(self) -> str:
+        parts = []
+        if self.stdout:
+            parts.append(f'stdout:\n{self.stdout}')
+        if self.stderr:
+            parts.append(f'stderr:\n{self.stderr}')
+        if self.error:
+            parts.append(f'error:\n{self.error}')
+        return '\n'.join(parts) or 'The code finished without output.'
+
+
+class _WorkerCrashed(Exception):
+    pass
+
+
+class _SandboxWorker:
+    """One warm worker process with its own temporary directory."""
+
+    def __init__(
+        self, limits: SandboxLimits, preload: tuple[str, ...], max_calls: int
+    ) -> None:
+        self.calls = 0
+        self.workdir = tempfile.mkdtemp(prefix='tiny-sandbox-')
+        self._ready = False
+        self._closed = False
+        self._buffer = b''
+
+        config = {
+            'cpu_seconds': limits.cpu_seconds,
+            'max_calls': max_calls,
+            'memory_bytes': limits.memory_bytes,
+            'allow_network': limits.allow_network,
+            'allow_subprocess': limits.allow_subprocess,
+            'max_output_chars': limits.max_output_chars,
+            'preload': list(preload),
+        }
+
+        read_fd, write_fd = os.pipe()
+        try:
+            self.process = subprocess.Popen(
+                [
+                    sys.executable,
+                    '-I',
+                    _WORKER_SCRIPT,
+                    json.dumps(config),
+                    str(write_fd),
+                ],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                pass_fds=(write_fd,),
+                cwd=self.workdir,
+                env={
+                    'PATH': os.defpath,
+                    'HOME': self.workdir,
+                    'TMPDIR': self.workdir,
+                    'LANG': 'C.UTF-8',
+                },
+                start_new_session=True,
+            )
+        except BaseException:
+            os.close(read_fd)
+            shutil.rmtree(self.workdir, ignore_errors=True)
+            raise
+        finally:
+            os.close(write_fd)
+
+        self._responses = read_fd
+
+    def _read_line(self, deadline: float) -> bytes:
+        while b'\n' not in self._buffer:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError
+            readable, _, _ = select.select([self._responses], [], [], remaining)
+            if not readable:
+                raise TimeoutError
+
+            data = os.read(self._responses, 65536)
+            if not data:
+                raise _WorkerCrashed
+            self._buffer += data
+
+        line, self._buffer = self._buffer.split(b'\n', 1)
+        return line
+
+    def _read_message(self, deadline: float, request_id: str) -> dict[str, Any]:
+        # the executed code can write to the response pipe too, so only the
+        # response carrying the id of the request is trusted
+        while True:
+            try:
+                message = json.loads(self._read_line(deadline))
+            except ValueError:
+                continue
+            if isinstance(message, dict) and message.get('id') == request_id:
+                return message
+            logger.debug('Ignoring a sandbox response without the request id')
+
+    def execute(self, code: str, timeout: float) -> dict[str, Any]:
+        if not self._ready:
+            # no code ran in the worker yet, so the ready message is trusted
+            self._read_line(time.monotonic() + _STARTUP_TIMEOUT)
+            self._ready = True
+
+        self.calls += 1
+        request_id = secrets.token_hex(16)
+        assert self.process.stdin is not None
+        try:
+            self.process.stdin.write(
+                json.dumps({'id': request_id, 'code': code}).encode() + b'\n'
+            )
+            self.process.stdin.flush()
+        except OSError:
+            raise _WorkerCrashed from None
+
+        return self._read_message(time.monotonic() + timeout, request_id)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+
+        if self.process.poll() is None:
+            try:
+                os.killpg(self.process.pid, 9)
+            except OSError:
+                self.process.kill()
+        self.process.wait()
+        if self.process.stdin is not None:
+            self.process.stdin.close()
+        os.close(self._responses)
+        shutil.rmtree(self.workdir, ignore_errors=True)
+
+
+class TinySandboxPool:
+    """Pool of warm subprocess workers running untrusted Python code.
+
+    Each worker is a separate, isolated interpreter (`python -I`) without
+    the parent's environment variables, started ahead of time so calls do not
+    pay for interpreter startup. Every call runs in a fresh namespace and a
+    fresh temporary working directory, with limits on CPU time, wall time and
+    memory. By default, network access and starting processes are blocked,
+    using an empty network namespace where the system allows it and an audit
+    hook inside the worker.
+
+    Workers are recycled after `max_calls_per_worker` calls, and replaced
+    right away when they crash or time out, so state left behind by earlier
+    code does not pile up.
+
+    The sandbox limits what code can do by accident or casually. It is not a
+    security boundary like a container or a VM: for hostile code, run the
+    whole agent in one.
+
+    Args:
+        size: Number of worker processes (default: 2)
+        limits: Resource limits of every call (default: SandboxLimits())
+        max_calls_per_worker: Calls after which a worker is replaced (default: 50)
+        preload: Modules imported by workers at startup, so calls do not pay
+            for them (default: none)
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        *,
+        limits: SandboxLimits | None = None,
+        max_calls_per_worker: int = 50,
+        preload: list[str] | None = None,
+    ) -> None:
+        if os.name != 'posix':
+            raise RuntimeError('The tool sandbox is only supported on POSIX systems.')
+
+        self.size = size
+        self.limits = limits or SandboxLimits()
+        self.max_calls_per_worker = max_calls_per_worker
+        self.preload = tuple(preload or ())
+
+        self.calls = 0
+        self.recycled = 0
+        self.crashes = 0
+        self.timeouts = 0
+
+        self._closed = False
+        self._lock = threading.Lock()
+        self._workers: set[_SandboxWorker] = set()
+        # None is a free slot whose worker failed to start, filled on the next call
+        self._idle: queue.Queue[_SandboxWorker | None] = queue.Queue()
+        for _ in range(size):
+            self._idle.put(self._spawn())
+
+    def _spawn(self) -> _SandboxWorker:
+        worker = _SandboxWorker(self.limits, self.preload, self.max_calls_per_worker)
+        with self._lock:
+            closed = self._closed
+            if not closed:
+                self._workers.add(worker)
+        if closed:
+            worker.close()
+            raise RuntimeError('The sandbox pool is closed.')
+        return worker
+
+    def _acquire(self) -> _SandboxWorker:
+        while True:
+            if self._closed:
+                raise RuntimeError('The sandbox pool is closed.')
+            try:
+                worker = self._idle.get(timeout=_ACQUIRE_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+
+            if self._closed:
+                # pass the wake-up on to the next waiting call
+                self._idle.put(worker)
+                raise RuntimeError('The sandbox pool is closed.')
+            if worker is not None:
+                return worker
+
+            try:
+                return self._spawn()
+            except BaseException:
+                self._idle.put(None)
+                raise
+
+    def _release(self, worker: _SandboxWorker, replace: bool) -> None:
+        if self._closed:
+            worker.close()
+            return
+
+        if not replace and worker.calls < self.max_calls_per_worker:
+            self._idle.put(worker)
+            return
+
+        worker.close()
+        with self._lock:
+            self._workers.discard(worker)
+            self.recycled += 1
+
+        replacement: _SandboxWorker | None = None
+        try:
+            replacement = self._spawn()
+        except Exception:
+            # keep the slot, so waiting calls are not starved
+            logger.warning('Could not start a sandbox worker', exc_info=True)
+        self._idle.put(replacement)
+
+    def run(self, code: str, timeout: float | None = None) -> SandboxResult:
+        """Run the code in a worker and return its output, blocking until done.
+
+        Errors raised by the code, and exceeded limits, are reported in the
+        result instead of being raised.
+        """
+        if self._closed:
+            raise RuntimeError('The sandbox pool is closed.')
+
+        timeout = timeout if timeout is not None else self.limits.wall_seconds
+        worker = self._acquire()
+        with self._lock:
+            self.calls += 1
+
+        start = time.perf_counter()
+        replace = True
+        try:
+            response = worker.execute(code, timeout)
+            replace = False
+        except TimeoutError:
+            with self._lock:
+                self.timeouts += 1
+            return SandboxResult(
+                stdout='',
+                stderr='',
+                error=f'Time limit of {timeout:g} seconds exceeded',
+                duration=time.perf_counter() - start,
+                timed_out=True,
+            )
+        except _WorkerCrashed:
+            with self._lock:
+                self.crashes += 1
+            try:
+                exit_code: int | None = worker.process.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                exit_code = None
+            logger.warning('Sandbox worker crashed with exit code %s', exit_code)
+            return SandboxResult(
+                stdout='',
+                stderr='',
+                error=f'The sandbox worker crashed (exit code {exit_code})',
+                duration=time.perf_counter() - start,
+            )
+        finally:
+            self._release(worker, replace)
+
+        return SandboxResult(
+            stdout=response['stdout'],
+            stderr=response['stderr'],
+            error=response['error'],
+            duration=response['duration'],
+        )
+
+    async def arun(self, code: str, timeout: float | None = None) -> SandboxResult:
+        """Run the code in a worker without blocking the event loop."""
+        return await run_sync_in_executor(self.run, code, timeout)
+
+    def close(self) -> None:
+        """Stop all workers, calls running or waiting for a worker at the moment fail."""
+        with self._lock:
+            self._closed = True
+            workers, self._workers = self._workers, set()
+
+        for worker in workers:
+            worker.close()
+        # wake calls waiting for a worker, each passes it on to the next
+        self._idle.put(None)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get the number of calls, recycled workers, crashes and timeouts."""
+        return {
+            'calls': self.calls,
+            'recycled': self.recycled,
+            'crashes': self.crashes,
+            'timeouts': self.timeouts,
+        }
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+_default_pool: TinySandboxPool | None = None
+_default_pool_lock = threading.Lock()
+
+
+def get_default_sandbox_pool() -> TinySandboxPool:
+    """Return the process-wide sandbox pool with default limits, starting it if needed."""
+    global _default_pool
+
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = TinySandboxPool()
+            atexit.register(_default_pool.close)
+        return _default_pool
+
+
+def sandbox_tool(pool: TinySandboxPool | None = None) -> Tool[str]:
+    """Create a `run_python` tool executing code in the sandbox pool.
+
+    Args:
+        pool: Sandbox pool running the code (default: None = the process-wide
+            pool from `get_default_sandbox_pool`)
+    """
+
+    def run_python(code: str) -> str:
+        """Run Python code in an isolated sandbox and return its output.
+
+        Each call starts from a clean state with an empty working directory,
+        so define everything the code needs in the same call. Use print() to
+        return results. Network access is usually not available.
+
+        Args:
+            code: The Python source code to run
+        """
+        sandbox = pool or get_default_sandbox_pool()
+        return sandbox.run(code).to_string()
+
+    return Tool(run_python, execution='thread')
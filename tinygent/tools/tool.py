@@ -1,5 +1,10 @@
+from collections.abc import AsyncIterable
+import functools
+import hashlib
+import inspect
 from io import StringIO
 import logging
+from pathlib import Path
 from typing import Any
 from typing import Awaitable
 from typing import Callable
@@ -7,34 +12,181 @@ from typing import Coroutine
 from typing import Generic
 from typing import Iterable
 from typing import Literal
+from typing import NamedTuple
 from typing import TypeVar
 from typing import cast
 from typing import overload
 
+from pydantic import BaseModel
 from pydantic import Field
 
 from tinygent.core.datamodels.tool import AbstractTool
 from tinygent.core.datamodels.tool import AbstractToolConfig
+from tinygent.core.datamodels.tool_info import ToolExecutionMode
 from tinygent.core.datamodels.tool_info import ToolInfo
 from tinygent.core.runtime.executors import run_async_in_executor
+from tinygent.core.runtime.executors import run_sync_in_executor
+from tinygent.core.runtime.tool_cache import TinyToolCacheBackend
+from tinygent.core.runtime.tool_cache import get_shared_sqlite_backend
+from tinygent.core.runtime.tool_cache import tool_cache_key
 from tinygent.core.runtime.tool_catalog import GlobalToolCatalog
+from tinygent.core.runtime.tool_catalog import LazyTool
+from tinygent.core.runtime.tool_execution import call_in_tool_process
+from tinygent.core.runtime.tool_execution import check_process_callable
 from tinygent.utils.schema_validator import validate_schema
 
 logger = logging.getLogger(__name__)
 
 R = TypeVar('R')
 
+_END_OF_STREAM = object()
 
-class ToolConfig(AbstractToolConfig['Tool[R]'], Generic[R]):
-    """Configuration for simple tools."""
+
+class ToolConfig(AbstractToolConfig[AbstractTool], Generic[R]):
+    """Configuration for simple tools, built as lazy catalog descriptors."""
 
     type: Literal['simple'] = Field(default='simple', frozen=True)
 
-    def build(self) -> 'Tool[R]':
-        return cast(
-            'Tool[R]', GlobalToolCatalog().get_active_catalog().get_tool(self.name)
+    def build(self) -> AbstractTool:
+        return GlobalToolCatalog().get_active_catalog().get_lazy_tool(self.name)
+
+
+class PersistentCacheInfo(NamedTuple):
+    """Statistics of a tool's persistent cache, shaped like `lru_cache` info."""
+
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int | None
+
+
+def _code_version(fn: Callable[..., Any]) -> str:
+    # changing the tool's source invalidates its persistent cache entries
+    try:
+        code = inspect.getsource(fn).encode()
+    except (OSError, TypeError):
+        code = getattr(getattr(fn, '__code__', None), 'co_code', b'')
+    return hashlib.blake2b(code, digest_size=8).hexdigest()
+
+
+def _in_tool_process(fn: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(fn)
+    def call_in_process(*args: Any, **kwargs: Any) -> Any:
+        return call_in_tool_process(fn, args, kwargs)
+
+    return call_in_process
+
+
+def _tool_info(
+    fn: Callable[..., R],
+    use_cache: bool,
+    cache_size: int | None,
+    cache_backend: TinyToolCacheBackend | str | Path | None,
+    timeout: float | None,
+    execution: ToolExecutionMode,
+) -> ToolInfo[R]:
+    info = ToolInfo.from_callable(
+        fn,
+        use_cache=use_cache,
+        cache_size=cache_size,
+        timeout=timeout,
+        execution=execution,
+    )
+    if info.is_generator or info.is_async_generator:
+        info.use_cache = False
+    elif (
+        info.use_cache
+        and info.execution == 'inline'
+        and not info.is_coroutine
+        and cache_backend is not None
+        and getattr(cache_backend, 'blocking', True)
+    ):
+        # lookups in a blocking backend (e.g. SQLite) must not stall the event loop
+        info.execution = 'thread'
+    return info
+
+
+class _PersistentCachedFn:
+    """Tool function wrapper caching results in a persistent backend."""
+
+    def __init__(
+        self,
+        tool: 'Tool[Any]',
+        fn: Callable[..., Any],
+        backend: TinyToolCacheBackend,
+        version: str | None,
+        ttl: float | None,
+    ) -> None:
+        self._tool = tool
+        self._fn = fn
+        self._backend = backend
+        self._ttl = ttl
+
+        identity = f'{fn.__module__}.{fn.__qualname__}'
+        self._version = f'{identity}@{version or _code_version(fn)}'
+        # entries of one tool version share a prefix, so they can be cleared
+        self._prefix = (
+            hashlib.blake2b(self._version.encode(), digest_size=8).hexdigest() + ':'
         )
 
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
+        arguments: dict[str, Any]
+        if len(args) == 1 and not kwargs and isinstance(args[0], BaseModel):
+            arguments = args[0].model_dump(mode='json')
+        else:
+            arguments = {**{f'_{i}': a for i, a in enumerate(args)}, **kwargs}
+        return self._prefix + tool_cache_key(self._tool, arguments, self._version)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        key = self._key(args, kwargs)
+        if self._tool.info.is_coroutine:
+            return self._acall(key, args, kwargs)
+
+        found, value = self._backend.get(key)
+        if found:
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        value = self._fn(*args, **kwargs)
+        self._backend.set(key, value, self._ttl)
+        return value
+
+    async def _acall(
+        self, key: str, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> Any:
+        # blocking backends (e.g. SQLite) must not stall the event loop
+        blocking = self._backend.blocking
+        if blocking:
+            found, value = await run_sync_in_executor(self._backend.get, key)
+        else:
+            found, value = self._backend.get(key)
+        if found:
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        value = await self._fn(*args, **kwargs)
+        if blocking:
+            await run_sync_in_executor(self._backend.set, key, value, self._ttl)
+        else:
+            self._backend.set(key, value, self._ttl)
+        return value
+
+    def cache_clear(self) -> None:
+        self._backend.delete_prefix(self._prefix)
+        self.hits = self.misses = 0
+
+    def cache_info(self) -> PersistentCacheInfo:
+        try:
+            size: int | None = self._backend.count(self._prefix)
+        except NotImplementedError:
+            size = None
+        return PersistentCacheInfo(self.hits, self.misses, None, size)
+
 
 class Tool(AbstractTool, Generic[R]):
     """A simple tool wrapping a callable function for agent use.
@@ -52,10 +204,47 @@ class Tool(AbstractTool, Generic[R]):
     Caching is supported for regular and async functions (not generators).
     When enabled, results are memoized using LRU cache with configurable size.
 
+    Generator tools can be streamed with `stream`, which hands every yielded
+    chunk to a callback as it is produced (agents forward them to middleware
+    and stream consumers). `chunk_filter` declares which chunks are kept in the
+    final result; the others (e.g. progress updates) are only streamed.
+
+    With `cache_backend` set, results are cached persistently instead, so they
+    survive restarts and are shared by processes using the same database file.
+    Entries are keyed by the tool's identity (module, qualified name and
+    `cache_version`) and its canonical arguments; without `cache_version`, a
+    hash of the tool's source is used, so editing the tool invalidates its
+    entries. Size limits and eviction are handled by the backend. Results must
+    be picklable. Agents run "inline" sync tools cached in a blocking backend
+    (e.g. SQLite) as "thread" tools, so cache lookups do not stall the loop.
+
+    `execution` declares where agents run a sync tool. "inline" tools run
+    directly in the event loop, which suits quick tools. "thread" tools run in
+    the default executor, which suits blocking I/O. "process" tools run in a
+    warm process pool shared by all tools (see `configure_tool_process_pool`),
+    so CPU-bound work runs in parallel and does not hold the GIL of the agent
+    process. Their arguments and results are pickled and size-limited, and
+    the function must be defined at module level so workers can import it.
+    Caching still happens in the calling process.
+
     Args:
         fn: The callable function to wrap (sync/async, regular/generator)
         use_cache: Enable LRU caching of results (default: False)
         cache_size: Maximum cache size if caching enabled (default: None)
+        cache_backend: Persistent cache backend, or a path to a SQLite cache
+            file shared in the process with its current size limits; use
+            `get_shared_sqlite_backend(path, max_entries=..., max_bytes=...)`
+            for other limits (default: None = in-process LRU)
+        cache_version: Version of the tool's behaviour for persistent caching
+            (default: None = hash of the source)
+        cache_ttl: Seconds a persistently cached result stays valid
+            (default: None = never expires)
+        chunk_filter: Returns whether a yielded chunk is kept in the result
+            of a generator tool (default: None = keep all chunks)
+        timeout: Seconds an agent waits for the tool before cancelling the
+            call (default: None = the agent's `tool_timeout`)
+        execution: Where agents run the sync tool, "inline", "thread" or
+            "process" (default: "inline")
     """
 
     def __init__(
@@ -63,17 +252,43 @@ class Tool(AbstractTool, Generic[R]):
         fn: Callable[..., R],
         use_cache: bool = False,
         cache_size: int | None = None,
+        cache_backend: TinyToolCacheBackend | str | Path | None = None,
+        cache_version: str | None = None,
+        cache_ttl: float | None = None,
+        chunk_filter: Callable[[Any], bool] | None = None,
+        timeout: float | None = None,
+        execution: ToolExecutionMode = 'inline',
     ) -> None:
         self.__original_fn = fn
+        self._chunk_filter = chunk_filter
 
         self._cached_fn: Callable[..., Any] | Callable[..., Awaitable[Any]] | None = None
-        self._info: ToolInfo[R] = ToolInfo.from_callable(
-            fn, use_cache=use_cache, cache_size=cache_size
+        self._info: ToolInfo[R] = _tool_info(
+            fn,
+            use_cache=use_cache,
+            cache_size=cache_size,
+            cache_backend=cache_backend,
+            timeout=timeout,
+            execution=execution,
         )
 
+        call_fn: Callable[..., Any] = fn
+        if execution != 'inline':
+            if self.info.is_coroutine or self.info.is_async_generator:
+                raise ValueError(
+                    f"Execution mode '{execution}' is only supported for sync tools."
+                )
+
+            if execution == 'process':
+                if self.info.is_generator:
+                    raise ValueError(
+                        'Process execution is not supported for generator tools.'
+                    )
+                check_process_callable(fn)
+                call_fn = _in_tool_process(fn)
+
         if self.info.is_generator or self.info.is_async_generator:
             use_cache = False
-            self.info.use_cache = False
 
         if use_cache:
             if not self.info.is_cachable:
@@ -82,7 +297,14 @@ class Tool(AbstractTool, Generic[R]):
                 )
 
             cache_size = cache_size or 128
-            if self.info.is_coroutine:
+            if cache_backend is not None:
+                if not isinstance(cache_backend, TinyToolCacheBackend):
+                    cache_backend = get_shared_sqlite_backend(cache_backend)
+
+                self._cached_fn = _PersistentCachedFn(
+                    self, call_fn, cache_backend, cache_version, cache_ttl
+                )
+            elif self.info.is_coroutine:
                 from async_lru import alru_cache
 
                 async_fn = cast(Callable[..., Coroutine[Any, Any, Any]], fn)
@@ -90,9 +312,9 @@ class Tool(AbstractTool, Generic[R]):
             else:
                 from functools import lru_cache
 
-                self._cached_fn = lru_cache(maxsize=cache_size)(fn)
+                self._cached_fn = lru_cache(maxsize=cache_size)(call_fn)
 
-        self._fn = self._cached_fn or self.__original_fn
+        self._fn = self._cached_fn or call_fn
 
     @property
     def raw(self) -> Callable[..., R]:
@@ -120,10 +342,53 @@ class Tool(AbstractTool, Generic[R]):
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
         return self._run(*args, **kwargs)
 
-    def _run(self, *args: Any, **kwargs: Any) -> Any:
+    async def stream(
+        self, on_chunk: Callable[[Any], Awaitable[None]], *args: Any, **kwargs: Any
+    ) -> Any:
+        if self.info.is_coroutine:
+            # awaited in the calling task, so the call can be cancelled
+            parsed_args, kwargs = self._parse_arguments(args, kwargs)
+            return await self._fn(*parsed_args, **kwargs)  # type: ignore[misc]
+
+        if not (self.info.is_generator or self.info.is_async_generator):
+            if self.info.execution != 'inline':
+                return await run_sync_in_executor(self._run, *args, **kwargs)
+            return self._run(*args, **kwargs)
+
+        parsed_args, kwargs = self._parse_arguments(args, kwargs)
+        result: list[Any] = []
+
+        if self.info.is_async_generator:
+            chunks = cast(AsyncIterable[Any], self._fn(*parsed_args, **kwargs))
+            async for chunk in chunks:
+                await on_chunk(chunk)
+                if self._keep_chunk(chunk):
+                    result.append(chunk)
+        else:
+            # sync generators are advanced in the executor to keep the loop free
+            iterator = iter(cast(Iterable[Any], self._fn(*parsed_args, **kwargs)))
+            while (
+                chunk := await run_sync_in_executor(next, iterator, _END_OF_STREAM)
+            ) is not _END_OF_STREAM:
+                await on_chunk(chunk)
+                if self._keep_chunk(chunk):
+                    result.append(chunk)
+
+        return result
+
+    def _keep_chunk(self, chunk: Any) -> bool:
+        return self._chunk_filter is None or self._chunk_filter(chunk)
+
+    def _parse_arguments(
+        self, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> tuple[list[Any], dict[str, Any]]:
         parsed_args: list[Any] = list(args)
 
-        if self.info.input_schema is not None:
+        if self._info.uses_auto_schema and not parsed_args and kwargs:
+            # fast path for keyword calls of plain functions (how agents call tools)
+            kwargs = self._info.validate_arguments(kwargs)
+
+        elif self.info.input_schema is not None:
             input_model_cls = self.info.input_schema
 
             if parsed_args and isinstance(parsed_args[0], dict):
@@ -148,13 +413,18 @@ class Tool(AbstractTool, Generic[R]):
             parsed_args,
             kwargs,
         )
+        return parsed_args, kwargs
+
+    def _run(self, *args: Any, **kwargs: Any) -> Any:
+        parsed_args, kwargs = self._parse_arguments(args, kwargs)
 
         if self.info.is_async_generator:
 
             async def run_async_gen():
                 result = []
                 async for item in self._fn(*parsed_args, **kwargs):  # type: ignore[misc]
-                    result.append(item)
+                    if self._keep_chunk(item):
+                        result.append(item)
 
                 return result
 
@@ -170,7 +440,11 @@ class Tool(AbstractTool, Generic[R]):
         else:
             result = self._fn(*parsed_args, **kwargs)  # type: ignore[misc]
             if self.info.is_generator:
-                return list(cast(Iterable[Any], result))
+                return [
+                    item
+                    for item in cast(Iterable[Any], result)
+                    if self._keep_chunk(item)
+                ]
             else:
                 return result
 
@@ -190,7 +464,15 @@ def tool(fn: Callable[..., R]) -> Tool[R]: ...
 
 @overload
 def tool(
-    *, use_cache: bool = False, cache_size: int = 128
+    *,
+    use_cache: bool = False,
+    cache_size: int = 128,
+    cache_backend: TinyToolCacheBackend | str | Path | None = None,
+    cache_version: str | None = None,
+    cache_ttl: float | None = None,
+    chunk_filter: Callable[[Any], bool] | None = None,
+    timeout: float | None = None,
+    execution: ToolExecutionMode = 'inline',
 ) -> Callable[[Callable[..., R]], Tool[R]]: ...
 
 
@@ -199,9 +481,25 @@ def tool(
     *,
     use_cache: bool = False,
     cache_size: int = 128,
+    cache_backend: TinyToolCacheBackend | str | Path | None = None,
+    cache_version: str | None = None,
+    cache_ttl: float | None = None,
+    chunk_filter: Callable[[Any], bool] | None = None,
+    timeout: float | None = None,
+    execution: ToolExecutionMode = 'inline',
 ) -> Tool[R] | Callable[[Callable[..., R]], Tool[R]]:
     def wrapper(f: Callable[..., R]) -> Tool[R]:
-        tool_instance = Tool(f, use_cache=use_cache, cache_size=cache_size)
+        tool_instance = Tool(
+            f,
+            use_cache=use_cache,
+            cache_size=cache_size,
+            cache_backend=cache_backend,
+            cache_version=cache_version,
+            cache_ttl=cache_ttl,
+            chunk_filter=chunk_filter,
+            timeout=timeout,
+            execution=execution,
+        )
         return tool_instance
 
     if fn is None:
@@ -210,13 +508,22 @@ def tool(
 
 
 @overload
-def register_tool(fn: Callable[..., Any]) -> Tool[Any]: ...
+def register_tool(fn: Callable[..., Any]) -> LazyTool: ...
 
 
 @overload
 def register_tool(
-    *, use_cache: bool = False, cache_size: int = 128, hidden: bool = False
-) -> Callable[[Callable[..., Any]], Tool[Any]]: ...
+    *,
+    use_cache: bool = False,
+    cache_size: int = 128,
+    cache_backend: TinyToolCacheBackend | str | Path | None = None,
+    cache_version: str | None = None,
+    cache_ttl: float | None = None,
+    chunk_filter: Callable[[Any], bool] | None = None,
+    timeout: float | None = None,
+    execution: ToolExecutionMode = 'inline',
+    hidden: bool = False,
+) -> Callable[[Callable[..., Any]], LazyTool]: ...
 
 
 def register_tool(
@@ -224,16 +531,46 @@ def register_tool(
     *,
     use_cache: bool = False,
     cache_size: int = 128,
+    cache_backend: TinyToolCacheBackend | str | Path | None = None,
+    cache_version: str | None = None,
+    cache_ttl: float | None = None,
+    chunk_filter: Callable[[Any], bool] | None = None,
+    timeout: float | None = None,
+    execution: ToolExecutionMode = 'inline',
     hidden: bool = False,
-) -> Tool[Any] | Callable[[Callable[..., Any]], Tool[Any]]:
-    def wrapper(f: Callable[..., Any]) -> Tool[Any]:
-        name = ToolInfo.from_callable(f, use_cache=use_cache, cache_size=cache_size).name
-
+) -> LazyTool | Callable[[Callable[..., Any]], LazyTool]:
+    def wrapper(f: Callable[..., Any]) -> LazyTool:
         def factory() -> Tool[Any]:
-            return Tool(f, use_cache=use_cache, cache_size=cache_size)
-
-        GlobalToolCatalog().get_active_catalog().register(name, factory, hidden=hidden)
-        return Tool(f, use_cache=use_cache, cache_size=cache_size)
+            return Tool(
+                f,
+                use_cache=use_cache,
+                cache_size=cache_size,
+                cache_backend=cache_backend,
+                cache_version=cache_version,
+                cache_ttl=cache_ttl,
+                chunk_filter=chunk_filter,
+                timeout=timeout,
+                execution=execution,
+            )
+
+        return (
+            GlobalToolCatalog()
+            .get_active_catalog()
+            .register(
+                f.__name__,
+                factory,
+                hidden=hidden,
+                info=functools.partial(
+                    _tool_info,
+                    f,
+                    use_cache=use_cache,
+                    cache_size=cache_size,
+                    cache_backend=cache_backend,
+                    timeout=timeout,
+                    execution=execution,
+                ),
+            )
+        )
 
     if fn is None:
         return wrapper
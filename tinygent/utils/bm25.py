@@ -0,0 +1,54 @@
+from collections import Counter
+import math
+import re
+
+import numpy as np
+
+_CAMEL_CASE_RE = re.compile(r'(?<=[a-z0-9])(?=[A-Z])')
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase alphanumeric tokens, breaking camelCase words."""
+    return _TOKEN_RE.findall(_CAMEL_CASE_RE.sub(' ', text).lower())
+
+
+class BM25Index:
+    """Inverted BM25 index over tokenized documents.
+
+    Per-term weights are precomputed at build time, so scoring a query only
+    adds the weights of the query terms' posting lists.
+    """
+
+    def __init__(
+        self, documents: list[list[str]], k1: float = 1.5, b: float = 0.75
+    ) -> None:
+        self.size = len(documents)
+
+        doc_len = np.asarray([len(d) for d in documents], dtype=np.float32)
+        avg_len = float(doc_len.mean()) if self.size and doc_len.any() else 1.0
+        norm = k1 * (1 - b + b * doc_len / avg_len)
+
+        postings: dict[str, tuple[list[int], list[int]]] = {}
+        for i, doc in enumerate(documents):
+            for term, tf in Counter(doc).items():
+                ids, tfs = postings.setdefault(term, ([], []))
+                ids.append(i)
+                tfs.append(tf)
+
+        self.postings: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        for term, (ids, tfs) in postings.items():
+            idf = math.log(1 + (self.size - len(ids) + 0.5) / (len(ids) + 0.5))
+            ids_arr = np.asarray(ids, dtype=np.intp)
+            tf_arr = np.asarray(tfs, dtype=np.float32)
+            self.postings[term] = (
+                ids_arr,
+                idf * tf_arr * (k1 + 1) / (tf_arr + norm[ids_arr]),
+            )
+
+    def score(self, query: str) -> np.ndarray:
+        scores = np.zeros(self.size, dtype=np.float32)
+        for term in set(tokenize(query)):
+            if posting := self.postings.get(term):
+                scores[posting[0]] += posting[1]
+        return scores
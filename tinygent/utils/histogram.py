@@ -0,0 +1,94 @@
+import math
+import threading
+
+
+class LatencyHistogram:
+    """Thread-safe log-bucketed latency histogram in the spirit of HdrHistogram.
+
+    Values are counted in buckets whose width grows with the value, so every
+    recorded value is stored with a bounded relative error (`precision`) while
+    memory stays small and recording is O(1). Values below `min_value` are
+    counted in the lowest bucket.
+
+    Args:
+        precision: Maximum relative error of reported percentiles
+        min_value: Smallest distinguishable value in seconds
+    """
+
+    def __init__(self, precision: float = 0.01, min_value: float = 1e-6) -> None:
+        self.precision = precision
+        self.min_value = min_value
+
+        self._log_base = math.log1p(precision)
+        self._lock = threading.Lock()
+        self._buckets: dict[int, int] = {}
+
+        self.count: int = 0
+        self.total: float = 0.0
+        self.min: float = math.inf
+        self.max: float = 0.0
+
+    def _index(self, value: float) -> int:
+        if value <= self.min_value:
+            return 0
+        return int(math.log(value / self.min_value) / self._log_base) + 1
+
+    def _value(self, index: int) -> float:
+        # upper bound of the bucket, so percentiles are never underestimated
+        return self.min_value * math.exp(index * self._log_base)
+
+    def record(self, value: float) -> None:
+        """Record a single value."""
+        index = self._index(value)
+        with self._lock:
+            self._buckets[index] = self._buckets.get(index, 0) + 1
+            self.count += 1
+            self.total += value
+            self.min = min(self.min, value)
+            self.max = max(self.max, value)
+
+    def percentiles(self, *quantiles: float) -> list[float]:
+        """Return the values at the given quantiles (0-1)."""
+        with self._lock:
+            if not self.count:
+                return [0.0 for _ in quantiles]
+
+            items = sorted(self._buckets.items())
+            count, lo, hi = self.count, self.min, self.max
+
+        results = []
+        for q in quantiles:
+            target = max(math.ceil(q * count), 1)
+            seen = 0
+            for index, bucket_count in items:
+                seen += bucket_count
+                if seen >= target:
+                    results.append(min(max(self._value(index), lo), hi))
+                    break
+        return results
+
+    def snapshot(self) -> dict[str, float]:
+        """Return count, mean, min, max and the p50/p95/p99 latencies."""
+        p50, p95, p99 = self.percentiles(0.5, 0.95, 0.99)
+        with self._lock:
+            count, total = self.count, self.total
+            lo, hi = (self.min, self.max) if count else (0.0, 0.0)
+
+        return {
+            'count': count,
+            'mean': total / count if count else 0.0,
+            'min': lo,
+            'max': hi,
+            'p50': p50,
+            'p95': p95,
+            'p99': p99,
+        }
+
+    def reset(self) -> None:
+        """Remove all recorded values."""
+        with self._lock:
+            self._buckets.clear()
+            self.count = 0
+            self.total = 0.0
+            self.min = math.inf
+            self.max = 0.0
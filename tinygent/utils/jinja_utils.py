@@ -4,6 +4,8 @@ from jinja2 import BaseLoader
 from jinja2 import Environment
 from jinja2 import meta
 
+from tinygent.core.telemetry.phases import tiny_phase
+
 
 def validate_template(template_str: str, required_fields: set[str]) -> bool:
     env = Environment(loader=BaseLoader(), trim_blocks=True, lstrip_blocks=True)
@@ -12,6 +14,7 @@ def validate_template(template_str: str, required_fields: set[str]) -> bool:
     return required_fields.issubset(found_fields)
 
 
+@tiny_phase('prompt')
 def render_template(template_str: str, context: dict[str, Any]) -> str:
     env = Environment(loader=BaseLoader(), trim_blocks=True, lstrip_blocks=True)
     return env.from_string(template_str).render(**context)
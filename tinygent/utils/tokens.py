@@ -0,0 +1,7 @@
+def approx_token_count(text: str) -> int:
+    """Estimate the number of tokens of a text without a tokenizer.
+
+    Uses roughly four characters per token, which holds for English text and
+    JSON with common tokenizers.
+    """
+    return len(text) // 4